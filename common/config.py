@@ -39,6 +39,7 @@ class ETLConfig(BaseSettings):
     batch_size: int = Field(1000, description="Default batch size for bulk operations")
     retry_attempts: int = Field(3, description="Default number of retry attempts")
     retry_delay: int = Field(5, description="Delay between retries in seconds")
+    parallel_extract: bool = Field(True, description="Parse multiple import files in worker processes")
 
     # API settings
     api_timeout: int = Field(30, description="API request timeout in seconds")
@@ -12,36 +12,47 @@ Provides:
 import psycopg2
 from psycopg2 import pool, extras, OperationalError, InterfaceError
 from psycopg2.extensions import connection as PGConnection, cursor as PGCursor
+import atexit
 import os
-from typing import Optional, List, Dict, Any, Tuple
+import re
+import threading
+from typing import Optional, List, Dict, Any, Tuple, Iterable
 from contextlib import contextmanager
+from itertools import islice
 import time
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from common.config import get_config
 
 
-# Global connection pool
-_connection_pool: Optional[pool.SimpleConnectionPool] = None
+# Global connection pool, shared by every thread in the process
+_connection_pool: Optional[pool.ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
 
 
-def get_pool() -> pool.SimpleConnectionPool:
+def get_pool() -> pool.ThreadedConnectionPool:
     """
     Get or create the global connection pool.
 
+    The pool is created once per process and closed at interpreter exit,
+    so connections are reused across jobs run in the same process.
+
     Returns:
         Connection pool instance
     """
     global _connection_pool
 
     if _connection_pool is None:
-        config = get_config()
+        with _pool_lock:
+            if _connection_pool is None:
+                config = get_config()
 
-        _connection_pool = pool.SimpleConnectionPool(
-            minconn=1,
-            maxconn=config.database.pool_size,
-            dsn=config.database.db_url
-        )
+                _connection_pool = pool.ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=config.database.pool_size,
+                    dsn=config.database.db_url
+                )
+                atexit.register(close_pool)
 
     return _connection_pool
 
@@ -49,9 +60,10 @@ def get_pool() -> pool.SimpleConnectionPool:
 def close_pool():
     """Close all connections in the pool."""
     global _connection_pool
-    if _connection_pool is not None:
-        _connection_pool.closeall()
-        _connection_pool = None
+    with _pool_lock:
+        if _connection_pool is not None:
+            _connection_pool.closeall()
+            _connection_pool = None
 
 
 @retry(
@@ -197,16 +209,18 @@ def bulk_insert(
     table: str,
     columns: List[str],
     values: List[Tuple],
-    schema: str = "feeds"
+    schema: str = "feeds",
+    page_size: Optional[int] = None
 ) -> int:
     """
-    Perform bulk insert using COPY for performance.
+    Perform bulk insert using multi-row INSERT ... VALUES batches.
 
     Args:
         table: Table name
         columns: List of column names
         values: List of value tuples
         schema: Schema name (default: feeds)
+        page_size: Rows per INSERT statement (default: ETL_BATCH_SIZE)
 
     Returns:
         Number of rows inserted
@@ -214,22 +228,114 @@ def bulk_insert(
     if not values:
         return 0
 
-    with db_connection() as conn:
-        cursor = conn.cursor()
+    page_size = page_size or get_config().etl.batch_size
 
-        # Use execute_values for efficient bulk insert
-        insert_query = f"""
-            INSERT INTO {schema}.{table} ({', '.join(columns)})
-            VALUES %s
-        """
+    insert_query = f"""
+        INSERT INTO {schema}.{table} ({', '.join(columns)})
+        VALUES %s
+    """
 
-        extras.execute_values(cursor, insert_query, values, page_size=1000)
-        rows_inserted = cursor.rowcount
+    with db_transaction(dict_cursor=False) as cursor:
+        # execute_values sends page_size rows per statement: one parse/plan per page
+        extras.execute_values(cursor, insert_query, values, page_size=page_size)
 
-        conn.commit()
-        cursor.close()
+    # cursor.rowcount only reflects the last page, so count the input instead
+    return len(values)
+
+
+# COPY text format: backslash, tab, newline and carriage return must be escaped
+_COPY_SPECIAL_CHARS = re.compile(r'[\\\t\n\r]')
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+_COPY_NULL = '\\N'
+# Bytes psycopg2 pulls from the COPY stream per read (its default is 8 KiB)
+_COPY_READ_SIZE = 256 * 1024
+
+
+def _copy_field(value: Any) -> str:
+    """Render one value in PostgreSQL COPY text format."""
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES) if _COPY_SPECIAL_CHARS.search(value) else value
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex input; the backslash itself is escaped for COPY
+        return '\\\\x' + bytes(value).hex()
+    text = str(value)
+    return text.translate(_COPY_ESCAPES) if _COPY_SPECIAL_CHARS.search(text) else text
+
+
+class _CopyStream:
+    """
+    Read-only file-like object that renders row tuples for COPY FROM STDIN.
+
+    Rows are pulled from the iterable batch_size at a time, so the full
+    payload is never held in memory.
+    """
+
+    def __init__(self, rows: Iterable[Tuple], batch_size: int = 1000):
+        self._rows = iter(rows)
+        self._batch_size = batch_size
+        self._buffer = ''
+        self._pos = 0
+        self.row_count = 0
+
+    def _fill(self) -> bool:
+        """Render the next batch of rows into the buffer. Returns False when exhausted."""
+        batch = list(islice(self._rows, self._batch_size))
+        if not batch:
+            return False
+        self.row_count += len(batch)
+        self._buffer = ''.join(['\t'.join(map(_copy_field, row)) + '\n' for row in batch])
+        self._pos = 0
+        return True
+
+    def read(self, size: int = -1) -> str:
+        if size is None or size < 0:
+            chunks = [self._buffer[self._pos:]]
+            while self._fill():
+                chunks.append(self._buffer)
+            self._buffer, self._pos = '', 0
+            return ''.join(chunks)
+
+        if self._pos >= len(self._buffer) and not self._fill():
+            return ''
+        data = self._buffer[self._pos:self._pos + size]
+        self._pos += len(data)
+        return data
+
+
+def copy_insert(
+    table: str,
+    columns: List[str],
+    values: Iterable[Tuple],
+    schema: str = "feeds",
+    batch_size: Optional[int] = None
+) -> int:
+    """
+    Perform bulk insert using COPY FROM STDIN.
+
+    Rows are rendered in COPY text format and streamed to the server, so
+    values may be any iterable (e.g. a generator) and is consumed once.
+
+    Args:
+        table: Table name
+        columns: List of column names
+        values: Iterable of value tuples
+        schema: Schema name (default: feeds)
+        batch_size: Rows rendered per read buffer (default: ETL_BATCH_SIZE)
+
+    Returns:
+        Number of rows inserted
+    """
+    stream = _CopyStream(values, batch_size or get_config().etl.batch_size)
+    copy_sql = f"COPY {schema}.{table} ({', '.join(columns)}) FROM STDIN"
+
+    with db_transaction(dict_cursor=False) as cursor:
+        cursor.copy_expert(copy_sql, stream, size=_COPY_READ_SIZE)
 
-    return rows_inserted
+    return stream.row_count
 
 
 def fetch_dict(query: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
@@ -19,11 +19,13 @@ Environment variables:
 
 import os
 import base64
+import threading
 import email
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional
@@ -44,6 +46,49 @@ SCOPES = [
     'https://www.googleapis.com/auth/gmail.send'
 ]
 
+# Gmail accepts at most 100 calls per batch request
+BATCH_SIZE = 100
+
+
+def _parse_attachments(msg: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Collect attachment metadata from a full-format message resource."""
+    attachments = []
+
+    # Handle nested parts (for multipart emails)
+    def extract_attachments(parts_list):
+        for part in parts_list:
+            filename = part.get('filename', '')
+            if filename:
+                body = part.get('body', {})
+                attachments.append({
+                    'id': body.get('attachmentId', ''),
+                    'filename': filename,
+                    'mime_type': part.get('mimeType', ''),
+                    'size': body.get('size', 0)
+                })
+
+            # Check nested parts
+            nested_parts = part.get('parts', [])
+            if nested_parts:
+                extract_attachments(nested_parts)
+
+    extract_attachments(msg.get('payload', {}).get('parts', []))
+    return attachments
+
+
+def _parse_email_date(msg: Dict[str, Any]) -> Optional[datetime]:
+    """Parse the Date header of a message resource, or None if missing or invalid."""
+    try:
+        headers = {h['name']: h['value'] for h in msg.get('payload', {}).get('headers', [])}
+        date_str = headers.get('Date', '')
+        if date_str:
+            return parsedate_to_datetime(date_str)
+        return None
+
+    except Exception as e:
+        logger.warning(f"Failed to parse email date: {e}")
+        return None
+
 
 class GmailClient:
     """
@@ -91,6 +136,8 @@ class GmailClient:
             '/app/secrets/token.json'
         )
         self.service = None
+        self._credentials = None
+        self._thread_local = threading.local()
         self._label_cache: Dict[str, str] = {}  # name -> id mapping
         self._authenticate()
 
@@ -142,9 +189,26 @@ class GmailClient:
             with open(self.token_path, 'w') as token:
                 token.write(creds.to_json())
 
+        self._credentials = creds
         self.service = build('gmail', 'v1', credentials=creds)
         logger.info("Gmail API service initialized")
 
+    def _thread_service(self):
+        """
+        Get a Gmail service safe to use from the calling thread.
+
+        The underlying httplib2 connection is not thread-safe, so worker
+        threads each build their own service from the shared credentials.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self.service
+
+        service = getattr(self._thread_local, 'service', None)
+        if service is None:
+            service = build('gmail', 'v1', credentials=self._credentials, cache_discovery=False)
+            self._thread_local.service = service
+        return service
+
     def get_unread_emails(
         self,
         query: str = '',
@@ -202,10 +266,43 @@ class GmailClient:
             logger.error(f"Gmail API error fetching emails: {e}")
             raise
 
+    def list_unread_ids(self, query: str = '', max_results: int = 100) -> List[str]:
+        """
+        List IDs of unread emails matching optional query.
+
+        A single messages.list call; unlike get_unread_emails() no per-message
+        metadata is fetched.
+
+        Args:
+            query: Gmail search query (e.g., 'from:sender@example.com')
+            max_results: Maximum number of IDs to return
+
+        Returns:
+            List of Gmail message IDs
+        """
+        try:
+            full_query = 'is:unread'
+            if query:
+                full_query += f' {query}'
+
+            results = self.service.users().messages().list(
+                userId='me',
+                q=full_query,
+                maxResults=max_results
+            ).execute()
+
+            return [msg_ref['id'] for msg_ref in results.get('messages', [])]
+
+        except HttpError as e:
+            logger.error(f"Gmail API error listing emails: {e}")
+            raise
+
     def get_email_raw(self, message_id: str) -> bytes:
         """
         Get raw email content for saving as .eml file.
 
+        Safe to call from worker threads.
+
         Args:
             message_id: Gmail message ID
 
@@ -213,7 +310,7 @@ class GmailClient:
             Raw email bytes
         """
         try:
-            msg = self.service.users().messages().get(
+            msg = self._thread_service().users().messages().get(
                 userId='me',
                 id=message_id,
                 format='raw'
@@ -242,28 +339,7 @@ class GmailClient:
                 format='full'
             ).execute()
 
-            attachments = []
-            parts = msg.get('payload', {}).get('parts', [])
-
-            # Handle nested parts (for multipart emails)
-            def extract_attachments(parts_list):
-                for part in parts_list:
-                    filename = part.get('filename', '')
-                    if filename:
-                        body = part.get('body', {})
-                        attachments.append({
-                            'id': body.get('attachmentId', ''),
-                            'filename': filename,
-                            'mime_type': part.get('mimeType', ''),
-                            'size': body.get('size', 0)
-                        })
-
-                    # Check nested parts
-                    nested_parts = part.get('parts', [])
-                    if nested_parts:
-                        extract_attachments(nested_parts)
-
-            extract_attachments(parts)
+            attachments = _parse_attachments(msg)
 
             logger.debug(f"Found {len(attachments)} attachments in message {message_id}")
             return attachments
@@ -272,6 +348,49 @@ class GmailClient:
             logger.error(f"Gmail API error fetching attachments: {e}")
             raise
 
+    def get_message_details(self, message_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get attachments and sent dates for several emails in batched requests.
+
+        Equivalent to calling get_attachments() and get_email_date() for each
+        message, but fetches each message once and sends up to BATCH_SIZE
+        calls per HTTP round trip.
+
+        Args:
+            message_ids: Gmail message IDs
+
+        Returns:
+            Dict of message ID -> {'attachments': [...], 'date': datetime or None}
+        """
+        message_ids = list(dict.fromkeys(message_ids))  # batch request IDs must be unique
+        details: Dict[str, Dict[str, Any]] = {}
+        errors: List[Exception] = []
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                errors.append(exception)
+                return
+            details[request_id] = {
+                'attachments': _parse_attachments(response),
+                'date': _parse_email_date(response)
+            }
+
+        for start in range(0, len(message_ids), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for message_id in message_ids[start:start + BATCH_SIZE]:
+                batch.add(
+                    self.service.users().messages().get(userId='me', id=message_id, format='full'),
+                    request_id=message_id
+                )
+            batch.execute()
+
+        if errors:
+            logger.error(f"Gmail API error fetching message details: {errors[0]}")
+            raise errors[0]
+
+        logger.debug(f"Fetched details for {len(details)} messages")
+        return details
+
     def download_attachment(
         self,
         message_id: str,
@@ -282,6 +401,8 @@ class GmailClient:
         """
         Download an attachment to the specified directory.
 
+        Safe to call from worker threads.
+
         Args:
             message_id: Gmail message ID
             attachment_id: Attachment ID from get_attachments()
@@ -292,7 +413,7 @@ class GmailClient:
             Path to the downloaded file
         """
         try:
-            attachment = self.service.users().messages().attachments().get(
+            attachment = self._thread_service().users().messages().attachments().get(
                 userId='me',
                 messageId=message_id,
                 id=attachment_id
@@ -502,15 +623,7 @@ class GmailClient:
                 metadataHeaders=['Date']
             ).execute()
 
-            headers = {h['name']: h['value'] for h in msg.get('payload', {}).get('headers', [])}
-            date_str = headers.get('Date', '')
-
-            if date_str:
-                # Parse email date format
-                from email.utils import parsedate_to_datetime
-                return parsedate_to_datetime(date_str)
-
-            return None
+            return _parse_email_date(msg)
 
         except Exception as e:
             logger.warning(f"Failed to parse email date: {e}")
@@ -9,6 +9,7 @@ Provides foundation for all API integrations with:
 - Pagination support
 """
 
+import threading
 import time
 import requests
 from typing import Optional, Dict, Any, List
@@ -73,30 +74,33 @@ class BaseAPIClient(ABC):
         self.session = requests.Session()
         self.logger = get_logger(self.__class__.__name__)
 
-        # Rate limiting state
+        # Rate limiting state; the lock keeps the window consistent when one
+        # client is shared between threads
         self.request_times: List[float] = []
         self.rate_limit_window = 60  # seconds
+        self._rate_limit_lock = threading.Lock()
 
     def _enforce_rate_limit(self):
         """Enforce rate limiting by sleeping if necessary."""
-        now = time.time()
-
-        # Remove requests older than rate limit window
-        self.request_times = [
-            t for t in self.request_times
-            if now - t < self.rate_limit_window
-        ]
-
-        # If at rate limit, wait until oldest request expires
-        if len(self.request_times) >= self.rate_limit:
-            oldest = self.request_times[0]
-            sleep_time = self.rate_limit_window - (now - oldest)
-            if sleep_time > 0:
-                self.logger.debug(f"Rate limit reached, sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-                now = time.time()
-
-        self.request_times.append(now)
+        with self._rate_limit_lock:
+            now = time.time()
+
+            # Remove requests older than rate limit window
+            self.request_times = [
+                t for t in self.request_times
+                if now - t < self.rate_limit_window
+            ]
+
+            # If at rate limit, wait until oldest request expires
+            if len(self.request_times) >= self.rate_limit:
+                oldest = self.request_times[0]
+                sleep_time = self.rate_limit_window - (now - oldest)
+                if sleep_time > 0:
+                    self.logger.debug(f"Rate limit reached, sleeping {sleep_time:.2f}s")
+                    time.sleep(sleep_time)
+                    now = time.time()
+
+            self.request_times.append(now)
 
     @abstractmethod
     def get_headers(self) -> Dict[str, str]:
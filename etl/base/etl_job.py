@@ -77,6 +77,9 @@ class BaseETLJob(ABC):
 
         self.dataset_id: Optional[int] = None
         self.start_time: Optional[float] = None
+        # Wall-clock start of run(); jobs stamp audit/bookkeeping columns with it
+        # instead of calling datetime.now() per step or per record
+        self.run_started_at: Optional[datetime] = None
         self.logger = None
         self.config = get_config()
 
@@ -93,6 +96,7 @@ class BaseETLJob(ABC):
             True if successful, False otherwise
         """
         self.start_time = time.time()
+        self.run_started_at = datetime.now()
         processtype = self.__class__.__name__
 
         with ETLLogger(processtype, username=self.username, run_uuid=self.run_uuid) as logger:
@@ -7,12 +7,21 @@ parsing dates/numbers, and generating audit columns.
 
 import json
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import cache, lru_cache
 from pathlib import Path
 
 from common.db_utils import fetch_dict, db_transaction
 from common.logging_utils import get_logger
 
+# Optional fast JSON support
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger('import_utils')
 
 
@@ -28,30 +37,57 @@ def get_config_id(config_name: str) -> int:
     return rows[0]['config_id']
 
 
-def save_json(data: list, config_name: str, source: str) -> Path:
-    """Save JSON array to /app/data/source/{source}/{source}_{slug}_{timestamp}.json"""
+# Config name prefix stripped from each source's file slugs
+_SOURCE_PREFIXES = {
+    'newyorkfed': 'NewYorkFed_',
+    'bankofengland': 'BankOfEngland_',
+    'yfinance': 'YFinance_',
+    'coingecko': 'CoinGecko_',
+    'iiif': 'IIIF_',
+}
+
+
+@cache
+def _source_dir(source: str) -> Path:
+    """Return /app/data/source/{source}, creating it on first use in this process."""
     source_dir = Path(f"/app/data/source/{source}")
     source_dir.mkdir(parents=True, exist_ok=True)
+    return source_dir
 
-    # Derive slug from config_name: e.g. 'NewYorkFed_ReferenceRates_Latest' -> 'referencerates_latest'
-    prefix_map = {
-        'newyorkfed': 'NewYorkFed_',
-        'bankofengland': 'BankOfEngland_',
-        'yfinance': 'YFinance_',
-        'coingecko': 'CoinGecko_',
-        'iiif': 'IIIF_',
-    }
-    prefix = prefix_map.get(source, '')
-    slug = config_name.replace(prefix, '').lower()
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{source}_{slug}_{timestamp}.json"
-    filepath = source_dir / filename
+@cache
+def _json_slug(config_name: str, source: str) -> str:
+    """Derive the file slug, e.g. 'NewYorkFed_ReferenceRates_Latest' -> 'referencerates_latest'."""
+    return config_name.removeprefix(_SOURCE_PREFIXES.get(source, '')).lower()
 
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
 
-    logger.info(f"Saved {len(data)} records to {filepath}")
+def _json_path(config_name: str, source: str) -> Path:
+    """Return /app/data/source/{source}/{source}_{slug}_{timestamp}.json, creating the directory."""
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    filename = f"{source}_{_json_slug(config_name, source)}_{timestamp}.json"
+    return _source_dir(source) / filename
+
+
+def save_json(data: list, config_name: str, source: str) -> Path:
+    """Save JSON array to /app/data/source/{source}/{source}_{slug}_{timestamp}.json"""
+    return _write_saved_json(_json_path(config_name, source), _encode_json(data), len(data))
+
+
+def _encode_json(data) -> bytes:
+    """Encode data as indented JSON, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits or non-string keys; stdlib handles these
+            pass
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+
+def _write_saved_json(filepath: Path, payload: bytes, count: int) -> Path:
+    """Write an encoded JSON payload of count records."""
+    filepath.write_bytes(payload)
+    logger.info(f"Saved {count} records to {filepath}")
     return filepath
 
 
@@ -164,14 +200,37 @@ class JobRunLogger:
             logger.error(f"JobRunLogger._update_step failed: {e}")
 
 
-def run_generic_import(config_name: str, dry_run: bool = False, job_run_logger=None) -> int:
-    """Lookup config_id by name, run GenericImportJob. Returns 0 on success, 1 on failure."""
+def run_generic_import(config_name: str, dry_run: bool = False, job_run_logger=None,
+                       records: list | None = None, source: str | None = None) -> int:
+    """Lookup config_id by name, run GenericImportJob. Returns 0 on success, 1 on failure.
+
+    When records are given they are saved as with save_json(source=...), but the
+    file is written on a background thread while the job imports the records
+    directly instead of parsing the file back.
+    """
     from etl.jobs.generic_import import GenericImportJob, ConfigNotFoundError
 
     step_id = None
     if job_run_logger is not None:
         step_id = job_run_logger.begin_step('db_import', 'Database Import')
 
+    preloaded = None
+    pending_write = None
+    if records is not None:
+        try:
+            # Encode before the job starts: transform() updates the records in place
+            filepath = _json_path(config_name, source)
+            payload = _encode_json(records)
+            writer = ThreadPoolExecutor(max_workers=1)
+            pending_write = writer.submit(_write_saved_json, filepath, payload, len(records))
+            writer.shutdown(wait=False)
+            preloaded = (filepath, records)
+        except Exception as e:
+            logger.error(f"Failed to save records for {config_name}: {e}")
+            if job_run_logger is not None and step_id is not None:
+                job_run_logger.fail_step(step_id, str(e))
+            return 1
+
     try:
         config_id = get_config_id(config_name)
     except ValueError as e:
@@ -181,7 +240,12 @@ def run_generic_import(config_name: str, dry_run: bool = False, job_run_logger=N
         return 1
 
     try:
-        job = GenericImportJob(config_id=config_id, dry_run=dry_run)
+        job = GenericImportJob(
+            config_id=config_id,
+            dry_run=dry_run,
+            preloaded=preloaded,
+            pending_write=pending_write
+        )
     except ConfigNotFoundError as e:
         logger.error(f"Config not found: {e}")
         if job_run_logger is not None and step_id is not None:
@@ -222,11 +286,59 @@ def run_generic_import(config_name: str, dry_run: bool = False, job_run_logger=N
         return 1
 
 
-def parse_date(value: str) -> str | None:
-    """Parse YYYY-MM-DD to ISO date string, or None."""
+def run_api_import(job_name: str, config_name: str, fetch, transform=None, dry_run: bool = False,
+                   raw_data: list | None = None, source: str | None = None) -> int:
+    """Fetch (unless raw_data is given), transform, then import. Returns 0 on success, 1 on failure.
+
+    Shared body of the API job scripts: the fetch and transform run as the
+    'Data Collection' step, and the records are handed to run_generic_import().
+    Without a transform the fetched records are imported as they are.
+    """
+    with JobRunLogger(job_name, config_name, dry_run) as job_log:
+        step_id = job_log.begin_step('data_collection', 'Data Collection')
+        try:
+            if raw_data is None:
+                raw_data = fetch()
+            if not raw_data:
+                job_log.complete_step(step_id, records_in=0, records_out=0, message="No data from API")
+                return 0
+            if transform is None:
+                logger.info(f"Passthrough: {len(raw_data)} records (no transform)")
+                records = raw_data
+            else:
+                records = transform(raw_data)
+                if not records:
+                    job_log.complete_step(step_id, records_in=len(raw_data), records_out=0, message="No records after transform")
+                    return 0
+            job_log.complete_step(step_id, records_in=len(raw_data), records_out=len(records))
+        except Exception as e:
+            job_log.fail_step(step_id, str(e))
+            return 1
+
+        return run_generic_import(
+            config_name, dry_run, job_run_logger=job_log, records=records, source=source
+        )
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_date(value: str) -> date | None:
+    """Parse YYYY-MM-DD to a date, or None.
+
+    Cached: API payloads repeat the same handful of dates across records.
+    """
     if not value:
         return None
-    return datetime.strptime(value, '%Y-%m-%d').strftime('%Y-%m-%d')
+    if len(value) == 10 and value[4] == value[7] == '-':
+        # Zero-padded form: the C parser, still validating the date
+        return date.fromisoformat(value)
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value: str) -> str | None:
+    """Parse YYYY-MM-DD to ISO date string, or None."""
+    parsed = parse_iso_date(value)
+    return parsed.isoformat() if parsed else None
 
 
 def parse_numeric(value, strip_commas: bool = False) -> float | None:
@@ -243,6 +355,27 @@ def parse_numeric(value, strip_commas: bool = False) -> float | None:
         return None
 
 
+def transform_records(data: list, build, log, description: str) -> list:
+    """
+    Apply build() to every record, skipping records it fails on.
+
+    The batch is built in a single comprehension; only if some record fails
+    is it rebuilt record by record, logging and skipping the failures.
+    """
+    try:
+        return [build(record) for record in data]
+    except Exception:
+        pass
+
+    transformed = []
+    for record in data:
+        try:
+            transformed.append(build(record))
+        except Exception as e:
+            log.error(f"Failed to transform {description} record: {e}")
+    return transformed
+
+
 def audit_cols() -> dict:
     """Return {'created_date': ..., 'created_by': 'etl_user'}."""
     return {
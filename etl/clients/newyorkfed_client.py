@@ -16,10 +16,28 @@ Provides access to 40+ endpoints across 10 categories:
 API Documentation: https://markets.newyorkfed.org/static/docs/markets-api.html
 """
 
+import atexit
+import json
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from etl.base.api_client import BaseAPIClient
 
+# Optional fast JSON support
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# NY Fed responses use a bare * for suppressed values, which is not valid JSON
+_SUPPRESSED_VALUE = re.compile(rb':\s*\*\s*(?=[,}\]])')
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when available (both raise ValueError)."""
+    return orjson.loads(content) if HAS_ORJSON else json.loads(content)
+
 
 class NewYorkFedAPIClient(BaseAPIClient):
     """
@@ -76,9 +94,11 @@ class NewYorkFedAPIClient(BaseAPIClient):
     def get(self, endpoint: str, params=None):
         """Override get() to sanitize NY Fed responses that use bare * for suppressed values."""
         response = self._make_request('GET', endpoint, params=params)
-        text = re.sub(r':\s*\*\s*(?=[,}\]])', ': null', response.text)
-        import json
-        return json.loads(text)
+        # Parse the raw bytes: skips response.text's charset detection
+        content = response.content
+        if b'*' in content:
+            content = _SUPPRESSED_VALUE.sub(b': null', content)
+        return _loads(content)
 
     def fetch_endpoint(
         self,
@@ -358,3 +378,29 @@ class NewYorkFedAPIClient(BaseAPIClient):
             return [{'counterparty_name': name} for name in response]
 
         return []
+
+
+def get_shared_client(base_url: str = 'https://markets.newyorkfed.org') -> NewYorkFedAPIClient:
+    """
+    Get the process-wide client for base_url.
+
+    Jobs running in the same process share one session, so its keep-alive
+    connections to the API are reused instead of paying a new TCP/TLS
+    handshake per job. The session is closed at interpreter exit; callers
+    should not close() the shared client themselves.
+
+    Args:
+        base_url: Base URL for API (defaults to production URL)
+
+    Returns:
+        Shared NewYorkFedAPIClient instance
+    """
+    # Normalized so default and explicit URLs share one cache entry
+    return _shared_client(base_url.rstrip('/'))
+
+
+@lru_cache(maxsize=4)
+def _shared_client(base_url: str) -> NewYorkFedAPIClient:
+    client = NewYorkFedAPIClient(base_url=base_url)
+    atexit.register(client.close)
+    return client
@@ -21,21 +21,181 @@ Usage:
 import argparse
 import csv
 import json
+import logging
+import mmap
 import os
 import re
 import shutil
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from xml.etree import ElementTree
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+from lxml import etree
+
+from common.config import get_config
 from common.db_utils import db_connection, db_transaction, fetch_dict, bulk_insert
 from common.logging_utils import get_logger
 from etl.base.etl_job import BaseETLJob
 from etl.loaders.postgres_loader import PostgresLoader
 
+# Optional fast JSON support
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Read buffer for CSV files (bytes)
+_CSV_READ_BUFFER = 1024 * 1024
+
+# JSON files at least this large are decoded from a memory map
+_MMAP_MIN_BYTES = 1024 * 1024
+
+# Upper bound on extraction worker processes; beyond this, parsing gains are
+# outweighed by pickling records back to the parent and memory per worker
+_MAX_EXTRACT_WORKERS = 6
+
+# Per-file metadata keys that never go to the target table
+_METADATA_COLUMNS = frozenset({'source_file', 'metadata_label', 'file_date'})
+
+# Archive moves are rename/copy syscalls, so a few threads are enough to
+# overlap them (mainly matters when the archive is on another filesystem)
+_MAX_ARCHIVE_WORKERS = 4
+
+# Java-style date tokens and their strptime equivalents. The alternation is
+# ordered longest-first so 'yyyy' wins over 'yy'. Quoted literals ('T') are
+# matched first so letters inside them are never treated as tokens, and a
+# bare '%' is escaped so it stays literal for strptime.
+_JAVA_DATE_TOKENS = {
+    'yyyy': '%Y',
+    'yy': '%y',
+    'MM': '%m',
+    'dd': '%d',
+    'HH': '%H',
+    'mm': '%M',
+    'ss': '%S',
+    '%': '%%',
+}
+_JAVA_DATE_TOKEN_RE = re.compile("'[^']*'|" + '|'.join(_JAVA_DATE_TOKENS))
+
+
+def _java_date_token(match: re.Match) -> str:
+    """Map one matched Java token or quoted literal to its strptime form."""
+    token = match.group(0)
+    if token[0] == "'":
+        # '' is an escaped single quote; otherwise drop the quotes
+        return token[1:-1].replace('%', '%%') or "'"
+    return _JAVA_DATE_TOKENS[token]
+
+
+@lru_cache(maxsize=64)
+def _java_to_strptime(format_str: str) -> str:
+    """Convert a Java-style date format to strptime format in a single pass."""
+    return _JAVA_DATE_TOKEN_RE.sub(_java_date_token, format_str)
+
+
+# Maps every ASCII non-word character to '_' (same set as regex [^\w])
+_IDENTIFIER_TRANSLATION = str.maketrans({
+    chr(c): '_' for c in range(128)
+    if not (chr(c).isalnum() or chr(c) == '_')
+})
+_NON_WORD_RE = re.compile(r'[^\w]+')
+_UNDERSCORE_RUN_RE = re.compile(r'__+')
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_identifier(name: str) -> str:
+    """Sanitize a column name for SQL (memoized; the same headers repeat on every row)."""
+    lowered = name.lower()
+    if lowered.isascii():
+        sanitized = lowered.translate(_IDENTIFIER_TRANSLATION)
+    else:
+        # Unicode letters/digits count as word characters; let re decide
+        sanitized = _NON_WORD_RE.sub('_', lowered)
+    if '__' in sanitized:
+        sanitized = _UNDERSCORE_RUN_RE.sub('_', sanitized)
+    sanitized = sanitized.strip('_')
+    if sanitized[0].isdigit():
+        sanitized = 'col_' + sanitized
+    return sanitized
+
+
+@lru_cache(maxsize=256)
+def _parse_date_string(date_str: str, py_format: str) -> date:
+    """Parse a date string with a strptime format (memoized; files often share dates)."""
+    # Fast paths for the common fully-padded formats; anything else (e.g.
+    # unpadded '2026-1-5', which strptime accepts) goes through strptime
+    if py_format == '%Y-%m-%d' and len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        return date.fromisoformat(date_str)
+    if py_format == '%Y%m%d' and len(date_str) == 8 and date_str.isascii() and date_str.isdigit():
+        return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+    return datetime.strptime(date_str, py_format).date()
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize to a compact JSON string, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; stdlib handles these
+            pass
+    return json.dumps(value)
+
+
+_REGEX_META_CHARS = frozenset('.^$*+?{}[]()|\\')
+
+
+def _regex_literal_prefix(pattern: str) -> Tuple[str, bool]:
+    """
+    Return the literal text every re.match of pattern must start with.
+
+    The second value is True when the whole pattern is literal, in which
+    case re.match is exactly a startswith() test. Alternation anywhere makes
+    the prefix unknowable, so ('', False) is returned.
+    """
+    if '|' in pattern:
+        return '', False
+
+    prefix = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escaped = pattern[i + 1:i + 2]
+            if not escaped or escaped.isalnum():
+                # Class escapes (\d, \w, ...) and anchors are not literal
+                return ''.join(prefix), False
+            literal, step = escaped, 2
+        elif char in _REGEX_META_CHARS:
+            return ''.join(prefix), False
+        else:
+            literal, step = char, 1
+
+        following = pattern[i + step:i + step + 1]
+        if following in ('*', '?', '{'):
+            # Optional/repeated: this character may not be present
+            return ''.join(prefix), False
+        prefix.append(literal)
+        if following == '+':
+            return ''.join(prefix), False
+        i += step
+
+    return ''.join(prefix), True
+
+
+def _parse_part_index(location: Optional[str]) -> Optional[int]:
+    """Parse a filename-part location ('2') into an index, or None if not numeric."""
+    try:
+        return int(location)
+    except (TypeError, ValueError):
+        return None
+
 
 @dataclass
 class ImportConfig:
@@ -58,6 +218,23 @@ class ImportConfig:
     importstrategyid: int
     is_active: bool
     is_blob: bool
+    # Filename part indexes parsed once from the *_location strings
+    label_part_index: Optional[int] = field(init=False, default=None, repr=False)
+    date_part_index: Optional[int] = field(init=False, default=None, repr=False)
+    # target_table split once into schema and table (schema defaults to feeds)
+    target_schema: str = field(init=False, default='feeds', repr=False)
+    target_table_name: str = field(init=False, default='', repr=False)
+
+    def __post_init__(self):
+        self.label_part_index = _parse_part_index(self.metadata_label_location)
+        self.date_part_index = _parse_part_index(self.datelocation)
+        schema, dot, table = self.target_table.partition('.')
+        if dot:
+            self.target_schema = schema
+            self.target_table_name = table.partition('.')[0]
+        else:
+            self.target_schema = 'feeds'
+            self.target_table_name = self.target_table
 
 
 @dataclass
@@ -94,12 +271,12 @@ class CSVExtractor(FileExtractor):
         self.delimiter = delimiter if delimiter else ','
 
     def extract(self, file_path: Path) -> List[Dict[str, Any]]:
-        records = []
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f, delimiter=self.delimiter)
-            for row in reader:
-                records.append(dict(row))
-        return records
+        # newline='' hands raw line endings to the csv module (which does its own
+        # splitting) instead of translating them first; a large buffer cuts
+        # read/decode calls on big files
+        with open(file_path, 'r', encoding='utf-8-sig', newline='', buffering=_CSV_READ_BUFFER) as f:
+            # DictReader rows are already plain dicts; keep them without copying
+            return list(csv.DictReader(f, delimiter=self.delimiter))
 
 
 class ExcelExtractor(FileExtractor):
@@ -110,30 +287,31 @@ class ExcelExtractor(FileExtractor):
 
     def extract(self, file_path: Path) -> List[Dict[str, Any]]:
         if self.file_type == 'XLSX':
-            return self._extract_xlsx(file_path)
+            return list(self._iter_xlsx(file_path))
         else:
             return self._extract_xls(file_path)
 
-    def _extract_xlsx(self, file_path: Path) -> List[Dict[str, Any]]:
+    def _iter_xlsx(self, file_path: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Stream rows from a read-only workbook.
+
+        Rows are pulled lazily from iter_rows() so only the current row is
+        materialized; the workbook is closed when iteration ends.
+        """
         from openpyxl import load_workbook
         wb = load_workbook(file_path, read_only=True, data_only=True)
-        ws = wb.active
-
-        rows = list(ws.iter_rows(values_only=True))
-        if not rows:
-            return []
-
-        headers = [str(h).strip() if h else f'column_{i}' for i, h in enumerate(rows[0])]
-        records = []
-        for row in rows[1:]:
-            record = {}
-            for i, value in enumerate(row):
-                if i < len(headers):
-                    record[headers[i]] = value
-            records.append(record)
-
-        wb.close()
-        return records
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header_row = next(rows, None)
+            if header_row is None:
+                return
+
+            headers = [str(h).strip() if h else f'column_{i}' for i, h in enumerate(header_row)]
+            # zip() stops at the shorter side, so cells beyond the header row are dropped
+            for row in rows:
+                yield dict(zip(headers, row))
+        finally:
+            wb.close()
 
     def _extract_xls(self, file_path: Path) -> List[Dict[str, Any]]:
         import xlrd
@@ -144,13 +322,7 @@ class ExcelExtractor(FileExtractor):
             return []
 
         headers = [str(ws.cell_value(0, i)).strip() or f'column_{i}' for i in range(ws.ncols)]
-        records = []
-        for row_idx in range(1, ws.nrows):
-            record = {}
-            for col_idx in range(ws.ncols):
-                value = ws.cell_value(row_idx, col_idx)
-                record[headers[col_idx]] = value
-            records.append(record)
+        records = [dict(zip(headers, ws.row_values(row_idx))) for row_idx in range(1, ws.nrows)]
 
         return records
 
@@ -162,19 +334,40 @@ class JSONExtractor(FileExtractor):
         self.is_blob = is_blob
 
     def extract(self, file_path: Path) -> List[Dict[str, Any]]:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # Empty files cannot be mapped; they fail below as invalid JSON
+            if size and size >= _MMAP_MIN_BYTES:
+                # Decode straight from the page cache rather than a bytes copy
+                # of the whole file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                        memoryview(mapped) as view:
+                    data = self._loads(view)
+            else:
+                data = self._loads(f.read())
 
         # Blob mode: always wrap entire content
         if self.is_blob:
-            json_str = json.dumps(data) if not isinstance(data, str) else data
+            json_str = _json_dumps(data) if not isinstance(data, str) else data
             return [{'raw_data': json_str, 'source_file': file_path.name}]
 
         # Relational mode: arrays as-is, objects wrapped
         if isinstance(data, list):
             return data
         else:
-            return [{'raw_data': json.dumps(data), 'source_file': file_path.name}]
+            return [{'raw_data': _json_dumps(data), 'source_file': file_path.name}]
+
+    @staticmethod
+    def _loads(raw: bytes | memoryview) -> Any:
+        """Decode JSON bytes, using orjson when available."""
+        if HAS_ORJSON:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson is strict RFC 8259; retry with stdlib, which also
+                # accepts NaN/Infinity literals
+                pass
+        return json.loads(str(raw, 'utf-8'))
 
 
 class XMLExtractor(FileExtractor):
@@ -184,56 +377,108 @@ class XMLExtractor(FileExtractor):
         self.is_blob = is_blob
 
     def extract(self, file_path: Path) -> List[Dict[str, Any]]:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         # Blob mode: skip parsing
         if self.is_blob:
-            return [{'raw_data': content, 'source_file': file_path.name}]
+            return [self._blob_record(file_path)]
 
         # Relational mode: try parsing
         try:
-            root = ElementTree.fromstring(content)
-            records = self._parse_element(root)
+            records = list(self._iter_parse(file_path))
             if records:
                 return records
-        except ElementTree.ParseError:
+        except etree.XMLSyntaxError:
             pass
 
         # Fallback to blob
-        return [{'raw_data': content, 'source_file': file_path.name}]
-
-    def _parse_element(self, element) -> List[Dict[str, Any]]:
-        """Try to parse XML element into records."""
-        records = []
-        for child in element:
-            record = {}
-            for subchild in child:
-                record[subchild.tag] = subchild.text
+        return [self._blob_record(file_path)]
+
+    def _blob_record(self, file_path: Path) -> Dict[str, Any]:
+        """Wrap the whole file as a single raw_data record."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return {'raw_data': content, 'source_file': file_path.name}
+
+    def _iter_parse(self, file_path: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Stream-parse children of the root element into records.
+
+        Uses lxml iterparse so only the record currently being read is held
+        as a tree; each record element is cleared and detached from the root
+        once converted, keeping memory flat for large files.
+        """
+        depth = 0
+        for event, element in etree.iterparse(str(file_path), events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+
+            # Skip comments and processing instructions (non-string tags)
+            record = {
+                child.tag: child.text
+                for child in element
+                if isinstance(child.tag, str)
+            }
             if record:
-                records.append(record)
-        return records
+                yield record
+
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+def _extract_file(extractor: FileExtractor, file_path: Path) -> List[Dict[str, Any]]:
+    """Run an extractor on one file (module-level so worker processes can pickle it)."""
+    return extractor.extract(file_path)
 
 
 class SchemaManager:
-    """Manages dynamic table schema changes."""
+    """
+    Manages dynamic table schema changes.
+
+    Column lists read from information_schema are cached per (schema, table)
+    for the lifetime of the manager. The only schema changes made during a
+    job are our own, so add_columns() updates the cache in place and
+    create_table_from_records() records the columns it created. The cache is
+    per manager (per job); call invalidate() after any DDL made elsewhere.
+    """
 
     def __init__(self, logger=None):
         self.logger = logger or get_logger(self.__class__.__name__)
+        self._columns_cache: Dict[Tuple[str, str], List[str]] = {}
 
     def get_table_columns(self, schema: str, table: str) -> List[str]:
         """Get existing column names for a table."""
-        query = """
-            SELECT column_name
-            FROM information_schema.columns
-            WHERE table_schema = %s AND table_name = %s
-            ORDER BY ordinal_position
+        key = (schema, table)
+        if key not in self._columns_cache:
+            query = """
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = %s AND table_name = %s
+                ORDER BY ordinal_position
+            """
+            results = fetch_dict(query, (schema, table))
+            self._columns_cache[key] = [row['column_name'] for row in results]
+        return list(self._columns_cache[key])
+
+    def invalidate(self, schema: Optional[str] = None, table: Optional[str] = None):
         """
-        results = fetch_dict(query, (schema, table))
-        return [row['column_name'] for row in results]
+        Drop cached column lists.
+
+        With schema and table, drops just that table's entry; with neither,
+        clears the whole cache.
+        """
+        if schema is None and table is None:
+            self._columns_cache.clear()
+        else:
+            self._columns_cache.pop((schema, table), None)
 
     def table_exists(self, schema: str, table: str) -> bool:
         """Check if table exists."""
+        if self._columns_cache.get((schema, table)):
+            return True
         query = """
             SELECT EXISTS (
                 SELECT 1 FROM information_schema.tables
@@ -245,43 +490,68 @@ class SchemaManager:
 
     def add_column(self, schema: str, table: str, column_name: str, column_type: str = 'TEXT'):
         """Add a new column to the table."""
-        safe_column = self._sanitize_identifier(column_name)
+        self.add_columns(schema, table, [column_name], column_type)
+
+    def add_columns(
+        self,
+        schema: str,
+        table: str,
+        column_names: List[str],
+        column_type: str = 'TEXT',
+        column_types: Optional[Dict[str, str]] = None
+    ):
+        """
+        Add several new columns to the table in a single ALTER TABLE statement.
+
+        One statement takes the ACCESS EXCLUSIVE lock and rewrites the catalog
+        once, instead of once per column. column_types maps individual column
+        names to a type; columns not in it get column_type.
+        """
+        column_types = column_types or {}
+        safe_columns = [self._sanitize_identifier(name) for name in column_names]
+        if not safe_columns:
+            return
+        clauses = ', '.join(
+            f'ADD COLUMN IF NOT EXISTS "{col}" {column_types.get(name, column_type)}'
+            for name, col in zip(column_names, safe_columns)
+        )
         with db_transaction() as cursor:
-            cursor.execute(f'ALTER TABLE {schema}.{table} ADD COLUMN IF NOT EXISTS "{safe_column}" {column_type}')
-        self.logger.info(f"Added column '{safe_column}' to {schema}.{table}")
+            cursor.execute(f'ALTER TABLE {schema}.{table} {clauses}')
+
+        cached = self._columns_cache.get((schema, table))
+        if cached is not None:
+            cached.extend(col for col in safe_columns if col not in cached)
+        self.logger.info(f"Added column(s) {safe_columns} to {schema}.{table}")
 
     def _sanitize_identifier(self, name: str) -> str:
         """Sanitize column name for SQL."""
-        sanitized = re.sub(r'[^\w]', '_', name.lower())
-        sanitized = re.sub(r'_+', '_', sanitized)
-        sanitized = sanitized.strip('_')
-        if sanitized[0].isdigit():
-            sanitized = 'col_' + sanitized
-        return sanitized
+        return _sanitize_identifier(name)
 
     def _infer_column_type(self, values: List[Any]) -> str:
         """
         Infer PostgreSQL column type from sample values.
 
-        Analyzes multiple values to determine the most appropriate type.
-        Returns TEXT as fallback for mixed or unknown types.
+        Analyzes multiple values in a single pass to determine the most
+        appropriate type. Returns TEXT as fallback for mixed or unknown types.
         """
-        # Filter out None values
-        non_null_values = [v for v in values if v is not None and v != '']
-
-        if not non_null_values:
-            return 'TEXT'
-
         # Track type observations
+        has_value = False
         has_int = False
-        has_float = False
         has_bool = False
+        max_int = 0
         max_length = 0
 
-        for value in non_null_values:
-            # Convert to string to check actual value
-            str_value = str(value).strip()
-            max_length = max(max_length, len(str_value))
+        for value in values:
+            # Skip None and empty values
+            if value is None or value == '':
+                continue
+            has_value = True
+
+            # Convert to string once to check actual value
+            raw_value = str(value)
+            str_value = raw_value.strip()
+            if len(str_value) > max_length:
+                max_length = len(str_value)
 
             # Check for boolean
             if isinstance(value, bool) or str_value.lower() in ('true', 'false', 't', 'f'):
@@ -294,25 +564,30 @@ class SchemaManager:
                     num_value = value
                 else:
                     num_value = float(str_value)
-
-                # Check if it's actually an integer
-                if isinstance(value, int) or (isinstance(num_value, float) and num_value.is_integer()):
-                    has_int = True
-                else:
-                    has_float = True
             except (ValueError, TypeError):
                 # Not a number, will default to text
-                pass
+                continue
+
+            # Check if it's actually an integer
+            if isinstance(value, int) or num_value.is_integer():
+                has_int = True
+                # Track magnitude of plain integer literals for BIGINT detection
+                if raw_value.lstrip('-').isdigit():
+                    magnitude = abs(int(raw_value))
+                    if magnitude > max_int:
+                        max_int = magnitude
+            else:
+                # Any fractional value makes the column numeric
+                return 'NUMERIC(12,2)'
+
+        if not has_value:
+            return 'TEXT'
 
         # Determine best type based on observations
-        if has_bool and not has_int and not has_float:
+        if has_bool and not has_int:
             return 'BOOLEAN'
-        elif has_float:
-            return 'NUMERIC(12,2)'
         elif has_int:
-            # Check max value to determine if we need BIGINT
-            max_val = max([abs(int(v)) for v in non_null_values if str(v).lstrip('-').isdigit()], default=0)
-            if max_val > 2147483647:  # Max INT value
+            if max_int > 2147483647:  # Max INT value
                 return 'BIGINT'
             return 'INTEGER'
         else:
@@ -353,6 +628,8 @@ class SchemaManager:
         if not sample_records:
             raise ImportValidationError("Cannot create table from empty record set")
 
+        self.invalidate(schema, table)
+
         # Analyze first N records
         samples_to_analyze = sample_records[:max_samples]
 
@@ -374,17 +651,22 @@ class SchemaManager:
             # Detect JSONB
             if isinstance(raw_value, str) and raw_value.strip().startswith(('{', '[')):
                 try:
-                    json.loads(raw_value)
+                    if HAS_ORJSON:
+                        orjson.loads(raw_value)
+                    else:
+                        json.loads(raw_value)
                     blob_type = 'JSONB'
                 except json.JSONDecodeError:
+                    # orjson.JSONDecodeError subclasses this
                     pass
 
             # Detect XML
             if blob_type == 'TEXT' and isinstance(raw_value, str) and raw_value.strip().startswith('<?xml'):
                 try:
-                    ElementTree.fromstring(raw_value)
+                    # Parse bytes: lxml rejects str input that carries an encoding declaration
+                    etree.fromstring(raw_value.encode('utf-8'))
                     blob_type = 'XML'
-                except ElementTree.ParseError:
+                except etree.XMLSyntaxError:
                     pass
 
             # Create blob table
@@ -401,6 +683,10 @@ CREATE TABLE {schema}.{table} (
 """
             with db_transaction() as cursor:
                 cursor.execute(create_sql)
+            # Unquoted identifiers are folded to lower case, as information_schema reports them
+            self._columns_cache[(schema, table)] = [
+                pk_column.lower(), 'datasetid', 'raw_data', 'source_file', 'created_date', 'created_by'
+            ]
 
             self.logger.info(f"Created blob table {schema}.{table} with raw_data type {blob_type}")
 
@@ -431,10 +717,12 @@ GRANT USAGE, SELECT ON SEQUENCE {schema}.{table}_{pk_column}_seq TO app_rw;
 
         # Infer types for each column
         column_definitions = []
+        safe_columns = []
         for col in business_columns:
             safe_col = self._sanitize_identifier(col)
             col_type = self._infer_column_type(column_samples[col])
             column_definitions.append(f'    {safe_col} {col_type}')
+            safe_columns.append(safe_col)
 
         # Build CREATE TABLE statement
         pk_column = f'{table}id'
@@ -452,6 +740,10 @@ CREATE TABLE {schema}.{table} (
         # Execute table creation
         with db_transaction() as cursor:
             cursor.execute(create_sql)
+        # Unquoted identifiers are folded to lower case, as information_schema reports them
+        self._columns_cache[(schema, table)] = [
+            pk_column.lower(), 'datasetid', *(col.lower() for col in safe_columns), 'created_date', 'created_by'
+        ]
 
         self.logger.info(f"Created table {schema}.{table} with {len(business_columns)} business columns")
 
@@ -480,6 +772,8 @@ class GenericImportJob(BaseETLJob):
         config_id: int,
         run_date: Optional[date] = None,
         dry_run: bool = False,
+        preloaded: Optional[Tuple[Path, List[Dict[str, Any]]]] = None,
+        pending_write: Optional[Future] = None,
         **kwargs
     ):
         """
@@ -489,6 +783,10 @@ class GenericImportJob(BaseETLJob):
             config_id: ID from dba.timportconfig.config_id
             run_date: Date for this run (defaults to today)
             dry_run: If True, don't actually load data
+            preloaded: (path, records) of a JSON file whose decoded records are
+                already in memory; the file is imported without being parsed
+            pending_write: Future that completes once the preloaded file is
+                on disk, when the caller is still writing it
             **kwargs: Additional arguments passed to BaseETLJob
 
         Raises:
@@ -498,17 +796,38 @@ class GenericImportJob(BaseETLJob):
         self.import_config: Optional[ImportConfig] = None
         self.strategy: Optional[ImportStrategy] = None
         self.matched_files: List[Path] = []
+        # Target column list chosen by the import strategy; None loads every
+        # key of the first record
+        self._load_columns: Optional[List[str]] = None
+        # Labels/dates derived from filename or static config, keyed by file;
+        # file_content values depend on the records and are not cached
+        self._label_cache: Dict[Path, str] = {}
+        self._date_cache: Dict[Path, date] = {}
+        # Directory scan result, shared by _extract_label_early() and setup()
+        self._matched_files_cache: Optional[List[Path]] = None
+        # (path, records) of a file already parsed for a file_content label,
+        # reused by extract() instead of parsing the file again
+        self._first_file_records: Optional[Tuple[Path, List[Dict[str, Any]]]] = None
+        # Built on first use; the file type is fixed for the job's lifetime
+        self._extractor: Optional[FileExtractor] = None
+        self._preloaded = preloaded
+        self._pending_write = pending_write
         self.schema_manager = SchemaManager()
         self._temp_logger = get_logger('GenericImportJob')
 
-        import_config = self._load_config(config_id)
-        if import_config is None:
+        loaded = self._load_config(config_id)
+        if loaded is None:
             raise ConfigNotFoundError(
                 f"Config ID {config_id} not found. Check dba.timportconfig table."
             )
 
+        import_config, self.strategy = loaded
         self.import_config = import_config
-        self.strategy = self._load_strategy(import_config.importstrategyid)
+
+        # Preloaded records stand in for relational JSON extraction only; other
+        # configs read the file once it has been written
+        if import_config.file_type.upper() != 'JSON' or import_config.is_blob:
+            self._preloaded = None
 
         super().__init__(
             run_date=run_date or date.today(),
@@ -520,24 +839,26 @@ class GenericImportJob(BaseETLJob):
 
         self.loader = PostgresLoader(schema=self._get_target_schema())
 
-    def _load_config(self, config_id: int) -> Optional[ImportConfig]:
-        """Load import configuration from database."""
+    def _load_config(self, config_id: int) -> Optional[Tuple[ImportConfig, ImportStrategy]]:
+        """Load import configuration and its strategy from database in one query."""
         query = """
             SELECT
-                config_id, config_name, datasource, datasettype,
-                source_directory, archive_directory, file_pattern, file_type,
-                metadata_label_source, metadata_label_location,
-                dateconfig, datelocation, dateformat, delimiter,
-                target_table, importstrategyid, is_active, is_blob
-            FROM dba.timportconfig
-            WHERE config_id = %s AND is_active = TRUE
+                c.config_id, c.config_name, c.datasource, c.datasettype,
+                c.source_directory, c.archive_directory, c.file_pattern, c.file_type,
+                c.metadata_label_source, c.metadata_label_location,
+                c.dateconfig, c.datelocation, c.dateformat, c.delimiter,
+                c.target_table, c.importstrategyid, c.is_active, c.is_blob,
+                s.name AS strategy_name, s.description AS strategy_description
+            FROM dba.timportconfig c
+            LEFT JOIN dba.timportstrategy s ON s.importstrategyid = c.importstrategyid
+            WHERE c.config_id = %s AND c.is_active = TRUE
         """
         results = fetch_dict(query, (config_id,))
         if not results:
             return None
 
         row = results[0]
-        return ImportConfig(
+        import_config = ImportConfig(
             config_id=row['config_id'],
             config_name=row['config_name'],
             datasource=row['datasource'],
@@ -558,42 +879,30 @@ class GenericImportJob(BaseETLJob):
             is_blob=row['is_blob']
         )
 
-    def _load_strategy(self, strategy_id: int) -> ImportStrategy:
-        """Load import strategy from database."""
-        query = """
-            SELECT importstrategyid, name, description
-            FROM dba.timportstrategy
-            WHERE importstrategyid = %s
-        """
-        results = fetch_dict(query, (strategy_id,))
-        if not results:
-            return ImportStrategy(
-                importstrategyid=strategy_id,
-                name='Unknown',
-                description=None
-            )
-
-        row = results[0]
-        return ImportStrategy(
+        # No matching strategy row leaves the name unknown
+        strategy = ImportStrategy(
             importstrategyid=row['importstrategyid'],
-            name=row['name'],
-            description=row.get('description')
+            name=row['strategy_name'] or 'Unknown',
+            description=row['strategy_description']
         )
+        return import_config, strategy
 
     def _get_target_schema(self) -> str:
-        """Extract schema from target_table (format: schema.table)."""
-        if '.' in self.import_config.target_table:
-            return self.import_config.target_table.split('.')[0]
-        return 'feeds'
+        """Schema part of target_table (format: schema.table), parsed at config load."""
+        return self.import_config.target_schema
 
     def _get_target_table(self) -> str:
-        """Extract table name from target_table (format: schema.table)."""
-        if '.' in self.import_config.target_table:
-            return self.import_config.target_table.split('.')[1]
-        return self.import_config.target_table
+        """Table part of target_table (format: schema.table), parsed at config load."""
+        return self.import_config.target_table_name
 
     def _get_extractor(self) -> FileExtractor:
-        """Get appropriate file extractor based on file type."""
+        """Get the file extractor for this job, building it on first use."""
+        if self._extractor is None:
+            self._extractor = self._build_extractor()
+        return self._extractor
+
+    def _build_extractor(self) -> FileExtractor:
+        """Build the appropriate file extractor based on file type."""
         file_type = self.import_config.file_type.upper()
         if file_type == 'CSV':
             # Note: The config.delimiter is for filename parsing, not CSV parsing
@@ -609,60 +918,125 @@ class GenericImportJob(BaseETLJob):
             raise ValueError(f"Unsupported file type: {file_type}")
 
     def _find_matching_files(self) -> List[Path]:
-        """Find files matching the configured pattern."""
+        """
+        Find files matching the configured pattern.
+
+        The directory is scanned once per run; later calls return the cached
+        list until cleanup() archives the files.
+        """
+        if self._matched_files_cache is not None:
+            return list(self._matched_files_cache)
+
         source_dir = Path(self.import_config.source_directory)
+        pattern = self.import_config.file_pattern
+        pattern_re = re.compile(pattern)
+
+        if self._preloaded is not None:
+            # Preloaded records stand in for their file only if the scan
+            # would have matched it
+            preloaded_path = self._preloaded[0]
+            if not (preloaded_path.parent.resolve() == source_dir.resolve()
+                    and pattern_re.match(preloaded_path.name)):
+                if self.logger:
+                    self.logger.warning(
+                        f"Preloaded file {preloaded_path} is outside {source_dir} "
+                        f"or does not match {pattern}; not importing it"
+                    )
+                self._preloaded = None
+
+        if self._preloaded is None:
+            # Without the records in hand the file must be on disk to be found
+            self._wait_for_pending_write()
+
         if not source_dir.exists():
             if self.logger:
                 self.logger.warning(f"Source directory does not exist: {source_dir}")
             return []
 
-        pattern = self.import_config.file_pattern
-        if self.logger:
+        # Names that lack the pattern's literal prefix are rejected with a
+        # startswith() check; a fully literal pattern never needs the regex
+        prefix, is_literal = _regex_literal_prefix(pattern)
+        # Per-file debug lines are only formatted when DEBUG is actually enabled
+        debug = bool(self.logger) and self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
             self.logger.debug(f"Scanning directory: {source_dir}")
             self.logger.debug(f"Using pattern: {pattern}")
         matched = []
 
-        for file_path in source_dir.iterdir():
-            if self.logger:
-                self.logger.debug(f"Checking file: {file_path.name} (is_file: {file_path.is_file()})")
-            if file_path.is_file():
-                match_result = re.match(pattern, file_path.name)
-                if self.logger:
-                    self.logger.debug(f"  Pattern match result: {match_result}")
-                if match_result:
-                    matched.append(file_path)
-                    if self.logger:
-                        self.logger.debug(f"  MATCHED: {file_path.name}")
-
-        if self.logger:
+        # One scandir pass; DirEntry.is_file() answers from the directory
+        # entry type and only stats symlinks. Path objects are built for hits only.
+        with os.scandir(source_dir) as entries:
+            for entry in entries:
+                # Cheap name match first, then the file-type check
+                name = entry.name
+                if not name.startswith(prefix):
+                    match_result = None
+                elif is_literal:
+                    match_result = True
+                else:
+                    match_result = pattern_re.match(name)
+                if debug:
+                    self.logger.debug(f"Checking file: {name} (pattern match: {match_result})")
+                if match_result and entry.is_file():
+                    matched.append(Path(entry.path))
+                    if debug:
+                        self.logger.debug(f"  MATCHED: {name}")
+
+        if self._preloaded is not None:
+            # The preloaded file counts as matched whether or not it has been
+            # written yet
+            preloaded_path = self._preloaded[0]
+            matched = [path for path in matched if path.name != preloaded_path.name]
+            matched.append(preloaded_path)
+
+        if debug:
             self.logger.debug(f"Total matched files: {len(matched)}")
-        return sorted(matched)
+        matched.sort()
+        self._matched_files_cache = matched
+        return list(matched)
+
+    def _wait_for_pending_write(self):
+        """Block until a file the caller is still writing is on disk."""
+        if self._pending_write is not None:
+            pending_write, self._pending_write = self._pending_write, None
+            pending_write.result()
+
+    def _filename_part(self, file_path: Path, index: Optional[int]) -> Optional[str]:
+        """Return the index-th delimiter-separated part of the file stem, if present."""
+        delimiter = self.import_config.delimiter
+        if delimiter and index is not None:
+            parts = file_path.stem.split(delimiter)
+            if 0 <= index < len(parts):
+                return parts[index]
+        return None
 
     def _extract_metadata_label(self, file_path: Path, records: List[Dict]) -> str:
         """Extract metadata label based on configuration."""
         source = self.import_config.metadata_label_source
         location = self.import_config.metadata_label_location
 
-        if source == 'static':
-            return location or 'Unknown'
-        elif source == 'filename':
-            if self.import_config.delimiter and location:
-                parts = file_path.stem.split(self.import_config.delimiter)
-                try:
-                    index = int(location)
-                    if 0 <= index < len(parts):
-                        return parts[index]
-                except (ValueError, IndexError):
-                    pass
-            return file_path.stem
-        elif source == 'file_content':
+        if source == 'file_content':
             if records and location:
                 first_record = records[0]
                 if location in first_record:
                     return str(first_record[location])
             return file_path.stem
 
-        return file_path.stem
+        label = self._label_cache.get(file_path)
+        if label is not None:
+            return label
+
+        if source == 'static':
+            label = location or 'Unknown'
+        elif source == 'filename':
+            label = self._filename_part(file_path, self.import_config.label_part_index)
+            if label is None:
+                label = file_path.stem
+        else:
+            label = file_path.stem
+
+        self._label_cache[file_path] = label
+        return label
 
     def _extract_date(self, file_path: Path, records: List[Dict]) -> date:
         """Extract date based on configuration."""
@@ -670,66 +1044,86 @@ class GenericImportJob(BaseETLJob):
         location = self.import_config.datelocation
         date_format = self.import_config.dateformat
 
+        cacheable = source != 'file_content'
+        if cacheable:
+            cached = self._date_cache.get(file_path)
+            if cached is not None:
+                return cached
+
         date_str = None
 
         if source == 'static':
             date_str = location
         elif source == 'filename':
-            if self.import_config.delimiter and location:
-                parts = file_path.stem.split(self.import_config.delimiter)
-                try:
-                    index = int(location)
-                    if 0 <= index < len(parts):
-                        date_str = parts[index]
-                except (ValueError, IndexError):
-                    pass
+            date_str = self._filename_part(file_path, self.import_config.date_part_index)
         elif source == 'file_content':
             if records and location:
                 first_record = records[0]
                 if location in first_record:
                     date_str = str(first_record[location])
 
+        result = None
         if date_str and date_format:
-            try:
-                py_format = self._convert_date_format(date_format)
-                parsed = datetime.strptime(date_str, py_format)
-                return parsed.date()
-            except ValueError:
-                pass
+            with suppress(ValueError):
+                result = _parse_date_string(date_str, self._convert_date_format(date_format))
+        if result is None:
+            result = date.today()
 
-        return date.today()
+        if cacheable:
+            self._date_cache[file_path] = result
+        return result
 
     def _convert_date_format(self, format_str: str) -> str:
         """Convert Java-style date format to Python strptime format."""
-        conversions = {
-            'yyyy': '%Y',
-            'yy': '%y',
-            'MM': '%m',
-            'dd': '%d',
-            'HH': '%H',
-            'mm': '%M',
-            'ss': '%S',
-            'T': 'T',
-        }
-        result = format_str
-        for java_fmt, py_fmt in conversions.items():
-            result = result.replace(java_fmt, py_fmt)
-        return result
+        return _java_to_strptime(format_str)
 
     def _normalize_column_names(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Normalize column names to be SQL-safe."""
+        """
+        Normalize column names to be SQL-safe.
+
+        Records are replaced in place in the given list, so each source dict
+        can be freed as soon as its renamed copy exists instead of the whole
+        extract result living alongside a second full list.
+        """
         if not records:
             return records
 
-        normalized = []
-        for record in records:
+        # Sanitize each distinct header once rather than once per row
+        key_map = {key: _sanitize_identifier(key) for key in records[0]}
+        old_keys = tuple(key_map)
+        new_keys = tuple(key_map.values())
+        key_count = len(old_keys)
+
+        def rename(record: Dict[str, Any]) -> Dict[str, Any]:
             new_record = {}
             for key, value in record.items():
-                new_key = self.schema_manager._sanitize_identifier(key)
+                new_key = key_map.get(key)
+                if new_key is None:
+                    new_key = key_map[key] = _sanitize_identifier(key)
                 new_record[new_key] = value
-            normalized.append(new_record)
+            return new_record
+
+        # Headers that are already SQL-safe (the usual case for files we
+        # produce ourselves) need no rebuild: records with the first record's
+        # key set are kept as they are
+        if old_keys == new_keys:
+            first_keys = records[0].keys()
+            for index, record in enumerate(records):
+                if record.keys() != first_keys:
+                    records[index] = rename(record)
+            return records
 
-        return normalized
+        for index, record in enumerate(records):
+            # Fast path: same headers as the first record (every CSV/Excel row)
+            if len(record) == key_count:
+                try:
+                    records[index] = dict(zip(new_keys, map(record.__getitem__, old_keys)))
+                    continue
+                except KeyError:
+                    pass
+            records[index] = rename(record)
+
+        return records
 
     def _apply_import_strategy(
         self,
@@ -763,28 +1157,31 @@ class GenericImportJob(BaseETLJob):
             # Only add actual new data columns from the CSV, not metadata columns
             schema = self._get_target_schema()
             table = self._get_target_table()
-            for col in new_columns:
-                self.schema_manager.add_column(schema, table, col)
-            # Filter out metadata columns before returning
+            if new_columns:
+                # Type new columns from a sample, as create_table_from_records does
+                samples = records[:5]
+                column_types = {
+                    col: self.schema_manager._infer_column_type([record.get(col) for record in samples])
+                    for col in new_columns
+                }
+                self.schema_manager.add_columns(
+                    schema, table, sorted(new_columns), column_types=column_types
+                )
+            # Leave out metadata columns; the loader reads just these keys
             allowed_system = {'datasetid', 'created_date', 'created_by', 'modified_date', 'modified_by'}
             valid_columns = data_columns | allowed_system
-            filtered = []
-            for record in records:
-                filtered_record = {k: v for k, v in record.items() if k in valid_columns}
-                filtered.append(filtered_record)
-            return filtered
+            self._load_columns = [col for col in records[0] if col in valid_columns]
+            return records
 
         elif strategy_id == 2:
-            # Filter to only existing columns + allowed system columns (not metadata)
+            # Load only existing columns + allowed system columns (not metadata).
+            # The loader reads just these keys, so records are not rebuilt.
             allowed_system = {'datasetid', 'created_date', 'created_by', 'modified_date', 'modified_by'}
             valid_columns = (data_columns & comparable_existing) | allowed_system
-            filtered = []
-            for record in records:
-                filtered_record = {k: v for k, v in record.items() if k in valid_columns}
-                filtered.append(filtered_record)
+            self._load_columns = [col for col in records[0] if col in valid_columns]
             if new_columns:
                 self.logger.info(f"Ignoring columns not in target table: {new_columns}")
-            return filtered
+            return records
 
         elif strategy_id == 3:
             if new_columns:
@@ -792,77 +1189,48 @@ class GenericImportJob(BaseETLJob):
                     f"Source file contains columns not in target table: {new_columns}. "
                     f"Import strategy 3 requires all source columns to exist in target table."
                 )
-            # Filter out metadata columns
+            # Leave out metadata columns; the loader reads just these keys
             allowed_system = {'datasetid', 'created_date', 'created_by', 'modified_date', 'modified_by'}
             valid_columns = data_columns | allowed_system
-            filtered = []
-            for record in records:
-                filtered_record = {k: v for k, v in record.items() if k in valid_columns}
-                filtered.append(filtered_record)
-            return filtered
+            self._load_columns = [col for col in records[0] if col in valid_columns]
+            return records
 
         return records
 
-    def _ensure_reference_data(self):
+    def _ensure_reference_data(self, logger):
         """
         Ensure datasource and datasettype exist in reference tables.
 
         Creates them automatically if they don't exist to support modular configuration.
+        Both inserts run in one transaction and are no-ops when the name already
+        exists (sourcename and typename are unique).
+
+        Args:
+            logger: Logger to report on (self.logger isn't set up before run())
         """
-        try:
-            # Ensure datasource exists
-            self.logger.debug(f"Checking if datasource '{self.import_config.datasource}' exists...")
-            check_source_query = "SELECT COUNT(*) as count FROM dba.tdatasource WHERE sourcename = %s"
-            source_result = fetch_dict(check_source_query, (self.import_config.datasource,))
-            self.logger.debug(f"Datasource query result: {source_result}")
-
-            if source_result[0]['count'] == 0:
-                self.logger.info(f"Datasource '{self.import_config.datasource}' does not exist - creating...")
-                insert_source_query = """
-                    INSERT INTO dba.tdatasource (sourcename, description, createdby)
-                    VALUES (%s, %s, %s)
-                """
-                with db_transaction() as cursor:
-                    cursor.execute(
-                        insert_source_query,
-                        (
-                            self.import_config.datasource,
-                            f'Auto-created for import config: {self.import_config.config_name}',
-                            self.username
-                        )
-                    )
-                self.logger.info(f"Created datasource: {self.import_config.datasource}")
-            else:
-                self.logger.debug(f"Datasource '{self.import_config.datasource}' already exists")
-
-            # Ensure datasettype exists
-            self.logger.debug(f"Checking if datasettype '{self.import_config.datasettype}' exists...")
-            check_type_query = "SELECT COUNT(*) as count FROM dba.tdatasettype WHERE typename = %s"
-            type_result = fetch_dict(check_type_query, (self.import_config.datasettype,))
-            self.logger.debug(f"Datasettype query result: {type_result}")
-
-            if type_result[0]['count'] == 0:
-                self.logger.info(f"Datasettype '{self.import_config.datasettype}' does not exist - creating...")
-                insert_type_query = """
-                    INSERT INTO dba.tdatasettype (typename, description, createdby)
-                    VALUES (%s, %s, %s)
+        description = f'Auto-created for import config: {self.import_config.config_name}'
+        with db_transaction() as cursor:
+            cursor.execute(
                 """
-                with db_transaction() as cursor:
-                    cursor.execute(
-                        insert_type_query,
-                        (
-                            self.import_config.datasettype,
-                            f'Auto-created for import config: {self.import_config.config_name}',
-                            self.username
-                        )
-                    )
-                self.logger.info(f"Created datasettype: {self.import_config.datasettype}")
-            else:
-                self.logger.debug(f"Datasettype '{self.import_config.datasettype}' already exists")
+                INSERT INTO dba.tdatasource (sourcename, description, createdby)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (sourcename) DO NOTHING
+                """,
+                (self.import_config.datasource, description, self.username)
+            )
+            if cursor.rowcount:
+                logger.info(f"Created datasource: {self.import_config.datasource}")
 
-        except Exception as e:
-            self.logger.error(f"Error ensuring reference data: {e}", exc_info=True)
-            raise
+            cursor.execute(
+                """
+                INSERT INTO dba.tdatasettype (typename, description, createdby)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (typename) DO NOTHING
+                """,
+                (self.import_config.datasettype, description, self.username)
+            )
+            if cursor.rowcount:
+                logger.info(f"Created datasettype: {self.import_config.datasettype}")
 
     def setup(self):
         """Set up resources and validate configuration."""
@@ -897,24 +1265,54 @@ class GenericImportJob(BaseETLJob):
         extractor = self._get_extractor()
         all_records = []
 
-        for file_path in self.matched_files:
-            self.logger.info(f"Extracting from: {file_path.name}")
-            try:
-                records = extractor.extract(file_path)
-                metadata_label = self._extract_metadata_label(file_path, records)
-                file_date = self._extract_date(file_path, records)
-
-                for record in records:
-                    record['_source_file'] = file_path.name
-                    record['_metadata_label'] = metadata_label
-                    record['_file_date'] = file_date
+        # A file already parsed for its label, or preloaded by the caller, is
+        # not parsed again
+        parsed_path, parsed_records = self._first_file_records or (None, None)
+        self._first_file_records = None
+        preloaded_path, preloaded_records = self._preloaded or (None, None)
+        files_to_parse = [
+            path for path in self.matched_files if path != parsed_path and path != preloaded_path
+        ]
+
+        # Files are independent and parsing is CPU-bound, so several files are
+        # parsed in worker processes (unless ETL_PARALLEL_EXTRACT is off);
+        # results are merged here in file order.
+        pool = None
+        futures = {}
+        if len(files_to_parse) > 1 and get_config().etl.parallel_extract:
+            max_workers = min(len(files_to_parse), os.cpu_count() or 1, _MAX_EXTRACT_WORKERS)
+            pool = ProcessPoolExecutor(max_workers=max_workers)
+            futures = {
+                file_path: pool.submit(_extract_file, extractor, file_path)
+                for file_path in files_to_parse
+            }
 
-                all_records.extend(records)
-                self.logger.info(f"Extracted {len(records)} records from {file_path.name}")
+        try:
+            for file_path in self.matched_files:
+                self.logger.info(f"Extracting from: {file_path.name}")
+                try:
+                    if file_path == parsed_path:
+                        records = parsed_records
+                    elif file_path == preloaded_path:
+                        records = preloaded_records
+                    elif pool is not None:
+                        records = futures[file_path].result()
+                    else:
+                        records = extractor.extract(file_path)
+                    metadata_label = self._extract_metadata_label(file_path, records)
+                    file_date = self._extract_date(file_path, records)
+                    all_records.extend(records)
+                    self.logger.info(
+                        f"Extracted {len(records)} records from {file_path.name} "
+                        f"(label={metadata_label}, date={file_date})"
+                    )
 
-            except Exception as e:
-                self.logger.error(f"Error extracting from {file_path.name}: {e}")
-                raise
+                except Exception as e:
+                    self.logger.error(f"Error extracting from {file_path.name}: {e}")
+                    raise
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
 
         return all_records
 
@@ -925,56 +1323,59 @@ class GenericImportJob(BaseETLJob):
 
         transformed = self._normalize_column_names(data)
 
-        # Serialize nested dicts/lists to JSON strings to prevent psycopg2 'can't adapt type' errors
+        # One timestamp for the whole run; audit columns are stamped with a
+        # single update() per record in the same pass as serialization
+        audit = {'created_date': self.run_started_at or datetime.now(), 'created_by': self.username}
         for record in transformed:
+            # Serialize nested dicts/lists to JSON strings to prevent psycopg2 'can't adapt type' errors
             for key, value in record.items():
                 if isinstance(value, (dict, list)):
-                    record[key] = json.dumps(value)
-
-        for record in transformed:
-            record['created_date'] = datetime.now()
-            record['created_by'] = self.username
+                    record[key] = _json_dumps(value)
+            record.update(audit)
 
         schema = self._get_target_schema()
         table = self._get_target_table()
 
-        if self.schema_manager.table_exists(schema, table):
-            existing_columns = self.schema_manager.get_table_columns(schema, table)
-            transformed = self._apply_import_strategy(transformed, existing_columns)
-        else:
+        # A table always has columns, so an empty column list means it doesn't
+        # exist; this saves a separate existence query on every run
+        existing_columns = self.schema_manager.get_table_columns(schema, table)
+        if not existing_columns:
             # Table doesn't exist - create it dynamically from sample records
             self.logger.info(f"Target table {schema}.{table} does not exist - creating dynamically")
             self.schema_manager.create_table_from_records(schema, table, transformed, max_samples=5)
             self.logger.info(f"Successfully created table {schema}.{table}")
-
-            # Now get the columns and apply import strategy
             existing_columns = self.schema_manager.get_table_columns(schema, table)
-            transformed = self._apply_import_strategy(transformed, existing_columns)
 
-        return transformed
+        return self._apply_import_strategy(transformed, existing_columns)
 
     def load(self, data: List[Dict[str, Any]]):
         """Load transformed data to database."""
+        # The saved copy of preloaded records must exist before they are
+        # loaded; a failed write fails the run here, as save_json() would have
+        self._wait_for_pending_write()
+
         if not data:
             self.logger.warning("No data to load")
             self.records_loaded = 0
             return
 
-        # Remove any remaining metadata columns (normalized names, no underscore prefix)
-        metadata_columns = {'source_file', 'metadata_label', 'file_date'}
-        for record in data:
-            for col in metadata_columns:
-                record.pop(col, None)
+        # Metadata columns (normalized names, no underscore prefix) are left out
+        # at the column level; the import strategy has normally chosen the load
+        # columns already, otherwise take the first record's keys minus metadata
+        columns = self._load_columns
+        if columns is None:
+            columns = [col for col in data[0] if col not in _METADATA_COLUMNS]
 
         table = self._get_target_table()
 
         self.logger.info(f"Loading {len(data)} records to {self._get_target_schema()}.{table}")
 
         try:
-            self.records_loaded = self.loader.load(
+            self.records_loaded = self.loader.load_copy(
                 table=table,
                 data=data,
-                dataset_id=self.dataset_id
+                dataset_id=self.dataset_id,
+                columns=columns
             )
             self.logger.info(f"Successfully loaded {self.records_loaded} records")
         except Exception as e:
@@ -983,36 +1384,121 @@ class GenericImportJob(BaseETLJob):
 
     def cleanup(self):
         """Archive processed files and update last_modified_at."""
-        archive_dir = Path(self.import_config.archive_directory)
-        if not archive_dir.exists():
-            archive_dir.mkdir(parents=True, exist_ok=True)
+        # A preloaded file is archived like the others once it is on disk; if
+        # it was never written there is nothing to archive and the run fails
+        # after the other files are archived
+        write_error = None
+        files_to_archive = self.matched_files
+        try:
+            self._wait_for_pending_write()
+        except Exception as e:
+            self.logger.error(f"Failed to write preloaded file: {e}")
+            write_error = e
+            unwritten = self._preloaded[0] if self._preloaded is not None else None
+            files_to_archive = [path for path in self.matched_files if path != unwritten]
 
-        for file_path in self.matched_files:
+        archive_dir = Path(self.import_config.archive_directory)
+        archive_dir.mkdir(parents=True, exist_ok=True)
+
+        # One directory scan up front; destination names are reserved serially
+        # from it so parallel moves never race for the same name
+        with os.scandir(archive_dir) as entries:
+            existing_names = {entry.name for entry in entries}
+        targets = [
+            (file_path, self._reserve_archive_name(file_path, existing_names))
+            for file_path in files_to_archive
+        ]
+
+        def archive_one(target: Tuple[Path, str]):
+            file_path, name = target
             try:
-                dest = archive_dir / file_path.name
-                counter = 1
-                while dest.exists():
-                    stem = file_path.stem
-                    suffix = file_path.suffix
-                    dest = archive_dir / f"{stem}_{counter}{suffix}"
-                    counter += 1
+                return file_path, self._archive_file(file_path, archive_dir, name), None
+            except Exception as e:
+                return file_path, None, e
 
-                shutil.move(str(file_path), str(dest))
+        if len(targets) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(targets), _MAX_ARCHIVE_WORKERS)) as pool:
+                results = list(pool.map(archive_one, targets))
+        else:
+            results = [archive_one(target) for target in targets]
+
+        for file_path, dest, error in results:
+            if error is None:
                 self.logger.info(f"Archived {file_path.name} to {dest}")
-            except Exception as e:
-                self.logger.error(f"Failed to archive {file_path.name}: {e}")
+            else:
+                self.logger.error(f"Failed to archive {file_path.name}: {error}")
+
+        # Archived files are gone from the source directory
+        self._matched_files_cache = None
 
         try:
             with db_transaction() as cursor:
                 cursor.execute(
                     "UPDATE dba.timportconfig SET last_modified_at = %s WHERE config_id = %s",
-                    (datetime.now(), self.config_id)
+                    (self.run_started_at or datetime.now(), self.config_id)
                 )
         except Exception as e:
             self.logger.warning(f"Failed to update last_modified_at: {e}")
 
+        if write_error is not None:
+            raise write_error
+
         self.logger.info("Cleanup complete")
 
+    @staticmethod
+    def _reserve_archive_name(file_path: Path, existing_names: Set[str]) -> str:
+        """
+        Pick the first archive name for file_path not in existing_names and add it.
+
+        Collisions get a numeric suffix (report_1.csv, report_2.csv, ...).
+        """
+        name = file_path.name
+        counter = 1
+        while name in existing_names:
+            name = f"{file_path.stem}_{counter}{file_path.suffix}"
+            counter += 1
+        existing_names.add(name)
+        return name
+
+    def _archive_file(self, file_path: Path, archive_dir: Path, name: Optional[str] = None) -> Path:
+        """
+        Move a file into the archive directory without overwriting existing files.
+
+        The destination name is claimed with a hard link, which fails atomically
+        with FileExistsError instead of clobbering, so no exists() probing is
+        needed on the common path. Name collisions get a numeric suffix
+        (report_1.csv, report_2.csv, ...). Falls back to shutil.move when the
+        archive lives on another filesystem or hard links are unsupported.
+
+        Args:
+            file_path: File to archive
+            archive_dir: Archive directory
+            name: Destination name to try first (see _reserve_archive_name);
+                defaults to the file's own name
+
+        Returns:
+            Path the file was archived to
+        """
+        stem, suffix = file_path.stem, file_path.suffix
+        dest = archive_dir / (name or file_path.name)
+        counter = 1
+        while True:
+            try:
+                os.link(file_path, dest)
+            except FileExistsError:
+                dest = archive_dir / f"{stem}_{counter}{suffix}"
+                counter += 1
+                continue
+            except OSError:
+                # Cross-device (EXDEV) or no hard-link support: copy-based move
+                while dest.exists():
+                    dest = archive_dir / f"{stem}_{counter}{suffix}"
+                    counter += 1
+                shutil.move(str(file_path), str(dest))
+                return dest
+            os.unlink(file_path)
+            return dest
+
     def _extract_label_early(self) -> Optional[str]:
         """
         Extract dataset label early (before full extraction) based on import config.
@@ -1038,24 +1524,21 @@ class GenericImportJob(BaseETLJob):
         # Use first file for label extraction
         file_path = files[0]
 
-        # Handle filename-based label
+        # Handle filename-based label (cached for extract())
         if source == 'filename':
-            if self.import_config.delimiter and location:
-                parts = file_path.stem.split(self.import_config.delimiter)
-                try:
-                    index = int(location)
-                    if 0 <= index < len(parts):
-                        return parts[index]
-                except (ValueError, IndexError):
-                    pass
-            return file_path.stem
+            return self._extract_metadata_label(file_path, [])
 
         # Handle file_content-based label (requires reading first record)
         elif source == 'file_content':
             if location:
                 try:
-                    extractor = self._get_extractor()
-                    records = extractor.extract(file_path)
+                    if self._preloaded is not None and file_path == self._preloaded[0]:
+                        records = self._preloaded[1]
+                    else:
+                        extractor = self._get_extractor()
+                        records = extractor.extract(file_path)
+                        # Keep the parsed records for extract()
+                        self._first_file_records = (file_path, records)
                     if records and location in records[0]:
                         return str(records[0][location])
                 except Exception:
@@ -1078,39 +1561,7 @@ class GenericImportJob(BaseETLJob):
             # Ensure datasource and datasettype exist before creating dataset record
             temp_logger.info("Ensuring reference data exists...")
 
-            # Manually check and create since we don't have self.logger yet
-            check_source_query = "SELECT COUNT(*) as count FROM dba.tdatasource WHERE sourcename = %s"
-            source_result = fetch_dict(check_source_query, (self.import_config.datasource,))
-
-            if source_result[0]['count'] == 0:
-                temp_logger.info(f"Creating datasource: {self.import_config.datasource}")
-                insert_source_query = "INSERT INTO dba.tdatasource (sourcename, description, createdby) VALUES (%s, %s, %s)"
-                with db_transaction() as cursor:
-                    cursor.execute(
-                        insert_source_query,
-                        (
-                            self.import_config.datasource,
-                            f'Auto-created for import config: {self.import_config.config_name}',
-                            self.username
-                        )
-                    )
-
-            check_type_query = "SELECT COUNT(*) as count FROM dba.tdatasettype WHERE typename = %s"
-            type_result = fetch_dict(check_type_query, (self.import_config.datasettype,))
-
-            if type_result[0]['count'] == 0:
-                temp_logger.info(f"Creating datasettype: {self.import_config.datasettype}")
-                insert_type_query = "INSERT INTO dba.tdatasettype (typename, description, createdby) VALUES (%s, %s, %s)"
-                with db_transaction() as cursor:
-                    cursor.execute(
-                        insert_type_query,
-                        (
-                            self.import_config.datasettype,
-                            f'Auto-created for import config: {self.import_config.config_name}',
-                            self.username
-                        )
-                    )
-
+            self._ensure_reference_data(temp_logger)
             temp_logger.info("Reference data check complete")
 
             # Extract dataset label early based on import configuration
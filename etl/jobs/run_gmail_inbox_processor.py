@@ -19,15 +19,56 @@ Examples:
 import argparse
 import fnmatch
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple
 
 from common.db_utils import fetch_dict, db_transaction
 from common.gmail_client import GmailClient
 from common.logging_utils import ETLLogger
 from etl.base.etl_job import BaseETLJob
 
+# Concurrent attachment downloads; each is a single network round trip
+_MAX_DOWNLOAD_WORKERS = 8
+
+# '*.ext' attachment globs, which Gmail can search for as filename:ext
+_GLOB_EXTENSION_RE = re.compile(r'^\*\.([A-Za-z0-9]+)$')
+
+# Java SimpleDateFormat tokens -> strftime directives, matched longest first
+_JAVA_DATE_MAP = {
+    'yyyy': '%Y',
+    'yy': '%y',
+    'MM': '%m',
+    'dd': '%d',
+    'HH': '%H',
+    'mm': '%M',
+    'ss': '%S',
+    'SSS': '%f',
+}
+_JAVA_DATE_RE = re.compile('|'.join(sorted(_JAVA_DATE_MAP, key=len, reverse=True)))
+
+
+def _build_attachment_matcher(attachment_pattern: str) -> Tuple[str, Callable[[str], Any]]:
+    """
+    Classify an attachment pattern and build its filename matcher.
+
+    Patterns containing '*' or '?' are globs; anything else is a
+    case-insensitive regex, or a case-insensitive substring if the regex
+    does not compile.
+
+    Returns:
+        (kind, matcher) where kind is 'glob', 'regex' or 'literal'
+    """
+    if '*' in attachment_pattern or '?' in attachment_pattern:
+        # Same translation fnmatch.fnmatch uses on POSIX, compiled once
+        return 'glob', re.compile(fnmatch.translate(attachment_pattern)).match
+    try:
+        return 'regex', re.compile(attachment_pattern, re.IGNORECASE).search
+    except re.error:
+        literal = attachment_pattern.lower()
+        return 'literal', lambda filename: literal in filename.lower()
+
 
 class InboxProcessorJob(BaseETLJob):
     """
@@ -68,8 +109,10 @@ class InboxProcessorJob(BaseETLJob):
         self.matched_emails: List[Dict[str, Any]] = []
         self.download_tasks: List[Dict[str, Any]] = []
         self.downloaded_files: List[Path] = []
-        self.processed_message_ids: List[str] = set()
-        self.unmatched_message_ids: List[str] = set()
+        self.processed_message_ids: Set[str] = set()
+        self.unmatched_message_ids: Set[str] = set()
+        self._message_details: Dict[str, Dict[str, Any]] = {}  # message_id -> attachments/date
+        self._email_to_config: Dict[str, Dict[str, Any]] = {}  # message_id -> config for labelling
 
     def setup(self):
         """Load configurations and initialize Gmail client."""
@@ -102,7 +145,38 @@ class InboxProcessorJob(BaseETLJob):
             params = (self.config_id,)
 
         query += " ORDER BY ic.inbox_config_id"
-        return fetch_dict(query, params) or []
+        configs = fetch_dict(query, params) or []
+        for config in configs:
+            self._compile_config_patterns(config)
+        return configs
+
+    def _compile_config_patterns(self, config: Dict[str, Any]):
+        """
+        Compile a config's subject, sender and attachment patterns once.
+
+        Sets '_subj_re' and '_sender_re' (None when the pattern is empty),
+        '_att_kind' and '_att_matcher' for the attachment pattern, and
+        '_invalid_pattern' when a subject or sender regex does not compile
+        so the config matches no emails.
+        """
+        config['_invalid_pattern'] = False
+        for key, field in (('_subj_re', 'subject_pattern'), ('_sender_re', 'sender_pattern')):
+            pattern = config.get(field)
+            config[key] = None
+            if not pattern:
+                continue
+            try:
+                config[key] = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                label = 'subject' if field == 'subject_pattern' else 'sender'
+                self.logger.warning(f"Invalid {label} regex '{pattern}': {e}")
+                config['_invalid_pattern'] = True
+
+        config['_att_kind'], config['_att_matcher'] = _build_attachment_matcher(config['attachment_pattern'])
+        self.logger.debug(
+            f"Config '{config['config_name']}' attachment pattern "
+            f"'{config['attachment_pattern']}' is a {config['_att_kind']} pattern"
+        )
 
     def extract(self) -> List[Dict[str, Any]]:
         """
@@ -115,12 +189,24 @@ class InboxProcessorJob(BaseETLJob):
             self.logger.warning("No active inbox configurations found")
             return []
 
-        # Get all unread emails from inbox
-        all_emails = self.gmail.get_unread_emails()
-        self.logger.info(f"Found {len(all_emails)} unread emails in inbox")
+        # Unread IDs are listed in one call so unmatched emails can still get the
+        # error label; full metadata is fetched only for emails Gmail's search
+        # says could match a config
+        search_query = self._build_search_query()
+        if search_query:
+            all_message_ids = set(self.gmail.list_unread_ids())
+            all_emails = self.gmail.get_unread_emails(query=search_query)
+            all_message_ids.update(e['id'] for e in all_emails)
+            self.logger.info(
+                f"Found {len(all_message_ids)} unread emails in inbox, "
+                f"{len(all_emails)} matching '{search_query}'"
+            )
+        else:
+            all_emails = self.gmail.get_unread_emails()
+            all_message_ids = {e['id'] for e in all_emails}
+            self.logger.info(f"Found {len(all_emails)} unread emails in inbox")
 
         matched = []
-        all_message_ids = {e['id'] for e in all_emails}
 
         for config in self.configs:
             config_matches = self._match_emails_for_config(config, all_emails)
@@ -136,6 +222,37 @@ class InboxProcessorJob(BaseETLJob):
         self.matched_emails = matched
         return matched
 
+    def _build_search_query(self) -> str:
+        """
+        Build a Gmail search query that every matching email satisfies.
+
+        Each config contributes a condition on its attachments, the only rule
+        that always applies: 'filename:ext' for '*.ext' globs, otherwise
+        'has:attachment'. Conditions are OR'ed across configs. Subject and
+        sender regexes can't be translated to Gmail's word-based search without
+        missing emails, so they are still checked client-side.
+
+        Returns:
+            Query string, or '' if no config could be pushed down
+        """
+        terms = []
+        for config in self.configs:
+            if config['_invalid_pattern']:
+                continue
+            match = _GLOB_EXTENSION_RE.match(config['attachment_pattern'])
+            term = f'filename:{match.group(1)}' if match else 'has:attachment'
+            if term not in terms:
+                terms.append(term)
+
+        if not terms:
+            return ''
+        if 'has:attachment' in terms:
+            return 'has:attachment'
+        if len(terms) == 1:
+            return terms[0]
+        # Gmail's {a b} means a OR b
+        return '{' + ' '.join(terms) + '}'
+
     def _match_emails_for_config(
         self,
         config: Dict[str, Any],
@@ -152,53 +269,32 @@ class InboxProcessorJob(BaseETLJob):
             List of matched emails with config and attachment info
         """
         matches = []
-        subject_pattern = config.get('subject_pattern')
-        sender_pattern = config.get('sender_pattern')
-        attachment_pattern = config['attachment_pattern']
-
-        for email_data in emails:
-            # Check subject pattern
-            if subject_pattern:
-                try:
-                    if not re.search(subject_pattern, email_data['subject'], re.IGNORECASE):
-                        continue
-                except re.error as e:
-                    self.logger.warning(f"Invalid subject regex '{subject_pattern}': {e}")
-                    continue
-
-            # Check sender pattern
-            if sender_pattern:
-                try:
-                    if not re.search(sender_pattern, email_data['sender'], re.IGNORECASE):
-                        continue
-                except re.error as e:
-                    self.logger.warning(f"Invalid sender regex '{sender_pattern}': {e}")
-                    continue
-
-            # Check attachments
-            attachments = self.gmail.get_attachments(email_data['id'])
-            matching_attachments = []
-
-            for att in attachments:
-                # Use fnmatch for glob patterns, fall back to regex
-                filename = att['filename']
-                if '*' in attachment_pattern or '?' in attachment_pattern:
-                    # Glob pattern
-                    if fnmatch.fnmatch(filename, attachment_pattern):
-                        matching_attachments.append(att)
-                else:
-                    # Regex pattern
-                    try:
-                        if re.search(attachment_pattern, filename, re.IGNORECASE):
-                            matching_attachments.append(att)
-                    except re.error:
-                        # Treat as literal match if invalid regex
-                        if attachment_pattern.lower() in filename.lower():
-                            matching_attachments.append(att)
+        if config['_invalid_pattern']:
+            return matches
+
+        subject_re = config['_subj_re']
+        sender_re = config['_sender_re']
+        attachment_matcher = config['_att_matcher']
+
+        candidates = [
+            email_data for email_data in emails
+            if (subject_re is None or subject_re.search(email_data['subject']))
+            and (sender_re is None or sender_re.search(email_data['sender']))
+        ]
+
+        # Fetch attachments and dates for all candidates in batched round trips,
+        # reusing anything already fetched for an earlier config
+        missing = [e['id'] for e in candidates if e['id'] not in self._message_details]
+        if missing:
+            self._message_details.update(self.gmail.get_message_details(missing))
+
+        for email_data in candidates:
+            details = self._message_details[email_data['id']]
+            matching_attachments = [att for att in details['attachments'] if attachment_matcher(att['filename'])]
 
             if matching_attachments:
-                # Get email date for filename prefix
-                email_date = self.gmail.get_email_date(email_data['id']) or datetime.now()
+                # Email date for filename prefix
+                email_date = details['date'] or self.run_started_at or datetime.now()
 
                 matches.append({
                     'message_id': email_data['id'],
@@ -232,6 +328,8 @@ class InboxProcessorJob(BaseETLJob):
             List of download task dictionaries
         """
         tasks = []
+        # One entry per email; when an email matches several configs the last one labels it
+        self._email_to_config = {em['message_id']: em['config'] for em in data}
 
         for email_match in data:
             config = email_match['config']
@@ -283,23 +381,7 @@ class InboxProcessorJob(BaseETLJob):
         Returns:
             Python strftime format string (e.g., '%Y%m%d')
         """
-        conversions = {
-            'yyyy': '%Y',
-            'yy': '%y',
-            'MM': '%m',
-            'dd': '%d',
-            'HH': '%H',
-            'mm': '%M',
-            'ss': '%S',
-            'SSS': '%f',
-            'T': 'T'
-        }
-
-        result = java_format
-        for java, python in conversions.items():
-            result = result.replace(java, python)
-
-        return result
+        return _JAVA_DATE_RE.sub(lambda m: _JAVA_DATE_MAP[m.group(0)], java_format)
 
     def load(self, data: List[Dict[str, Any]]):
         """
@@ -308,49 +390,34 @@ class InboxProcessorJob(BaseETLJob):
         Args:
             data: List of download task dictionaries
         """
-        for task in data:
-            try:
-                target_dir = Path(task['target_directory'])
-
-                if task.get('is_eml'):
-                    # Download raw email as .eml
-                    raw_email = self.gmail.get_email_raw(task['message_id'])
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    file_path = target_dir / task['target_filename']
-                    with open(file_path, 'wb') as f:
-                        f.write(raw_email)
-                else:
-                    # Download attachment
-                    file_path = self.gmail.download_attachment(
-                        task['message_id'],
-                        task['attachment_id'],
-                        task['target_filename'],
-                        target_dir
-                    )
-
-                self.downloaded_files.append(file_path)
-                self.logger.info(
-                    f"Downloaded: {task['target_filename']}",
-                    extra={
-                        'metadata': {
-                            'file_path': str(file_path),
-                            'config_name': task['config']['config_name']
-                        }
-                    }
-                )
-
-            except Exception as e:
+        # Downloads are independent network I/O; label updates below stay serial
+        if len(data) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(data), _MAX_DOWNLOAD_WORKERS)) as pool:
+                results = list(pool.map(self._download_one, data))
+        else:
+            results = [self._download_one(task) for task in data]
+
+        for task, file_path, error in results:
+            if error is not None:
                 self.logger.error(
-                    f"Failed to download {task['original_filename']}: {e}",
+                    f"Failed to download {task['original_filename']}: {error}",
                     extra={'metadata': {'message_id': task['message_id']}}
                 )
+                continue
+
+            self.downloaded_files.append(file_path)
+            self.logger.info(
+                f"Downloaded: {task['target_filename']}",
+                extra={
+                    'metadata': {
+                        'file_path': str(file_path),
+                        'config_name': task['config']['config_name']
+                    }
+                }
+            )
 
         # Apply labels to processed emails
-        processed_configs: Dict[str, Dict] = {}  # message_id -> config
-        for task in data:
-            processed_configs[task['message_id']] = task['config']
-
-        for message_id, config in processed_configs.items():
+        for message_id, config in self._email_to_config.items():
             try:
                 if config.get('mark_processed', True):
                     # Apply processed label
@@ -376,6 +443,40 @@ class InboxProcessorJob(BaseETLJob):
 
         self.records_loaded = len(self.downloaded_files)
 
+    def _download_one(self, task: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Path], Optional[Exception]]:
+        """
+        Download one task's attachment or raw .eml file.
+
+        Runs on a worker thread, so it only returns the outcome; logging and
+        bookkeeping happen back in load().
+
+        Returns:
+            (task, file_path, None) on success or (task, None, error) on failure
+        """
+        try:
+            target_dir = Path(task['target_directory'])
+
+            if task.get('is_eml'):
+                # Download raw email as .eml
+                raw_email = self.gmail.get_email_raw(task['message_id'])
+                target_dir.mkdir(parents=True, exist_ok=True)
+                file_path = target_dir / task['target_filename']
+                with open(file_path, 'wb') as f:
+                    f.write(raw_email)
+            else:
+                # Download attachment
+                file_path = self.gmail.download_attachment(
+                    task['message_id'],
+                    task['attachment_id'],
+                    task['target_filename'],
+                    target_dir
+                )
+
+            return task, file_path, None
+
+        except Exception as e:
+            return task, None, e
+
     def cleanup(self):
         """Update configuration timestamps."""
         processed_config_ids = set()
@@ -387,7 +488,7 @@ class InboxProcessorJob(BaseETLJob):
                 with db_transaction() as cursor:
                     cursor.execute(
                         "UPDATE dba.tinboxconfig SET last_run_at = %s WHERE inbox_config_id = %s",
-                        (datetime.now(), config_id)
+                        (self.run_started_at or datetime.now(), config_id)
                     )
             except Exception as e:
                 self.logger.error(f"Failed to update last_run_at for config {config_id}: {e}")
@@ -0,0 +1,92 @@
+"""
+Fetch and import all NewYorkFed Markets API datasets in one process.
+
+The API fetches are network-bound and independent, so they run concurrently
+over the shared client's keep-alive session. Each dataset is then
+transformed and imported in turn, exactly as its own script would.
+
+Usage:
+    python etl/jobs/run_newyorkfed_all.py
+    python etl/jobs/run_newyorkfed_all.py --dry-run
+"""
+
+import argparse
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+
+from common.logging_utils import get_logger
+from etl.jobs import (
+    run_newyorkfed_agency_mbs,
+    run_newyorkfed_fx_swaps,
+    run_newyorkfed_guide_sheets,
+    run_newyorkfed_market_share,
+    run_newyorkfed_pd_statistics,
+    run_newyorkfed_reference_rates,
+    run_newyorkfed_repo,
+    run_newyorkfed_reverserepo,
+    run_newyorkfed_securities_lending,
+    run_newyorkfed_soma_holdings,
+    run_newyorkfed_treasury,
+)
+
+
+logger = get_logger('run_newyorkfed_all')
+
+# Same jobs and order as scripts/run_all_newyorkfed_jobs.py
+JOBS = [
+    (run_newyorkfed_reference_rates, 'Reference Rates (Latest)'),
+    (run_newyorkfed_soma_holdings, 'SOMA Holdings'),
+    (run_newyorkfed_repo, 'Repo Operations'),
+    (run_newyorkfed_reverserepo, 'Reverse Repo Operations'),
+    (run_newyorkfed_agency_mbs, 'Agency MBS'),
+    (run_newyorkfed_fx_swaps, 'FX Swaps'),
+    (run_newyorkfed_securities_lending, 'Securities Lending'),
+    (run_newyorkfed_guide_sheets, 'Guide Sheets'),
+    (run_newyorkfed_pd_statistics, 'PD Statistics'),
+    (run_newyorkfed_market_share, 'Market Share'),
+    (run_newyorkfed_treasury, 'Treasury Operations'),
+]
+
+# Concurrent API fetches; the client's rate limit still applies across them
+_MAX_FETCH_WORKERS = 5
+
+
+def _prefetch(job) -> list | None:
+    """Fetch a job's data, or None so the job fetches (and logs the failure) itself."""
+    try:
+        return job.fetch()
+    except Exception as e:
+        logger.warning(f"Prefetch failed for {job.CONFIG_NAME}: {e}")
+        return None
+
+
+def run_all(dry_run: bool = False) -> int:
+    """Fetch all datasets concurrently, then import each. Returns the number of failed jobs."""
+    with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as pool:
+        fetched = list(pool.map(_prefetch, [job for job, _ in JOBS]))
+
+    failed = 0
+    for (job, label), raw_data in zip(JOBS, fetched):
+        try:
+            rc = job.run(dry_run, raw_data=raw_data)
+        except Exception as e:
+            logger.error(f"{label} failed: {e}")
+            rc = 1
+        logger.info(f"{label}: {'SUCCESS' if rc == 0 else 'FAILED'}")
+        failed += rc != 0
+
+    logger.info(f"Total: {len(JOBS) - failed} successful, {failed} failed")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fetch and import all NewYorkFed datasets')
+    parser.add_argument('--dry-run', action='store_true', help='Fetch and save but do not load to database')
+    args = parser.parse_args()
+
+    return 0 if run_all(args.dry_run) == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,15 +8,31 @@ Usage:
 
 import argparse
 import sys
+from operator import itemgetter
 
 from common.logging_utils import get_logger
-from etl.clients.newyorkfed_client import NewYorkFedAPIClient
-from etl.base.import_utils import save_json, run_generic_import, parse_date, audit_cols, JobRunLogger
+from etl.clients.newyorkfed_client import get_shared_client
+from etl.base.import_utils import run_api_import, parse_date, audit_cols, transform_records
 
 CONFIG_NAME = 'NewYorkFed_Guide_Sheets'
 
 logger = get_logger('run_newyorkfed_guide_sheets')
 
+# Detail fields read per guide sheet record, in unpacking order
+_DETAIL_KEYS = (
+    'secType', 'cusip', 'issueDate', 'maturityDate',
+    'percentCouponRate', 'settlementPrice', 'accruedInterest',
+)
+_get_detail_fields = itemgetter(*_DETAIL_KEYS)
+
+
+def _detail_fields(record: dict) -> tuple:
+    """Detail field values in _DETAIL_KEYS order, with None for missing keys."""
+    try:
+        return _get_detail_fields(record)
+    except KeyError:
+        return tuple(map(record.get, _DETAIL_KEYS))
+
 
 def transform(data: list) -> list:
     """Transform guide sheets with nested array extraction."""
@@ -36,56 +52,48 @@ def transform(data: list) -> list:
     publication_date = parse_date(publication_date_str)
     guide_type = si_object.get('title', 'SI')
 
+    audit = audit_cols()
+
+    def transform_record(record: dict) -> dict:
+        sec_type, cusip, issue_date, maturity_date, coupon, price, accrued = _detail_fields(record)
+        return {
+            'publication_date': publication_date,
+            'guide_type': guide_type,
+            'security_type': sec_type,
+            'cusip': cusip,
+            'issue_date': parse_date(issue_date),
+            'maturity_date': parse_date(maturity_date),
+            'coupon_rate': coupon,
+            'settlement_price': price,
+            'accrued_interest': accrued,
+            **audit,
+        }
+
     details = si_object.get('details', [])
-    for record in details:
-        try:
-            transformed.append({
-                'publication_date': publication_date,
-                'guide_type': guide_type,
-                'security_type': record.get('secType'),
-                'cusip': record.get('cusip'),
-                'issue_date': parse_date(record.get('issueDate')),
-                'maturity_date': parse_date(record.get('maturityDate')),
-                'coupon_rate': record.get('percentCouponRate'),
-                'settlement_price': record.get('settlementPrice'),
-                'accrued_interest': record.get('accruedInterest'),
-                **audit_cols(),
-            })
-        except Exception as e:
-            logger.error(f"Failed to transform guide sheet record: {e}")
-            continue
+    transformed = transform_records(details, transform_record, logger, 'guide sheet')
 
     logger.info(f"Transformed {len(transformed)} guide sheet records")
     return transformed
 
 
+def fetch() -> list:
+    """Fetch Guide Sheets from the API."""
+    return get_shared_client().get_guide_sheets()
+
+
+def run(dry_run: bool = False, raw_data: list | None = None) -> int:
+    """Fetch (unless raw_data is given), then import. Returns 0 on success, 1 on failure."""
+    return run_api_import(
+        'run_newyorkfed_guide_sheets', CONFIG_NAME, fetch, transform, dry_run=dry_run, raw_data=raw_data, source='newyorkfed'
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description='Fetch and import NewYorkFed Guide Sheets')
     parser.add_argument('--dry-run', action='store_true', help='Fetch and save but do not load to database')
     args = parser.parse_args()
 
-    with JobRunLogger('run_newyorkfed_guide_sheets', CONFIG_NAME, args.dry_run) as job_log:
-        step_id = job_log.begin_step('data_collection', 'Data Collection')
-        try:
-            client = NewYorkFedAPIClient()
-            try:
-                raw_data = client.get_guide_sheets()
-            finally:
-                client.close()
-            if not raw_data:
-                job_log.complete_step(step_id, records_in=0, records_out=0, message="No data from API")
-                return 0
-            transformed = transform(raw_data)
-            if not transformed:
-                job_log.complete_step(step_id, records_in=len(raw_data), records_out=0, message="No records after transform")
-                return 0
-            save_json(transformed, CONFIG_NAME, source='newyorkfed')
-            job_log.complete_step(step_id, records_in=len(raw_data), records_out=len(transformed))
-        except Exception as e:
-            job_log.fail_step(step_id, str(e))
-            return 1
-
-        return run_generic_import(CONFIG_NAME, args.dry_run, job_run_logger=job_log)
+    return run(args.dry_run)
 
 
 if __name__ == '__main__':
@@ -9,13 +9,25 @@ Usage:
 import argparse
 import sys
 
-from common.logging_utils import get_logger
-from etl.clients.newyorkfed_client import NewYorkFedAPIClient
-from etl.base.import_utils import save_json, run_generic_import, JobRunLogger
+from etl.clients.newyorkfed_client import get_shared_client
+from etl.base.import_utils import run_api_import
 
 CONFIG_NAME = 'NewYorkFed_Market_Share'
 
-logger = get_logger('run_newyorkfed_market_share')
+
+def fetch() -> list:
+    """Fetch Market Share from the API."""
+    return get_shared_client().fetch_endpoint(
+        endpoint_path='/api/marketshare/qtrly/latest.{format}',
+        response_root_path='pd.marketshare',
+    )
+
+
+def run(dry_run: bool = False, raw_data: list | None = None) -> int:
+    """Fetch (unless raw_data is given), then import. Returns 0 on success, 1 on failure."""
+    return run_api_import(
+        'run_newyorkfed_market_share', CONFIG_NAME, fetch, dry_run=dry_run, raw_data=raw_data, source='newyorkfed'
+    )
 
 
 def main():
@@ -23,28 +35,7 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Fetch and save but do not load to database')
     args = parser.parse_args()
 
-    with JobRunLogger('run_newyorkfed_market_share', CONFIG_NAME, args.dry_run) as job_log:
-        step_id = job_log.begin_step('data_collection', 'Data Collection')
-        try:
-            client = NewYorkFedAPIClient()
-            try:
-                raw_data = client.fetch_endpoint(
-                    endpoint_path='/api/marketshare/qtrly/latest.{format}',
-                    response_root_path='pd.marketshare',
-                )
-            finally:
-                client.close()
-            if not raw_data:
-                job_log.complete_step(step_id, records_in=0, records_out=0, message="No data from API")
-                return 0
-            logger.info(f"Passthrough: {len(raw_data)} records (no transform)")
-            save_json(raw_data, CONFIG_NAME, source='newyorkfed')
-            job_log.complete_step(step_id, records_in=len(raw_data), records_out=len(raw_data))
-        except Exception as e:
-            job_log.fail_step(step_id, str(e))
-            return 1
-
-        return run_generic_import(CONFIG_NAME, args.dry_run, job_run_logger=job_log)
+    return run(args.dry_run)
 
 
 if __name__ == '__main__':
@@ -10,8 +10,8 @@ import argparse
 import sys
 
 from common.logging_utils import get_logger
-from etl.clients.newyorkfed_client import NewYorkFedAPIClient
-from etl.base.import_utils import save_json, run_generic_import, parse_date, parse_numeric, audit_cols, JobRunLogger
+from etl.clients.newyorkfed_client import get_shared_client
+from etl.base.import_utils import run_api_import, parse_date, parse_numeric, audit_cols
 
 CONFIG_NAME = 'NewYorkFed_SOMA_Holdings'
 
@@ -21,6 +21,7 @@ logger = get_logger('run_newyorkfed_soma_holdings')
 def transform(data: list) -> list:
     """Transform SOMA monthly Treasury holdings."""
     transformed = []
+    audit = audit_cols()
     for record in data:
         try:
             par_value = parse_numeric(record.get('parValue', ''), strip_commas=True)
@@ -34,7 +35,7 @@ def transform(data: list) -> list:
                 'maturity_date': parse_date(record.get('maturityDate')),
                 'par_value': par_value,
                 'current_face_value': current_face_value,
-                **audit_cols(),
+                **audit,
             })
         except Exception as e:
             logger.error(f"Failed to transform SOMA record: {e}")
@@ -44,33 +45,24 @@ def transform(data: list) -> list:
     return transformed
 
 
+def fetch() -> list:
+    """Fetch SOMA Holdings from the API."""
+    return get_shared_client().get_soma_holdings()
+
+
+def run(dry_run: bool = False, raw_data: list | None = None) -> int:
+    """Fetch (unless raw_data is given), then import. Returns 0 on success, 1 on failure."""
+    return run_api_import(
+        'run_newyorkfed_soma_holdings', CONFIG_NAME, fetch, transform, dry_run=dry_run, raw_data=raw_data, source='newyorkfed'
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description='Fetch and import NewYorkFed SOMA Holdings')
     parser.add_argument('--dry-run', action='store_true', help='Fetch and save but do not load to database')
     args = parser.parse_args()
 
-    with JobRunLogger('run_newyorkfed_soma_holdings', CONFIG_NAME, args.dry_run) as job_log:
-        step_id = job_log.begin_step('data_collection', 'Data Collection')
-        try:
-            client = NewYorkFedAPIClient()
-            try:
-                raw_data = client.get_soma_holdings()
-            finally:
-                client.close()
-            if not raw_data:
-                job_log.complete_step(step_id, records_in=0, records_out=0, message="No data from API")
-                return 0
-            transformed = transform(raw_data)
-            if not transformed:
-                job_log.complete_step(step_id, records_in=len(raw_data), records_out=0, message="No records after transform")
-                return 0
-            save_json(transformed, CONFIG_NAME, source='newyorkfed')
-            job_log.complete_step(step_id, records_in=len(raw_data), records_out=len(transformed))
-        except Exception as e:
-            job_log.fail_step(step_id, str(e))
-            return 1
-
-        return run_generic_import(CONFIG_NAME, args.dry_run, job_run_logger=job_log)
+    return run(args.dry_run)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,9 @@
 """PostgreSQL data loader with bulk insert support."""
 
-from typing import List, Dict, Any, Tuple
-from common.db_utils import bulk_insert, db_transaction
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+from psycopg2 import extras
+from common.config import get_config
+from common.db_utils import bulk_insert, copy_insert, db_transaction
 from common.logging_utils import get_logger
 
 
@@ -11,8 +13,9 @@ class PostgresLoader:
 
     Features:
     - Bulk insert using execute_values
+    - Streaming bulk load using COPY FROM STDIN
     - Transaction management
-    - Upsert support (INSERT ... ON CONFLICT)
+    - Batched upsert support (INSERT ... ON CONFLICT)
     - Automatic schema handling
     """
 
@@ -49,36 +52,81 @@ class PostgresLoader:
             self.logger.warning(f"No data to load into {self.schema}.{table}")
             return 0
 
-        # Add datasetid to each record
-        data_with_dataset = [
-            {**record, 'datasetid': dataset_id}
-            for record in data
-        ]
-
-        # Infer columns from first record if not provided
-        if columns is None:
-            columns = list(data_with_dataset[0].keys())
-        else:
-            # Ensure datasetid is in columns
-            if 'datasetid' not in columns:
-                columns = ['datasetid'] + columns
-
-        # Convert dicts to tuples in correct column order
-        values = [
-            tuple(record.get(col) for col in columns)
-            for record in data_with_dataset
-        ]
+        columns, values = self._build_rows(data, dataset_id, columns)
 
         rows_inserted = bulk_insert(
             table=table,
             columns=columns,
-            values=values,
+            values=list(values),
             schema=self.schema
         )
 
         self.logger.info(f"Loaded {rows_inserted} rows into {self.schema}.{table} (dataset_id={dataset_id})")
         return rows_inserted
 
+    def load_copy(
+        self,
+        table: str,
+        data: List[Dict[str, Any]],
+        dataset_id: int,
+        columns: Optional[List[str]] = None
+    ) -> int:
+        """
+        Load data into table using COPY FROM STDIN with datasetid.
+
+        Same contract as load(), but rows are streamed to the server in COPY
+        text format instead of being sent as INSERT statements, avoiding
+        per-statement parse/plan work and building no intermediate row list.
+
+        Args:
+            table: Table name
+            data: List of dictionaries to insert
+            dataset_id: Dataset ID from dba.tdataset to link this data to
+            columns: Column names (inferred from first record if not provided)
+
+        Returns:
+            Number of rows inserted
+        """
+        if not data:
+            self.logger.warning(f"No data to load into {self.schema}.{table}")
+            return 0
+
+        columns, values = self._build_rows(data, dataset_id, columns)
+
+        rows_inserted = copy_insert(
+            table=table,
+            columns=columns,
+            values=values,
+            schema=self.schema
+        )
+
+        self.logger.info(f"Copied {rows_inserted} rows into {self.schema}.{table} (dataset_id={dataset_id})")
+        return rows_inserted
+
+    def _build_rows(
+        self,
+        data: List[Dict[str, Any]],
+        dataset_id: int,
+        columns: Optional[List[str]] = None
+    ) -> Tuple[List[str], Iterator[Tuple]]:
+        """
+        Resolve column order and return a lazy iterator of row tuples.
+
+        datasetid always comes first; data columns follow in the given order,
+        or the first record's key order if columns is None.
+        """
+        if columns is None:
+            columns = list(data[0].keys())
+        data_columns = [col for col in columns if col != 'datasetid']
+
+        # Build row tuples straight from the source dicts; datasetid is prepended
+        # rather than copying every record to add it
+        values = (
+            (dataset_id, *map(record.get, data_columns))
+            for record in data
+        )
+        return ['datasetid', *data_columns], values
+
     def upsert(
         self,
         table: str,
@@ -107,8 +155,8 @@ class PostgresLoader:
         if update_columns is None:
             update_columns = [col for col in columns if col not in conflict_columns]
 
-        # Build upsert query
-        placeholders = ', '.join(['%s'] * len(columns))
+        # Build upsert query; execute_values expands VALUES %s into one
+        # multi-row statement per page instead of one statement per record
         conflict_clause = ', '.join(conflict_columns)
         update_clause = ', '.join([
             f"{col} = EXCLUDED.{col}" for col in update_columns
@@ -116,18 +164,37 @@ class PostgresLoader:
 
         query = f"""
             INSERT INTO {self.schema}.{table} ({', '.join(columns)})
-            VALUES ({placeholders})
+            VALUES %s
             ON CONFLICT ({conflict_clause})
             DO UPDATE SET {update_clause}
+            RETURNING 1
         """
 
-        # Convert to tuples
-        values = [tuple(record.get(col) for col in columns) for record in data]
-
-        # Execute
-        with db_transaction() as cursor:
-            cursor.executemany(query, values)
-            rows_affected = cursor.rowcount
+        # One statement can't update the same row twice, so a record whose
+        # conflict key was already seen goes into a later statement. Running
+        # the statements in order gives the row-by-row result for any
+        # update_columns. Keys containing NULL never conflict in Postgres, so
+        # those rows all go in the first statement
+        statements: List[List[Tuple]] = [[]]
+        seen: Dict[Tuple, int] = {}
+        for record in data:
+            index = 0
+            key = tuple(record.get(col) for col in conflict_columns)
+            if None not in key:
+                index = seen.get(key, 0)
+                seen[key] = index + 1
+                if index == len(statements):
+                    statements.append([])
+            statements[index].append(tuple(record.get(col) for col in columns))
+
+        # Execute; RETURNING counts rows across all pages (rowcount is per page)
+        rows_affected = 0
+        with db_transaction(dict_cursor=False) as cursor:
+            for values in statements:
+                returned = extras.execute_values(
+                    cursor, query, values, page_size=get_config().etl.batch_size, fetch=True
+                )
+                rows_affected += len(returned)
 
         self.logger.info(f"Upserted {rows_affected} rows into {self.schema}.{table}")
         return rows_affected
@@ -178,6 +178,17 @@ class TestOtherTransforms:
         assert transformed[0]['swap_date'] == '2026-02-04'
         assert transformed[0]['currency_code'] == 'JPY'
 
+    def test_agency_mbs_share_one_timestamp(self):
+        """All records in a batch should carry the same created_date"""
+        data = [
+            {'operationDate': '2026-02-04', 'cusip': f'31418{i:04d}', 'operationAmount': 100}
+            for i in range(50)
+        ]
+        transformed = transform_agency_mbs(data)
+        assert len(transformed) == 50
+        assert len({r['created_date'] for r in transformed}) == 1
+        assert transformed[0]['created_by'] == 'etl_user'
+
     def test_counterparties_skip_empty(self):
         """Should skip records with no counterparty name"""
         data = [
@@ -229,6 +240,23 @@ class TestOtherTransforms:
         assert transformed[0]['guide_type'] == 'FR 2004SI Guide Sheet'
         assert transformed[0]['security_type'] == 'T-Note'
 
+    def test_guide_sheets_missing_detail_fields(self):
+        """Missing detail fields should map to None rather than drop the record"""
+        data = [
+            {
+                'reportWeeksFromDate': '2026-02-03',
+                'details': [
+                    {'secType': 'T-Bill', 'cusip': '912797AA1', 'maturityDate': '2026-05-07'},
+                ]
+            }
+        ]
+        transformed = transform_guide_sheets(data)
+        assert len(transformed) == 1
+        assert transformed[0]['guide_type'] == 'SI'
+        assert transformed[0]['issue_date'] is None
+        assert transformed[0]['maturity_date'] == '2026-05-07'
+        assert transformed[0]['coupon_rate'] is None
+
     def test_soma_holdings_comma_stripping(self):
         """Should strip commas from numeric values"""
         data = [
@@ -0,0 +1,1284 @@
+"""Unit tests for generic_import.py
+
+Tests the pure-Python parts of the generic importer including:
+- SchemaManager DDL generation
+- File extractors
+- Date format conversion
+- Label and date extraction
+- File discovery
+- File archiving
+- Multi-file extraction
+- Transform
+- Column name normalization
+- Import strategies
+- Loading
+- Reference data creation
+- Config loading
+"""
+
+import errno
+import json
+import mmap
+import os
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from etl.jobs.generic_import import (
+    CSVExtractor,
+    ExcelExtractor,
+    GenericImportJob,
+    ImportConfig,
+    ImportStrategy,
+    JSONExtractor,
+    SchemaManager,
+    XMLExtractor,
+    _java_to_strptime,
+    _parse_date_string,
+    _regex_literal_prefix,
+)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def schema_manager():
+    """Create SchemaManager with a mock logger"""
+    return SchemaManager(logger=MagicMock())
+
+
+@pytest.fixture
+def import_config(tmp_path):
+    """CSV import config pointing at a temp source directory"""
+    return ImportConfig(
+        config_id=1,
+        config_name='UnitTest_CSV',
+        datasource='UnitTest',
+        datasettype='Test',
+        source_directory=str(tmp_path / 'source'),
+        archive_directory=str(tmp_path / 'archive'),
+        file_pattern=r'unittest_.*\.csv',
+        file_type='CSV',
+        metadata_label_source='filename',
+        metadata_label_location='1',
+        dateconfig='filename',
+        datelocation='2',
+        dateformat='yyyyMMdd',
+        delimiter='_',
+        target_table='feeds.unittest',
+        importstrategyid=1,
+        is_active=True,
+        is_blob=False,
+    )
+
+
+@pytest.fixture
+def bare_job(import_config):
+    """GenericImportJob without __init__ (no config/database lookups)"""
+    job = GenericImportJob.__new__(GenericImportJob)
+    job.logger = MagicMock()
+    job.run_started_at = None
+    job.import_config = import_config
+    job.matched_files = []
+    job._load_columns = None
+    job._label_cache = {}
+    job._date_cache = {}
+    job._matched_files_cache = None
+    job._first_file_records = None
+    job._extractor = None
+    job._preloaded = None
+    job._pending_write = None
+    job.schema_manager = SchemaManager(logger=MagicMock())
+    return job
+
+
+@pytest.fixture
+def mock_cursor():
+    """Patch db_transaction and yield the cursor it hands out"""
+    cursor = MagicMock()
+    with patch('etl.jobs.generic_import.db_transaction') as mock_tx:
+        mock_tx.return_value.__enter__.return_value = cursor
+        yield cursor
+
+
+# ============================================================================
+# TEST SchemaManager
+# ============================================================================
+
+@pytest.mark.unit
+class TestSchemaManagerAddColumns:
+    """Tests for SchemaManager.add_columns"""
+
+    def test_single_statement_for_many_columns(self, schema_manager, mock_cursor):
+        """All new columns should be added with one ALTER TABLE"""
+        schema_manager.add_columns('feeds', 'products', ['Price', 'qty', 'Order Date'])
+
+        mock_cursor.execute.assert_called_once_with(
+            'ALTER TABLE feeds.products '
+            'ADD COLUMN IF NOT EXISTS "price" TEXT, '
+            'ADD COLUMN IF NOT EXISTS "qty" TEXT, '
+            'ADD COLUMN IF NOT EXISTS "order_date" TEXT'
+        )
+
+    def test_per_column_types(self, schema_manager, mock_cursor):
+        """column_types should override the default type for named columns"""
+        schema_manager.add_columns(
+            'feeds', 'products', ['Price', 'qty', 'note'],
+            column_types={'Price': 'NUMERIC(12,2)', 'qty': 'INTEGER'}
+        )
+
+        mock_cursor.execute.assert_called_once_with(
+            'ALTER TABLE feeds.products '
+            'ADD COLUMN IF NOT EXISTS "price" NUMERIC(12,2), '
+            'ADD COLUMN IF NOT EXISTS "qty" INTEGER, '
+            'ADD COLUMN IF NOT EXISTS "note" TEXT'
+        )
+
+    def test_no_columns_is_noop(self, schema_manager, mock_cursor):
+        """An empty column list should not touch the database"""
+        schema_manager.add_columns('feeds', 'products', [])
+        mock_cursor.execute.assert_not_called()
+
+    def test_add_column_delegates(self, schema_manager, mock_cursor):
+        """add_column should issue the same DDL as add_columns"""
+        schema_manager.add_column('feeds', 'products', 'price', 'NUMERIC')
+        mock_cursor.execute.assert_called_once_with(
+            'ALTER TABLE feeds.products ADD COLUMN IF NOT EXISTS "price" NUMERIC'
+        )
+
+
+@pytest.mark.unit
+class TestSanitizeIdentifier:
+    """Tests for SchemaManager._sanitize_identifier"""
+
+    @pytest.mark.parametrize('name, expected', [
+        ('Order Date', 'order_date'),
+        ('Unit Price ($)', 'unit_price'),
+        ('customer--id', 'customer_id'),
+        ('__Total__Amount__', 'total_amount'),
+        ('2024 Sales', 'col_2024_sales'),
+        ('Café Größe', 'café_größe'),
+        ('rate%/day', 'rate_day'),
+    ])
+    def test_sanitize(self, schema_manager, name, expected):
+        """Names should be lowercased with non-word runs collapsed to one underscore"""
+        assert schema_manager._sanitize_identifier(name) == expected
+
+
+@pytest.mark.unit
+class TestSchemaManagerColumnCache:
+    """Tests for SchemaManager column caching"""
+
+    def test_columns_fetched_once(self, schema_manager):
+        """Repeated lookups should hit information_schema only once"""
+        with patch('etl.jobs.generic_import.fetch_dict',
+                   return_value=[{'column_name': 'id'}, {'column_name': 'name'}]) as mock_fetch:
+            assert schema_manager.get_table_columns('feeds', 'products') == ['id', 'name']
+            assert schema_manager.get_table_columns('feeds', 'products') == ['id', 'name']
+            assert schema_manager.table_exists('feeds', 'products') is True
+
+        mock_fetch.assert_called_once()
+
+    def test_add_columns_updates_cache(self, schema_manager, mock_cursor):
+        """Columns we add should appear without re-querying"""
+        with patch('etl.jobs.generic_import.fetch_dict',
+                   return_value=[{'column_name': 'id'}]) as mock_fetch:
+            schema_manager.get_table_columns('feeds', 'products')
+            schema_manager.add_columns('feeds', 'products', ['price', 'id'])
+            columns = schema_manager.get_table_columns('feeds', 'products')
+
+        assert columns == ['id', 'price']
+        mock_fetch.assert_called_once()
+
+    def test_invalidate(self, schema_manager):
+        """Invalidated tables should be re-read; no arguments clears everything"""
+        with patch('etl.jobs.generic_import.fetch_dict',
+                   return_value=[{'column_name': 'id'}]) as mock_fetch:
+            schema_manager.get_table_columns('feeds', 'products')
+            schema_manager.get_table_columns('feeds', 'orders')
+            schema_manager.invalidate('feeds', 'products')
+            schema_manager.get_table_columns('feeds', 'products')
+            schema_manager.get_table_columns('feeds', 'orders')
+            schema_manager.invalidate()
+            schema_manager.get_table_columns('feeds', 'orders')
+
+        assert mock_fetch.call_count == 4
+
+    def test_created_table_columns_cached(self, schema_manager, mock_cursor):
+        """Columns of a table we just created should not need a query"""
+        records = [{'Name': 'SOFR', 'Rate': '5.31', 'created_by': 'etl', 'source_file': 'f.csv'}]
+
+        with patch('etl.jobs.generic_import.fetch_dict') as mock_fetch:
+            schema_manager.create_table_from_records('feeds', 'Rates', records)
+            columns = schema_manager.get_table_columns('feeds', 'Rates')
+
+        mock_fetch.assert_not_called()
+        assert columns == ['ratesid', 'datasetid', 'name', 'rate', 'created_date', 'created_by']
+
+
+@pytest.mark.unit
+class TestInferColumnType:
+    """Tests for SchemaManager._infer_column_type"""
+
+    @pytest.mark.parametrize('values, expected', [
+        ([], 'TEXT'),
+        ([None, '', None], 'TEXT'),
+        (['1', '2', '-50'], 'INTEGER'),
+        ([1, '2', None], 'INTEGER'),
+        (['1', '3000000000'], 'BIGINT'),
+        ([-3000000000], 'BIGINT'),
+        (['1', '2.5', 'abc'], 'NUMERIC(12,2)'),
+        ([1.0, '2.00'], 'INTEGER'),
+        (['true', 'F', True], 'BOOLEAN'),
+        (['true', '1'], 'INTEGER'),
+        (['abc', 'def'], 'VARCHAR(50)'),
+        (['x' * 80], 'VARCHAR(100)'),
+        (['x' * 200, 'short'], 'VARCHAR(255)'),
+        (['x' * 300], 'TEXT'),
+    ])
+    def test_infer(self, schema_manager, values, expected):
+        """Sample values should map to the narrowest fitting PostgreSQL type"""
+        assert schema_manager._infer_column_type(values) == expected
+
+
+@pytest.mark.unit
+class TestCreateBlobTable:
+    """Tests for blob table creation in SchemaManager.create_table_from_records"""
+
+    @pytest.mark.parametrize('raw_data, expected', [
+        ('<?xml version="1.0" encoding="UTF-8"?><root><a>1</a></root>', 'raw_data XML'),
+        ('<?xml version="1.0"?><root><a>1</root>', 'raw_data TEXT'),
+        ('{"rates": [1, 2]}', 'raw_data JSONB'),
+        ('{not json', 'raw_data TEXT'),
+        ('plain text', 'raw_data TEXT'),
+    ])
+    def test_blob_type_detected(self, schema_manager, mock_cursor, raw_data, expected):
+        """The raw_data column type should follow the blob's content"""
+        schema_manager.create_table_from_records(
+            'feeds', 'blobs', [{'raw_data': raw_data, 'source_file': 'f', 'created_by': 'etl'}]
+        )
+
+        create_sql = mock_cursor.execute.call_args_list[0].args[0]
+        assert expected in create_sql
+
+
+# ============================================================================
+# TEST CSVExtractor
+# ============================================================================
+
+@pytest.mark.unit
+class TestCSVExtractor:
+    """Tests for CSVExtractor"""
+
+    def test_bom_and_crlf_handled(self, tmp_path):
+        """UTF-8 BOM should be stripped and CRLF line endings handled"""
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_bytes(b'\xef\xbb\xbfname,value\r\nSOFR,5.31\r\nEFFR,5.33\r\n')
+
+        records = CSVExtractor().extract(csv_file)
+
+        assert records == [{'name': 'SOFR', 'value': '5.31'}, {'name': 'EFFR', 'value': '5.33'}]
+
+    def test_ragged_rows(self, tmp_path):
+        """Short rows pad with None, extra fields collect under None, blank lines skip"""
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('name,value\nSOFR\n\nEFFR,5.33,extra\n')
+
+        records = CSVExtractor().extract(csv_file)
+
+        assert records == [
+            {'name': 'SOFR', 'value': None},
+            {'name': 'EFFR', 'value': '5.33', None: ['extra']},
+        ]
+        assert all(type(record) is dict for record in records)
+
+    def test_quoted_newline_preserved(self, tmp_path):
+        """Newlines inside quoted fields should stay inside the field"""
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_bytes(b'name,note\r\nSOFR,"line one\r\nline two"\r\n')
+
+        records = CSVExtractor().extract(csv_file)
+
+        assert records == [{'name': 'SOFR', 'note': 'line one\r\nline two'}]
+
+
+# ============================================================================
+# TEST ExcelExtractor
+# ============================================================================
+
+@pytest.mark.unit
+class TestExcelExtractor:
+    """Tests for ExcelExtractor"""
+
+    def test_xlsx_rows_become_records(self, tmp_path):
+        """Header row should key each data row; blank headers get placeholders"""
+        from openpyxl import Workbook
+        wb = Workbook()
+        ws = wb.active
+        ws.append(['Name', None, 'Rate'])
+        ws.append(['SOFR', 'x', 5.31])
+        ws.append(['EFFR', None, 5.33])
+        xlsx_file = tmp_path / 'rates.xlsx'
+        wb.save(xlsx_file)
+
+        records = ExcelExtractor(file_type='XLSX').extract(xlsx_file)
+
+        assert records == [
+            {'Name': 'SOFR', 'column_1': 'x', 'Rate': 5.31},
+            {'Name': 'EFFR', 'column_1': None, 'Rate': 5.33},
+        ]
+
+    def test_xlsx_empty_sheet(self, tmp_path):
+        """An empty sheet should produce no records"""
+        from openpyxl import Workbook
+        xlsx_file = tmp_path / 'empty.xlsx'
+        Workbook().save(xlsx_file)
+
+        assert ExcelExtractor(file_type='XLSX').extract(xlsx_file) == []
+
+    def test_xls_rows_become_records(self, tmp_path):
+        """Legacy XLS sheets should produce the same record shape"""
+        xlwt = pytest.importorskip('xlwt')
+        wb = xlwt.Workbook()
+        ws = wb.add_sheet('Sheet1')
+        for row_idx, row in enumerate([['Name', 'Rate'], ['SOFR', 5.31]]):
+            for col_idx, value in enumerate(row):
+                ws.write(row_idx, col_idx, value)
+        xls_file = tmp_path / 'rates.xls'
+        wb.save(str(xls_file))
+
+        records = ExcelExtractor(file_type='XLS').extract(xls_file)
+
+        assert records == [{'Name': 'SOFR', 'Rate': 5.31}]
+
+
+# ============================================================================
+# TEST JSONExtractor
+# ============================================================================
+
+@pytest.mark.unit
+class TestJSONExtractor:
+    """Tests for JSONExtractor"""
+
+    def test_array_returned_as_records(self, tmp_path):
+        """A top-level array should be returned record-for-record"""
+        json_file = tmp_path / 'rates.json'
+        json_file.write_text('[{"name": "SOFR", "rate": 5.31}, {"name": "EFFR", "rate": 5.33}]')
+
+        records = JSONExtractor().extract(json_file)
+
+        assert records == [{'name': 'SOFR', 'rate': 5.31}, {'name': 'EFFR', 'rate': 5.33}]
+
+    def test_large_file_memory_mapped(self, tmp_path):
+        """Files over the mmap threshold should decode the same, including NaN fallback"""
+        json_file = tmp_path / 'rates.json'
+        json_file.write_text('[{"name": "SOFR", "rate": 5.31}, {"name": "EFFR", "rate": NaN}]')
+
+        with patch('etl.jobs.generic_import._MMAP_MIN_BYTES', 1), \
+                patch('etl.jobs.generic_import.mmap.mmap', wraps=mmap.mmap) as mock_mmap:
+            records = JSONExtractor().extract(json_file)
+
+        mock_mmap.assert_called_once()
+        assert records[0] == {'name': 'SOFR', 'rate': 5.31}
+        assert records[1]['name'] == 'EFFR'
+
+    def test_empty_file_not_mapped(self, tmp_path):
+        """Empty files cannot be mapped and should fail as invalid JSON"""
+        json_file = tmp_path / 'empty.json'
+        json_file.write_bytes(b'')
+
+        with patch('etl.jobs.generic_import._MMAP_MIN_BYTES', 0), \
+                patch('etl.jobs.generic_import.mmap.mmap') as mock_mmap, \
+                pytest.raises(json.JSONDecodeError):
+            JSONExtractor().extract(json_file)
+
+        mock_mmap.assert_not_called()
+
+    def test_non_standard_literals_still_parse(self, tmp_path):
+        """NaN literals (accepted by stdlib json) should not break extraction"""
+        json_file = tmp_path / 'rates.json'
+        json_file.write_text('[{"name": "SOFR", "rate": NaN}]')
+
+        records = JSONExtractor().extract(json_file)
+
+        assert records[0]['name'] == 'SOFR'
+        assert records[0]['rate'] != records[0]['rate']  # NaN
+
+    def test_object_wrapped_as_blob(self, tmp_path):
+        """A top-level object should be wrapped as a raw_data record"""
+        json_file = tmp_path / 'doc.json'
+        json_file.write_text('{"a": 1}')
+
+        records = JSONExtractor().extract(json_file)
+
+        assert len(records) == 1
+        assert json.loads(records[0]['raw_data']) == {'a': 1}
+        assert records[0]['source_file'] == 'doc.json'
+
+    def test_blob_mode_round_trips(self, tmp_path):
+        """Blob mode should re-serialize the document losslessly"""
+        document = {'rates': [{'name': 'SOFR', 'rate': 5.31}], 'big': 2 ** 70, 'text': 'naïve'}
+        json_file = tmp_path / 'doc.json'
+        json_file.write_text(json.dumps(document))
+
+        records = JSONExtractor(is_blob=True).extract(json_file)
+
+        assert json.loads(records[0]['raw_data']) == document
+
+
+# ============================================================================
+# TEST XMLExtractor
+# ============================================================================
+
+@pytest.mark.unit
+class TestXMLExtractor:
+    """Tests for XMLExtractor"""
+
+    def test_children_of_root_become_records(self, tmp_path):
+        """Each child of the root should become one record"""
+        xml_file = tmp_path / 'rates.xml'
+        xml_file.write_text(
+            '<?xml version="1.0"?>\n'
+            '<rates>\n'
+            '  <!-- daily feed -->\n'
+            '  <rate><name>SOFR</name><value>5.31</value></rate>\n'
+            '  <rate><name>EFFR</name><!-- note --><value>5.33</value></rate>\n'
+            '</rates>\n'
+        )
+
+        records = XMLExtractor().extract(xml_file)
+
+        assert records == [
+            {'name': 'SOFR', 'value': '5.31'},
+            {'name': 'EFFR', 'value': '5.33'},
+        ]
+
+    def test_malformed_xml_falls_back_to_blob(self, tmp_path):
+        """Unparseable XML should be loaded as a single raw_data record"""
+        xml_file = tmp_path / 'broken.xml'
+        xml_file.write_text('<rates><rate>')
+
+        records = XMLExtractor().extract(xml_file)
+
+        assert records == [{'raw_data': '<rates><rate>', 'source_file': 'broken.xml'}]
+
+    def test_flat_xml_falls_back_to_blob(self, tmp_path):
+        """XML without record-shaped children should be loaded as a blob"""
+        content = '<doc><title>Report</title></doc>'
+        xml_file = tmp_path / 'doc.xml'
+        xml_file.write_text(content)
+
+        records = XMLExtractor().extract(xml_file)
+
+        assert records == [{'raw_data': content, 'source_file': 'doc.xml'}]
+
+
+# ============================================================================
+# TEST Date Format Conversion
+# ============================================================================
+
+@pytest.mark.unit
+class TestDateFormatConversion:
+    """Tests for Java-style to strptime date format conversion"""
+
+    @pytest.mark.parametrize('java_fmt, py_fmt', [
+        ('yyyyMMdd', '%Y%m%d'),
+        ('yyyy-MM-dd', '%Y-%m-%d'),
+        ('dd/MM/yyyy', '%d/%m/%Y'),
+        ('MM-dd-yy', '%m-%d-%y'),
+        ('yyyy-MM-ddTHH:mm:ss', '%Y-%m-%dT%H:%M:%S'),
+        ("yyyy-MM-dd'T'HH:mm:ss", '%Y-%m-%dT%H:%M:%S'),
+        ("dd 'of' MM yyyy", '%d of %m %Y'),
+        ("HH'h'mm", '%Hh%M'),
+        ("yyyy''MM", "%Y'%m"),
+        ('yyyyMMdd%', '%Y%m%d%%'),
+    ])
+    def test_conversion(self, java_fmt, py_fmt):
+        """Java tokens should map to their strptime directives"""
+        assert _java_to_strptime(java_fmt) == py_fmt
+
+    def test_quoted_literal_parses(self):
+        """A converted format with a quoted literal should parse real dates"""
+        py_fmt = _java_to_strptime("yyyy-MM-dd'T'HH:mm:ss")
+        assert _parse_date_string('2026-01-15T09:30:00', py_fmt) == date(2026, 1, 15)
+
+    def test_parse_date_string(self):
+        """Parsed dates should be returned as date objects"""
+        assert _parse_date_string('20260115', '%Y%m%d') == date(2026, 1, 15)
+
+    def test_parse_date_string_invalid(self):
+        """Invalid dates should raise ValueError (and not be cached)"""
+        with pytest.raises(ValueError):
+            _parse_date_string('20261345', '%Y%m%d')
+
+    @pytest.mark.parametrize('date_str, py_fmt, expected', [
+        ('2026-01-15', '%Y-%m-%d', date(2026, 1, 15)),
+        ('2026-1-5', '%Y-%m-%d', date(2026, 1, 5)),
+        ('20260115', '%Y%m%d', date(2026, 1, 15)),
+        ('2026115', '%Y%m%d', date(2026, 11, 5)),
+        ('15/01/2026', '%d/%m/%Y', date(2026, 1, 15)),
+    ])
+    def test_fast_paths_match_strptime(self, date_str, py_fmt, expected):
+        """Fast-path formats should agree with strptime, including unpadded input"""
+        assert _parse_date_string(date_str, py_fmt) == expected
+
+    @pytest.mark.parametrize('date_str, py_fmt', [
+        ('2026-02-30', '%Y-%m-%d'),
+        ('2026-0a-15', '%Y-%m-%d'),
+        ('20260230', '%Y%m%d'),
+    ])
+    def test_fast_paths_reject_invalid(self, date_str, py_fmt):
+        """Invalid dates should raise ValueError on the fast paths too"""
+        with pytest.raises(ValueError):
+            _parse_date_string(date_str, py_fmt)
+
+
+# ============================================================================
+# TEST Label and Date Extraction
+# ============================================================================
+
+@pytest.mark.unit
+class TestLabelAndDateExtraction:
+    """Tests for config-derived values and per-file label/date caching"""
+
+    def test_part_indexes_parsed_once(self, import_config):
+        """Filename part locations should be parsed when the config is built"""
+        assert import_config.label_part_index == 1
+        assert import_config.date_part_index == 2
+
+    @pytest.mark.parametrize('target_table, schema, table', [
+        ('feeds.unittest', 'feeds', 'unittest'),
+        ('staging.rates', 'staging', 'rates'),
+        ('unittest', 'feeds', 'unittest'),
+    ])
+    def test_target_table_parsed_once(self, import_config, bare_job, target_table, schema, table):
+        """target_table should be split into schema and table at config load"""
+        import_config.target_table = target_table
+        import_config.__post_init__()
+
+        assert bare_job._get_target_schema() == schema
+        assert bare_job._get_target_table() == table
+
+    def test_filename_label_and_date(self, bare_job, tmp_path):
+        """Label and date should come from the configured filename parts"""
+        file_path = tmp_path / 'unittest_alpha_20260115.csv'
+
+        assert bare_job._extract_metadata_label(file_path, []) == 'alpha'
+        assert bare_job._extract_date(file_path, []) == date(2026, 1, 15)
+
+    def test_filename_results_cached_per_file(self, bare_job, tmp_path):
+        """Repeat lookups for a file should not re-split or re-parse"""
+        file_path = tmp_path / 'unittest_alpha_20260115.csv'
+        bare_job._extract_metadata_label(file_path, [])
+        bare_job._extract_date(file_path, [])
+
+        with patch.object(bare_job, '_filename_part') as mock_part:
+            assert bare_job._extract_metadata_label(file_path, []) == 'alpha'
+            assert bare_job._extract_date(file_path, []) == date(2026, 1, 15)
+        mock_part.assert_not_called()
+
+    def test_non_numeric_location_falls_back_to_stem(self, bare_job, import_config, tmp_path):
+        """A location that is not an index should label the file by its stem"""
+        import_config.metadata_label_location = 'first'
+        import_config.__post_init__()
+        file_path = tmp_path / 'unittest_alpha_20260115.csv'
+
+        assert bare_job._extract_metadata_label(file_path, []) == 'unittest_alpha_20260115'
+
+    def test_file_content_not_cached(self, bare_job, import_config, tmp_path):
+        """file_content values should be read from each call's records"""
+        import_config.metadata_label_source = 'file_content'
+        import_config.metadata_label_location = 'desk'
+        file_path = tmp_path / 'unittest_alpha_20260115.csv'
+
+        assert bare_job._extract_metadata_label(file_path, [{'desk': 'rates'}]) == 'rates'
+        assert bare_job._extract_metadata_label(file_path, [{'desk': 'fx'}]) == 'fx'
+
+
+# ============================================================================
+# TEST File Discovery
+# ============================================================================
+
+@pytest.mark.unit
+class TestFindMatchingFiles:
+    """Tests for GenericImportJob._find_matching_files"""
+
+    def test_regex_matches_files_only(self, bare_job, tmp_path):
+        """Only regular files whose names match the pattern should be returned, sorted"""
+        source = tmp_path / 'source'
+        source.mkdir()
+        (source / 'unittest_b_20260102.csv').write_text('x')
+        (source / 'unittest_a_20260101.csv').write_text('x')
+        (source / 'other_20260101.csv').write_text('x')
+        (source / 'unittest_dir.csv').mkdir()
+
+        matched = bare_job._find_matching_files()
+
+        assert [p.name for p in matched] == ['unittest_a_20260101.csv', 'unittest_b_20260102.csv']
+
+    def test_symlinked_file_matches(self, bare_job, tmp_path):
+        """Symlinks to regular files should match, as Path.is_file() follows them"""
+        source = tmp_path / 'source'
+        source.mkdir()
+        target = tmp_path / 'real.csv'
+        target.write_text('x')
+        (source / 'unittest_link_20260101.csv').symlink_to(target)
+
+        matched = bare_job._find_matching_files()
+
+        assert matched == [source / 'unittest_link_20260101.csv']
+
+    def test_scan_cached_per_run(self, bare_job, tmp_path):
+        """A second lookup should reuse the first scan"""
+        source = tmp_path / 'source'
+        source.mkdir()
+        (source / 'unittest_a_20260101.csv').write_text('x')
+
+        first = bare_job._find_matching_files()
+        with patch('etl.jobs.generic_import.os.scandir') as mock_scandir:
+            second = bare_job._find_matching_files()
+
+        mock_scandir.assert_not_called()
+        assert second == first
+
+    def test_missing_directory(self, bare_job):
+        """A missing source directory should return no files"""
+        assert bare_job._find_matching_files() == []
+
+    def test_literal_pattern_is_prefix_match(self, bare_job, import_config, tmp_path):
+        """A regex without metacharacters should still match by prefix, like re.match"""
+        import_config.file_pattern = r'unittest_a\.csv'
+        source = tmp_path / 'source'
+        source.mkdir()
+        (source / 'unittest_a.csv').write_text('x')
+        (source / 'unittest_a.csv.bak').write_text('x')
+        (source / 'unittest_b.csv').write_text('x')
+
+        matched = bare_job._find_matching_files()
+
+        assert [p.name for p in matched] == ['unittest_a.csv', 'unittest_a.csv.bak']
+
+    @pytest.mark.parametrize('pattern, expected', [
+        (r'unittest_.*\.csv', ('unittest_', False)),
+        (r'report\.csv', ('report.csv', True)),
+        (r'report\.csv$', ('report.csv', False)),
+        (r'rates?_\d+', ('rate', False)),
+        (r'a+b', ('a', False)),
+        (r'\d{8}_rates', ('', False)),
+        (r'rates_(usd|eur)', ('', False)),
+        (r'(?i)rates', ('', False)),
+    ])
+    def test_regex_literal_prefix(self, pattern, expected):
+        """Only text every match must start with should be taken as the prefix"""
+        assert _regex_literal_prefix(pattern) == expected
+
+
+# ============================================================================
+# TEST File Archiving
+# ============================================================================
+
+@pytest.mark.unit
+class TestArchiveFile:
+    """Tests for GenericImportJob._archive_file and cleanup archiving"""
+
+    def test_moves_file(self, bare_job, tmp_path):
+        """File should end up in the archive under its own name"""
+        archive = tmp_path / 'archive'
+        archive.mkdir()
+        src = tmp_path / 'data.csv'
+        src.write_text('a,b\n')
+
+        dest = bare_job._archive_file(src, archive)
+
+        assert dest == archive / 'data.csv'
+        assert dest.read_text() == 'a,b\n'
+        assert not src.exists()
+
+    def test_collision_gets_numeric_suffix(self, bare_job, tmp_path):
+        """Existing archive files should never be overwritten"""
+        archive = tmp_path / 'archive'
+        archive.mkdir()
+        (archive / 'data.csv').write_text('old')
+        (archive / 'data_1.csv').write_text('older')
+        src = tmp_path / 'data.csv'
+        src.write_text('new')
+
+        dest = bare_job._archive_file(src, archive)
+
+        assert dest == archive / 'data_2.csv'
+        assert dest.read_text() == 'new'
+        assert (archive / 'data.csv').read_text() == 'old'
+
+    def test_cross_device_falls_back_to_move(self, bare_job, tmp_path):
+        """Hard-link failures (e.g. EXDEV) should fall back to shutil.move"""
+        archive = tmp_path / 'archive'
+        archive.mkdir()
+        (archive / 'data.csv').write_text('old')
+        src = tmp_path / 'data.csv'
+        src.write_text('new')
+
+        with patch('etl.jobs.generic_import.os.link',
+                   side_effect=OSError(errno.EXDEV, 'Invalid cross-device link')):
+            dest = bare_job._archive_file(src, archive)
+
+        assert dest == archive / 'data_1.csv'
+        assert dest.read_text() == 'new'
+        assert not src.exists()
+
+    def test_known_names_skipped_without_probing(self, bare_job, tmp_path):
+        """Names in the scanned set should be skipped before any link attempt"""
+        archive = tmp_path / 'archive'
+        archive.mkdir()
+        (archive / 'data.csv').write_text('old')
+        (archive / 'data_1.csv').write_text('older')
+        src = tmp_path / 'data.csv'
+        src.write_text('new')
+        existing = {'data.csv', 'data_1.csv'}
+
+        name = bare_job._reserve_archive_name(src, existing)
+        with patch('etl.jobs.generic_import.os.link', wraps=os.link) as mock_link:
+            dest = bare_job._archive_file(src, archive, name)
+
+        assert dest == archive / 'data_2.csv'
+        assert mock_link.call_count == 1
+        assert 'data_2.csv' in existing
+
+    def test_cleanup_archives_same_named_files(self, bare_job, tmp_path):
+        """Files sharing a name should all be archived under distinct names"""
+        archive = tmp_path / 'archive'
+        archive.mkdir()
+        (archive / 'data.csv').write_text('old')
+        bare_job.import_config.archive_directory = str(archive)
+        bare_job.config_id = 1
+        sources = []
+        for sub in ('a', 'b'):
+            (tmp_path / sub).mkdir()
+            src = tmp_path / sub / 'data.csv'
+            src.write_text(sub)
+            sources.append(src)
+        bare_job.matched_files = sources
+
+        with patch('etl.jobs.generic_import.db_transaction'):
+            bare_job.cleanup()
+
+        assert sorted(p.name for p in archive.iterdir()) == ['data.csv', 'data_1.csv', 'data_2.csv']
+        assert (archive / 'data.csv').read_text() == 'old'
+
+    def test_cleanup_after_failed_write(self, bare_job, tmp_path):
+        """Other files should still be archived before a failed write fails the run"""
+        archive = tmp_path / 'archive'
+        bare_job.import_config.archive_directory = str(archive)
+        bare_job.config_id = 1
+        written = tmp_path / 'unittest_alpha_20260101.json'
+        written.write_text('[]')
+        unwritten = tmp_path / 'unittest_beta_20260102.json'
+        pending_write = Future()
+        pending_write.set_exception(OSError('disk full'))
+        bare_job._preloaded = (unwritten, [{'name': 'new'}])
+        bare_job._pending_write = pending_write
+        bare_job.matched_files = [written, unwritten]
+
+        with patch('etl.jobs.generic_import.db_transaction'), pytest.raises(OSError, match='disk full'):
+            bare_job.cleanup()
+
+        assert [p.name for p in archive.iterdir()] == [written.name]
+
+    def test_cleanup_moves_many_files_in_parallel(self, bare_job, tmp_path):
+        """Every file should be archived once, with failures logged per file"""
+        archive = tmp_path / 'archive'
+        bare_job.import_config.archive_directory = str(archive)
+        bare_job.config_id = 1
+        sources = []
+        for i in range(12):
+            (tmp_path / str(i)).mkdir()
+            src = tmp_path / str(i) / 'data.csv'
+            src.write_text(str(i))
+            sources.append(src)
+        bare_job.matched_files = [*sources, tmp_path / 'missing.csv']
+
+        with patch('etl.jobs.generic_import.db_transaction'):
+            bare_job.cleanup()
+
+        contents = sorted(p.read_text() for p in archive.iterdir())
+        assert contents == sorted(str(i) for i in range(12))
+        assert not any(src.exists() for src in sources)
+        bare_job.logger.error.assert_called_once()
+
+
+# ============================================================================
+# TEST Extraction
+# ============================================================================
+
+@pytest.mark.unit
+class TestExtract:
+    """Tests for GenericImportJob.extract"""
+
+    def test_multiple_files_merged_in_order(self, bare_job, tmp_path):
+        """Files extracted in parallel should be merged in file order"""
+        source = tmp_path / 'source'
+        source.mkdir()
+        files = []
+        for label, day in (('alpha', '20260101'), ('beta', '20260102'), ('gamma', '20260103')):
+            path = source / f'unittest_{label}_{day}.csv'
+            path.write_text(f'name,value\n{label}-1,1\n{label}-2,2\n')
+            files.append(path)
+        bare_job.matched_files = files
+
+        records = bare_job.extract()
+
+        assert [r['name'] for r in records] == [
+            'alpha-1', 'alpha-2', 'beta-1', 'beta-2', 'gamma-1', 'gamma-2'
+        ]
+        assert '_metadata_label' not in records[0]
+        logged = [c.args[0] for c in bare_job.logger.info.call_args_list]
+        assert 'Extracted 2 records from unittest_alpha_20260101.csv (label=alpha, date=2026-01-01)' in logged
+        assert 'Extracted 2 records from unittest_gamma_20260103.csv (label=gamma, date=2026-01-03)' in logged
+
+    def test_extraction_error_propagates(self, bare_job, tmp_path):
+        """A failing file should abort extraction with its error"""
+        source = tmp_path / 'source'
+        source.mkdir()
+        good = source / 'unittest_alpha_20260101.csv'
+        good.write_text('name\nx\n')
+        bare_job.matched_files = [good, source / 'unittest_missing_20260102.csv']
+
+        with pytest.raises(FileNotFoundError):
+            bare_job.extract()
+
+    def test_label_records_reused(self, bare_job, import_config, tmp_path):
+        """A file parsed for a file_content label should not be parsed again"""
+        import_config.metadata_label_source = 'file_content'
+        import_config.metadata_label_location = 'desk'
+        source = tmp_path / 'source'
+        source.mkdir()
+        path = source / 'unittest_alpha_20260101.csv'
+        path.write_text('desk,value\nrates,1\n')
+
+        assert bare_job._extract_label_early() == 'rates'
+        bare_job.matched_files = bare_job._find_matching_files()
+        with patch.object(CSVExtractor, 'extract') as mock_extract:
+            records = bare_job.extract()
+
+        mock_extract.assert_not_called()
+        assert records == [{'desk': 'rates', 'value': '1'}]
+        assert bare_job._first_file_records is None
+
+    def test_parallel_extract_disabled(self, bare_job, tmp_path):
+        """With parallel extraction off, files should be parsed in-process"""
+        source = tmp_path / 'source'
+        source.mkdir()
+        files = []
+        for label in ('alpha', 'beta'):
+            path = source / f'unittest_{label}_20260101.csv'
+            path.write_text(f'name\n{label}\n')
+            files.append(path)
+        bare_job.matched_files = files
+
+        with patch('etl.jobs.generic_import.get_config') as mock_config, \
+                patch('etl.jobs.generic_import.ProcessPoolExecutor') as mock_pool:
+            mock_config.return_value.etl.parallel_extract = False
+            records = bare_job.extract()
+
+        mock_pool.assert_not_called()
+        assert [r['name'] for r in records] == ['alpha', 'beta']
+
+    def test_worker_count_capped(self, bare_job, tmp_path):
+        """The process pool should never exceed the worker cap"""
+        source = tmp_path / 'source'
+        source.mkdir()
+        files = []
+        for day in range(1, 11):
+            path = source / f'unittest_alpha_202601{day:02d}.csv'
+            path.write_text('name\nx\n')
+            files.append(path)
+        bare_job.matched_files = files
+
+        with patch('etl.jobs.generic_import.os.cpu_count', return_value=32), \
+                patch('etl.jobs.generic_import.ProcessPoolExecutor',
+                      wraps=ProcessPoolExecutor) as mock_pool:
+            records = bare_job.extract()
+
+        assert len(records) == 10
+        assert mock_pool.call_args.kwargs['max_workers'] == 6
+
+    def test_preloaded_records_not_parsed(self, bare_job, import_config, tmp_path, mock_cursor):
+        """Preloaded records should be used as-is and their file archived once written"""
+        import_config.file_type = 'JSON'
+        import_config.file_pattern = r'unittest_.*\.json'
+        source = tmp_path / 'source'
+        source.mkdir()
+        older = source / 'unittest_alpha_20260101.json'
+        older.write_text('[{"name": "old"}]')
+        preloaded_path = source / 'unittest_beta_20260102.json'
+        pending_write = Future()
+        bare_job._preloaded = (preloaded_path, [{'name': 'new'}])
+        bare_job._pending_write = pending_write
+
+        bare_job.matched_files = bare_job._find_matching_files()
+        with patch.object(JSONExtractor, 'extract', wraps=bare_job._get_extractor().extract) as mock_extract:
+            records = bare_job.extract()
+
+        assert bare_job.matched_files == [older, preloaded_path]
+        mock_extract.assert_called_once_with(older)
+        assert records == [{'name': 'old'}, {'name': 'new'}]
+        assert any('(label=beta,' in c.args[0] for c in bare_job.logger.info.call_args_list)
+
+        preloaded_path.write_text('[{"name": "new"}]')
+        pending_write.set_result(preloaded_path)
+        bare_job.cleanup()
+
+        assert sorted(p.name for p in (tmp_path / 'archive').iterdir()) == [older.name, preloaded_path.name]
+
+    def test_pending_write_awaited_without_preload(self, bare_job, tmp_path):
+        """A file that must be parsed should be written before the scan"""
+        pending_write = MagicMock()
+        bare_job._pending_write = pending_write
+
+        bare_job._find_matching_files()
+
+        pending_write.result.assert_called_once()
+        assert bare_job._pending_write is None
+
+    @pytest.mark.parametrize('name, subdir', [
+        ('other_beta_20260102.json', 'source'),
+        ('unittest_beta_20260102.json', 'elsewhere'),
+    ])
+    def test_unmatched_preload_ignored(self, bare_job, import_config, tmp_path, name, subdir):
+        """A preloaded file the scan would not find should not be imported"""
+        import_config.file_type = 'JSON'
+        import_config.file_pattern = r'unittest_.*\.json'
+        (tmp_path / 'source').mkdir()
+        pending_write = MagicMock()
+        bare_job._preloaded = (tmp_path / subdir / name, [{'name': 'new'}])
+        bare_job._pending_write = pending_write
+
+        assert bare_job._find_matching_files() == []
+        assert bare_job._preloaded is None
+        pending_write.result.assert_called_once()
+        bare_job.logger.warning.assert_called_once()
+
+    def test_extractor_built_once(self, bare_job):
+        """The label probe and extract() should share one extractor instance"""
+        first = bare_job._get_extractor()
+
+        assert isinstance(first, CSVExtractor)
+        assert bare_job._get_extractor() is first
+
+
+
+# ============================================================================
+# TEST Transform
+# ============================================================================
+
+@pytest.mark.unit
+class TestTransform:
+    """Tests for GenericImportJob.transform"""
+
+    def test_nested_values_serialized(self, bare_job):
+        """Nested dicts/lists should become JSON strings and audit columns added"""
+        bare_job.strategy = ImportStrategy(importstrategyid=2, name='Ignore', description=None)
+        bare_job.username = 'etl_user'
+        bare_job.schema_manager.table_exists = MagicMock(return_value=True)
+        bare_job.schema_manager.get_table_columns = MagicMock(
+            return_value=['datasetid', 'name', 'tags', 'created_date', 'created_by']
+        )
+
+        records = bare_job.transform([{'Name': 'SOFR', 'Tags': {'tenor': 'ON', 'ids': [1, 2]}}])
+
+        assert records[0]['name'] == 'SOFR'
+        assert json.loads(records[0]['tags']) == {'tenor': 'ON', 'ids': [1, 2]}
+        assert records[0]['created_by'] == 'etl_user'
+
+    def test_one_timestamp_per_batch(self, bare_job):
+        """Every record in a batch should share a single created_date"""
+        bare_job.strategy = ImportStrategy(importstrategyid=2, name='Ignore', description=None)
+        bare_job.username = 'etl_user'
+        bare_job.schema_manager.table_exists = MagicMock(return_value=True)
+        bare_job.schema_manager.get_table_columns = MagicMock(return_value=['datasetid', 'name'])
+
+        records = bare_job.transform([{'name': str(i)} for i in range(50)])
+
+        assert len({id(record['created_date']) for record in records}) == 1
+
+    def test_created_date_is_run_start(self, bare_job):
+        """Audit timestamps should come from the run's start time"""
+        bare_job.strategy = ImportStrategy(importstrategyid=2, name='Ignore', description=None)
+        bare_job.username = 'etl_user'
+        bare_job.run_started_at = datetime(2026, 1, 15, 9, 30)
+        bare_job.schema_manager.get_table_columns = MagicMock(return_value=['datasetid', 'name'])
+
+        records = bare_job.transform([{'name': 'SOFR'}])
+
+        assert records[0]['created_date'] == datetime(2026, 1, 15, 9, 30)
+
+    def test_existing_table_needs_only_column_query(self, bare_job):
+        """An existing table should be detected from its columns alone"""
+        bare_job.strategy = ImportStrategy(importstrategyid=2, name='Ignore', description=None)
+        bare_job.username = 'etl_user'
+
+        with patch('etl.jobs.generic_import.fetch_dict',
+                   return_value=[{'column_name': 'datasetid'}, {'column_name': 'name'}]) as mock_fetch:
+            bare_job.transform([{'name': 'SOFR'}])
+
+        assert mock_fetch.call_count == 1
+        assert 'information_schema.columns' in mock_fetch.call_args.args[0]
+
+    def test_missing_table_created(self, bare_job):
+        """No columns should mean the table is created from the records"""
+        bare_job.strategy = ImportStrategy(importstrategyid=2, name='Ignore', description=None)
+        bare_job.username = 'etl_user'
+        bare_job.schema_manager.get_table_columns = MagicMock(side_effect=[[], ['datasetid', 'name']])
+        bare_job.schema_manager.create_table_from_records = MagicMock()
+
+        records = bare_job.transform([{'name': 'SOFR'}])
+
+        bare_job.schema_manager.create_table_from_records.assert_called_once()
+        assert bare_job._load_columns[0] == 'name'
+        assert records[0]['name'] == 'SOFR'
+
+
+# ============================================================================
+# TEST Column Name Normalization
+# ============================================================================
+
+@pytest.mark.unit
+class TestNormalizeColumnNames:
+    """Tests for GenericImportJob._normalize_column_names"""
+
+    def test_renames_every_record(self, bare_job):
+        """Each record's keys should be sanitized, preserving values and order"""
+        records = [{'Order Date': '2026-01-15', 'Unit Price ($)': '9.99'},
+                   {'Order Date': '2026-01-16', 'Unit Price ($)': '4.50'}]
+
+        result = bare_job._normalize_column_names(records)
+
+        assert result == [{'order_date': '2026-01-15', 'unit_price': '9.99'},
+                          {'order_date': '2026-01-16', 'unit_price': '4.50'}]
+
+    def test_renamed_in_place(self, bare_job):
+        """The extract list should be reused rather than copied"""
+        records = [{'Name': 'a'}, {'Name': 'b'}]
+
+        result = bare_job._normalize_column_names(records)
+
+        assert result is records
+        assert records == [{'name': 'a'}, {'name': 'b'}]
+
+    def test_keys_missing_from_first_record(self, bare_job):
+        """Keys that only appear in later records should still be sanitized"""
+        records = [{'Name': 'a'}, {'Name': 'b', 'Extra Field': 'x'}]
+
+        result = bare_job._normalize_column_names(records)
+
+        assert result[1] == {'name': 'b', 'extra_field': 'x'}
+
+    def test_same_keys_in_different_order(self, bare_job):
+        """Records with the first record's keys in another order map by key"""
+        records = [{'Name': 'a', 'Value': 1}, {'Value': 2, 'Name': 'b'}]
+
+        result = bare_job._normalize_column_names(records)
+
+        assert result[1] == {'name': 'b', 'value': 2}
+
+    def test_safe_headers_keep_record_objects(self, bare_job):
+        """Already-normalized headers should leave the records untouched"""
+        first, second = {'name': 'a', 'value': 1}, {'value': 2, 'name': 'b'}
+        records = [first, second]
+
+        result = bare_job._normalize_column_names(records)
+
+        assert result[0] is first
+        assert result[1] is second
+
+    def test_safe_headers_still_rename_unexpected_keys(self, bare_job):
+        """A record with extra unsafe keys should still be renamed"""
+        records = [{'name': 'a'}, {'name': 'b', 'Extra Field': 'x'}]
+
+        result = bare_job._normalize_column_names(records)
+
+        assert result[1] == {'name': 'b', 'extra_field': 'x'}
+
+
+# ============================================================================
+# TEST Import Strategies
+# ============================================================================
+
+@pytest.mark.unit
+class TestImportStrategies:
+    """Tests for GenericImportJob._apply_import_strategy"""
+
+    def test_ignore_strategy_selects_load_columns(self, bare_job):
+        """Strategy 2 should pick existing columns without rebuilding records"""
+        bare_job.strategy = ImportStrategy(importstrategyid=2, name='Ignore', description=None)
+        records = [
+            {'id': '1', 'name': 'a', 'new_column': 'x', 'created_date': 'now', 'source_file': 'f.csv'},
+            {'id': '2', 'name': 'b', 'new_column': 'y', 'created_date': 'now', 'source_file': 'f.csv'},
+        ]
+
+        result = bare_job._apply_import_strategy(
+            records, ['unittestid', 'datasetid', 'id', 'name', 'created_date', 'created_by']
+        )
+
+        assert result is records
+        assert bare_job._load_columns == ['id', 'name', 'created_date']
+
+    def test_add_strategy_adds_columns_and_selects_load_columns(self, bare_job):
+        """Strategy 1 should add typed new columns in one call and keep records as-is"""
+        bare_job.strategy = ImportStrategy(importstrategyid=1, name='Add', description=None)
+        bare_job.schema_manager.add_columns = MagicMock()
+        records = [
+            {'id': '1', 'new_column': 'x', 'qty': '3', 'created_date': 'now', 'source_file': 'f.csv'},
+            {'id': '2', 'new_column': 'y', 'qty': '10', 'created_date': 'now', 'source_file': 'f.csv'},
+        ]
+
+        result = bare_job._apply_import_strategy(records, ['datasetid', 'id', 'created_date'])
+
+        assert result is records
+        bare_job.schema_manager.add_columns.assert_called_once_with(
+            'feeds', 'unittest', ['new_column', 'qty'],
+            column_types={'new_column': 'VARCHAR(50)', 'qty': 'INTEGER'}
+        )
+        assert bare_job._load_columns == ['id', 'new_column', 'qty', 'created_date']
+
+    def test_fail_strategy_selects_load_columns(self, bare_job):
+        """Strategy 3 should accept matching columns and drop metadata from the load"""
+        bare_job.strategy = ImportStrategy(importstrategyid=3, name='Fail', description=None)
+        records = [{'id': '1', 'created_date': 'now', 'file_date': '2026-01-15'}]
+
+        result = bare_job._apply_import_strategy(records, ['datasetid', 'id', 'created_date'])
+
+        assert result is records
+        assert bare_job._load_columns == ['id', 'created_date']
+
+
+# ============================================================================
+# TEST Load
+# ============================================================================
+
+@pytest.mark.unit
+class TestLoad:
+    """Tests for GenericImportJob.load"""
+
+    def test_metadata_dropped_at_column_level(self, bare_job):
+        """Without strategy columns, metadata keys are excluded and records left intact"""
+        bare_job.loader = MagicMock()
+        bare_job.loader.load_copy.return_value = 1
+        bare_job.dataset_id = 5
+        records = [{'name': 'SOFR', 'source_file': 'f.csv', 'file_date': '2026-01-15'}]
+
+        bare_job.load(records)
+
+        kwargs = bare_job.loader.load_copy.call_args.kwargs
+        assert kwargs['columns'] == ['name']
+        assert records[0]['source_file'] == 'f.csv'
+        assert bare_job.records_loaded == 1
+
+    def test_strategy_columns_used(self, bare_job):
+        """Columns chosen by the import strategy go straight to the loader"""
+        bare_job.loader = MagicMock()
+        bare_job.dataset_id = 5
+        bare_job._load_columns = ['name', 'created_date']
+
+        bare_job.load([{'name': 'SOFR', 'created_date': 'now', 'metadata_label': 'x'}])
+
+        assert bare_job.loader.load_copy.call_args.kwargs['columns'] == ['name', 'created_date']
+
+    def test_failed_write_fails_before_load(self, bare_job):
+        """Preloaded records should not be loaded when their file was not saved"""
+        bare_job.loader = MagicMock()
+        bare_job.dataset_id = 5
+        pending_write = Future()
+        pending_write.set_exception(OSError('disk full'))
+        bare_job._pending_write = pending_write
+
+        with pytest.raises(OSError, match='disk full'):
+            bare_job.load([{'name': 'SOFR'}])
+
+        bare_job.loader.load_copy.assert_not_called()
+
+
+# ============================================================================
+# TEST Reference Data
+# ============================================================================
+
+@pytest.mark.unit
+class TestEnsureReferenceData:
+    """Tests for GenericImportJob._ensure_reference_data"""
+
+    def test_upserts_in_one_transaction(self, bare_job, mock_cursor):
+        """Datasource and datasettype should be inserted with ON CONFLICT, no pre-checks"""
+        bare_job.username = 'etl_user'
+        mock_cursor.rowcount = 0
+        logger = MagicMock()
+
+        with patch('etl.jobs.generic_import.fetch_dict') as mock_fetch:
+            bare_job._ensure_reference_data(logger)
+
+        mock_fetch.assert_not_called()
+        sqls = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert len(sqls) == 2
+        assert 'ON CONFLICT (sourcename) DO NOTHING' in sqls[0]
+        assert 'ON CONFLICT (typename) DO NOTHING' in sqls[1]
+        logger.info.assert_not_called()
+
+    def test_logs_created_rows(self, bare_job, mock_cursor):
+        """A newly inserted row should be reported"""
+        bare_job.username = 'etl_user'
+        mock_cursor.rowcount = 1
+        logger = MagicMock()
+
+        bare_job._ensure_reference_data(logger)
+
+        assert logger.info.call_count == 2
+
+
+# ============================================================================
+# TEST Config Loading
+# ============================================================================
+
+def _config_row(**overrides):
+    row = {
+        'config_id': 1, 'config_name': 'UnitTest_CSV', 'datasource': 'UnitTest',
+        'datasettype': 'Test', 'source_directory': '/tmp/source', 'archive_directory': '/tmp/archive',
+        'file_pattern': r'unittest_.*\.csv', 'file_type': 'CSV', 'metadata_label_source': 'filename',
+        'metadata_label_location': '1', 'dateconfig': 'filename', 'datelocation': '2',
+        'dateformat': 'yyyyMMdd', 'delimiter': '_', 'target_table': 'feeds.unittest',
+        'importstrategyid': 2, 'is_active': True, 'is_blob': False,
+        'strategy_name': 'Import only', 'strategy_description': 'Ignore new columns',
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.unit
+class TestLoadConfig:
+    """Tests for GenericImportJob._load_config"""
+
+    def test_config_and_strategy_in_one_query(self, bare_job):
+        """The strategy should come from the same query as the config"""
+        with patch('etl.jobs.generic_import.fetch_dict', return_value=[_config_row()]) as mock_fetch:
+            import_config, strategy = bare_job._load_config(1)
+
+        mock_fetch.assert_called_once()
+        assert 'LEFT JOIN dba.timportstrategy' in mock_fetch.call_args.args[0]
+        assert import_config.target_table_name == 'unittest'
+        assert strategy == ImportStrategy(importstrategyid=2, name='Import only', description='Ignore new columns')
+
+    def test_missing_strategy_is_unknown(self, bare_job):
+        """A config whose strategy row is missing should get an 'Unknown' strategy"""
+        row = _config_row(strategy_name=None, strategy_description=None)
+        with patch('etl.jobs.generic_import.fetch_dict', return_value=[row]):
+            _, strategy = bare_job._load_config(1)
+
+        assert strategy.name == 'Unknown'
+        assert strategy.description is None
+
+    def test_missing_config(self, bare_job):
+        """An unknown or inactive config should load as None"""
+        with patch('etl.jobs.generic_import.fetch_dict', return_value=[]):
+            assert bare_job._load_config(99) is None
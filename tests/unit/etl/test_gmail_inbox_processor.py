@@ -0,0 +1,313 @@
+"""Unit tests for InboxProcessorJob
+
+Tests the Gmail-free parts of run_gmail_inbox_processor.py including:
+- Message ID tracking
+- Attachment pattern matchers
+- Per-config pattern compilation
+- Email matching against compiled patterns
+- Batched message detail fetches
+- Gmail search query pushdown
+- Java date format conversion
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+
+pytest.importorskip('googleapiclient')
+
+from etl.jobs.run_gmail_inbox_processor import InboxProcessorJob, _build_attachment_matcher
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def bare_job():
+    """InboxProcessorJob without a database or Gmail connection"""
+    job = InboxProcessorJob.__new__(InboxProcessorJob)
+    job.logger = MagicMock()
+    job.run_started_at = None
+    job.gmail = MagicMock()
+    job.configs = []
+    job.processed_message_ids = set()
+    job.unmatched_message_ids = set()
+    job._message_details = {}
+    job._email_to_config = {}
+    return job
+
+
+def _config(**overrides):
+    config = {
+        'config_name': 'test',
+        'subject_pattern': None,
+        'sender_pattern': None,
+        'attachment_pattern': '*.csv',
+    }
+    config.update(overrides)
+    return config
+
+
+# ============================================================================
+# TEST message ID tracking
+# ============================================================================
+
+@pytest.mark.unit
+class TestMessageIdTracking:
+    """Tests for processed/unmatched message ID bookkeeping"""
+
+    def test_ids_are_sets(self):
+        """A new job should track message IDs in sets"""
+        job = InboxProcessorJob()
+
+        assert isinstance(job.processed_message_ids, set)
+        assert isinstance(job.unmatched_message_ids, set)
+
+    def test_extract_splits_processed_and_unmatched(self, bare_job):
+        """Matched messages are processed; everything else is unmatched"""
+        config = _config()
+        bare_job._compile_config_patterns(config)
+        bare_job.configs = [config]
+        bare_job.gmail.get_unread_emails.return_value = [
+            {'id': 'm1', 'subject': 'Rates', 'sender': 'ops@example.com'},
+            {'id': 'm2', 'subject': 'Hello', 'sender': 'ops@example.com'},
+        ]
+        bare_job.gmail.get_message_details.return_value = {
+            'm1': {'attachments': [{'id': 'a1', 'filename': 'rates.csv'}], 'date': None},
+            'm2': {'attachments': [], 'date': None},
+        }
+
+        bare_job.extract()
+
+        assert bare_job.processed_message_ids == {'m1'}
+        assert bare_job.unmatched_message_ids == {'m2'}
+
+
+# ============================================================================
+# TEST _build_search_query()
+# ============================================================================
+
+@pytest.mark.unit
+class TestBuildSearchQuery:
+    """Tests for the Gmail search query pushed down from inbox configs"""
+
+    def _configs(self, bare_job, *patterns):
+        bare_job.configs = []
+        for pattern in patterns:
+            config = _config(attachment_pattern=pattern)
+            bare_job._compile_config_patterns(config)
+            bare_job.configs.append(config)
+
+    def test_extension_globs_become_filename_terms(self, bare_job):
+        """'*.ext' globs should be OR'ed as filename searches"""
+        self._configs(bare_job, '*.csv', '*.xlsx', '*.csv')
+
+        assert bare_job._build_search_query() == '{filename:csv filename:xlsx}'
+
+    def test_other_patterns_need_any_attachment(self, bare_job):
+        """Any pattern Gmail can't express should widen the query to has:attachment"""
+        self._configs(bare_job, '*.csv', r'rates_\d+\.csv')
+
+        assert bare_job._build_search_query() == 'has:attachment'
+
+    def test_no_usable_configs(self, bare_job):
+        """With nothing to push down the query should be empty"""
+        bare_job.configs = []
+
+        assert bare_job._build_search_query() == ''
+
+    def test_extract_lists_ids_for_unmatched(self, bare_job):
+        """Unread emails outside the search should still be tracked as unmatched"""
+        self._configs(bare_job, '*.csv')
+        bare_job.gmail.list_unread_ids.return_value = ['m1', 'm2']
+        bare_job.gmail.get_unread_emails.return_value = [
+            {'id': 'm1', 'subject': 'Rates', 'sender': 'ops@example.com'},
+        ]
+        bare_job.gmail.get_message_details.return_value = {
+            'm1': {'attachments': [{'id': 'a1', 'filename': 'rates.csv'}], 'date': None},
+        }
+
+        bare_job.extract()
+
+        bare_job.gmail.get_unread_emails.assert_called_once_with(query='filename:csv')
+        assert bare_job.processed_message_ids == {'m1'}
+        assert bare_job.unmatched_message_ids == {'m2'}
+
+
+# ============================================================================
+# TEST _build_attachment_matcher()
+# ============================================================================
+
+@pytest.mark.unit
+class TestBuildAttachmentMatcher:
+    """Tests for attachment pattern matchers"""
+
+    @pytest.mark.parametrize('pattern, filename, expected', [
+        ('*.csv', 'report.csv', True),
+        ('*.csv', 'report.xlsx', False),
+        ('report_????.csv', 'report_2026.csv', True),
+        (r'report_\d+\.xlsx', 'REPORT_20260115.xlsx', True),
+        (r'report_\d+\.xlsx', 'summary.xlsx', False),
+        ('Report[', 'monthly report[1].pdf', True),
+        ('Report[', 'monthly.pdf', False),
+    ])
+    def test_matching(self, pattern, filename, expected):
+        """Glob, regex and literal fallback patterns should match as before"""
+        _, matcher = _build_attachment_matcher(pattern)
+        assert bool(matcher(filename)) is expected
+
+    @pytest.mark.parametrize('pattern, kind', [
+        ('*.csv', 'glob'),
+        ('rates_?.csv', 'glob'),
+        (r'rates_[0-9]+\.csv', 'regex'),
+        ('rates.csv', 'regex'),
+        ('Report[', 'literal'),
+    ])
+    def test_kind(self, pattern, kind):
+        """Patterns should be classified once, when the matcher is built"""
+        assert _build_attachment_matcher(pattern)[0] == kind
+
+    def test_kind_stored_on_config(self, bare_job):
+        """Compiling a config should record the pattern kind next to the matcher"""
+        config = _config(attachment_pattern='Report[')
+        bare_job._compile_config_patterns(config)
+
+        assert config['_att_kind'] == 'literal'
+        assert config['_att_matcher']('REPORT[1].pdf')
+
+
+# ============================================================================
+# TEST _match_emails_for_config()
+# ============================================================================
+
+@pytest.mark.unit
+class TestMatchEmailsForConfig:
+    """Tests for matching emails against compiled config patterns"""
+
+    def test_compiled_patterns_filter_emails(self, bare_job):
+        """Subject and sender regexes should be case-insensitive"""
+        config = _config(subject_pattern='daily report', sender_pattern=r'@example\.com$')
+        bare_job._compile_config_patterns(config)
+        bare_job.gmail.get_message_details.return_value = {
+            'm1': {
+                'attachments': [{'id': 'a1', 'filename': 'rates.csv'}, {'id': 'a2', 'filename': 'notes.txt'}],
+                'date': datetime(2026, 1, 15, 9, 30),
+            },
+        }
+        emails = [
+            {'id': 'm1', 'subject': 'DAILY REPORT', 'sender': 'ops@example.com'},
+            {'id': 'm2', 'subject': 'Weekly report', 'sender': 'ops@example.com'},
+            {'id': 'm3', 'subject': 'Daily report', 'sender': 'ops@other.com'},
+        ]
+
+        matches = bare_job._match_emails_for_config(config, emails)
+
+        assert [m['message_id'] for m in matches] == ['m1']
+        assert [a['id'] for a in matches[0]['attachments']] == ['a1']
+        assert matches[0]['email_date'] == datetime(2026, 1, 15, 9, 30)
+        bare_job.gmail.get_message_details.assert_called_once_with(['m1'])
+
+    def test_details_fetched_once_across_configs(self, bare_job):
+        """Messages already fetched for one config should not be fetched again"""
+        csv_config = _config()
+        xlsx_config = _config(attachment_pattern='*.xlsx')
+        bare_job._compile_config_patterns(csv_config)
+        bare_job._compile_config_patterns(xlsx_config)
+        bare_job.gmail.get_message_details.return_value = {
+            'm1': {'attachments': [{'id': 'a1', 'filename': 'rates.xlsx'}], 'date': None},
+        }
+        emails = [{'id': 'm1', 'subject': 'Rates', 'sender': 'ops@example.com'}]
+
+        assert bare_job._match_emails_for_config(csv_config, emails) == []
+        matches = bare_job._match_emails_for_config(xlsx_config, emails)
+
+        assert [m['message_id'] for m in matches] == ['m1']
+        assert isinstance(matches[0]['email_date'], datetime)
+        bare_job.gmail.get_message_details.assert_called_once()
+
+    def test_invalid_subject_regex_matches_nothing(self, bare_job):
+        """An invalid regex should warn once and skip the config's emails"""
+        config = _config(subject_pattern='(unclosed')
+        bare_job._compile_config_patterns(config)
+
+        emails = [{'id': 'm1', 'subject': '(unclosed', 'sender': 'a@b.com'}]
+
+        assert bare_job._match_emails_for_config(config, emails) == []
+        bare_job.logger.warning.assert_called_once()
+        bare_job.gmail.get_message_details.assert_not_called()
+
+
+# ============================================================================
+# TEST _convert_date_format()
+# ============================================================================
+
+@pytest.mark.unit
+class TestConvertDateFormat:
+    """Tests for Java-style date prefix conversion"""
+
+    @pytest.mark.parametrize('java_format, expected', [
+        ('yyyyMMdd', '%Y%m%d'),
+        ('yyyy-MM-dd', '%Y-%m-%d'),
+        ('yyMMdd', '%y%m%d'),
+        ('yyyyMMdd_HHmmss', '%Y%m%d_%H%M%S'),
+        ('yyyy-MM-ddTHH:mm:ss.SSS', '%Y-%m-%dT%H:%M:%S.%f'),
+    ])
+    def test_conversion(self, bare_job, java_format, expected):
+        """Each token should be replaced once, longest token first"""
+        assert bare_job._convert_date_format(java_format) == expected
+
+
+# ============================================================================
+# TEST load()
+# ============================================================================
+
+@pytest.mark.unit
+class TestLoad:
+    """Tests for downloading attachments and updating labels"""
+
+    def test_downloads_keep_task_order_and_skip_failures(self, bare_job, tmp_path):
+        """Parallel downloads should record files in task order and log failures"""
+        config = _config(target_directory=str(tmp_path), mark_processed=False)
+        tasks = [
+            {'message_id': 'm1', 'attachment_id': f'a{i}', 'original_filename': f'f{i}.csv',
+             'target_filename': f'20260115_f{i}.csv', 'target_directory': str(tmp_path), 'config': config}
+            for i in range(10)
+        ]
+
+        def fake_download(message_id, attachment_id, filename, target_dir):
+            if attachment_id == 'a3':
+                raise OSError('boom')
+            return target_dir / filename
+
+        bare_job.downloaded_files = []
+        bare_job.gmail.download_attachment.side_effect = fake_download
+
+        bare_job.load(tasks)
+
+        expected = [tmp_path / f'20260115_f{i}.csv' for i in range(10) if i != 3]
+        assert bare_job.downloaded_files == expected
+        assert bare_job.records_loaded == 9
+        bare_job.logger.error.assert_called_once()
+
+    def test_labels_applied_once_per_email(self, bare_job, tmp_path):
+        """Each matched email should be labelled once, however many tasks it produced"""
+        config = _config(target_directory=str(tmp_path), date_prefix_format='yyyyMMdd',
+                         processed_label='Done')
+        matched = [{
+            'message_id': 'm1', 'subject': 'Rates', 'sender': 'ops@example.com',
+            'email_date': datetime(2026, 1, 15),
+            'attachments': [{'id': 'a1', 'filename': 'a.csv'}, {'id': 'a2', 'filename': 'b.csv'}],
+            'config': config,
+        }]
+        bare_job.downloaded_files = []
+        bare_job.gmail.download_attachment.side_effect = lambda m, a, f, d: d / f
+
+        tasks = bare_job.transform(matched)
+        bare_job.load(tasks)
+
+        assert len(tasks) == 2
+        bare_job.gmail.apply_label.assert_called_once_with('m1', 'Done')
+        bare_job.gmail.mark_as_read.assert_called_once_with('m1')
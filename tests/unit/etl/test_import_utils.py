@@ -0,0 +1,245 @@
+"""Unit tests for import_utils
+
+Tests the pure-Python helpers in etl/base/import_utils.py including:
+- Cached date parsing
+- Saved JSON file naming
+- JSON encoding
+- Record transforms
+- Shared API job runner
+- Generic import runner
+"""
+
+import json
+import re
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from etl.base import import_utils
+from etl.base.import_utils import (
+    _encode_json,
+    _json_path,
+    parse_date,
+    parse_iso_date,
+    run_api_import,
+    run_generic_import,
+    transform_records,
+)
+
+
+# ============================================================================
+# TEST parse_date() / parse_iso_date()
+# ============================================================================
+
+@pytest.mark.unit
+class TestParseDate:
+    """Tests for YYYY-MM-DD date parsing"""
+
+    @pytest.mark.parametrize('value, expected', [
+        ('2026-01-15', '2026-01-15'),
+        ('2026-1-5', '2026-01-05'),
+        ('', None),
+        (None, None),
+    ])
+    def test_iso_string(self, value, expected):
+        """parse_date should normalise to an ISO date string"""
+        assert parse_date(value) == expected
+
+    def test_date_object(self):
+        """parse_iso_date should return a date usable for arithmetic"""
+        assert parse_iso_date('2026-01-15') == date(2026, 1, 15)
+        assert (parse_iso_date('2026-02-14') - parse_iso_date('2026-01-15')).days == 30
+
+    @pytest.mark.parametrize('value', ['15/01/2026', '2026-02-30', '2026-W03-4', '20260115', '2026-01-15T00:00'])
+    def test_invalid_date_raises(self, value):
+        """Malformed dates should still raise ValueError"""
+        with pytest.raises(ValueError):
+            parse_date(value)
+
+    def test_repeated_dates_hit_cache(self):
+        """Repeated values should be served from the cache"""
+        parse_iso_date.cache_clear()
+        for _ in range(5):
+            parse_iso_date('2026-03-02')
+
+        info = parse_iso_date.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+
+# ============================================================================
+# TEST _json_path()
+# ============================================================================
+
+@pytest.mark.unit
+class TestJsonPath:
+    """Tests for saved JSON file naming"""
+
+    @pytest.fixture(autouse=True)
+    def source_root(self, tmp_path, monkeypatch):
+        import_utils._source_dir.cache_clear()
+        monkeypatch.setattr(import_utils, 'Path', lambda p: tmp_path / Path(p).relative_to('/'))
+        yield tmp_path
+        import_utils._source_dir.cache_clear()
+
+    def test_filename(self, source_root):
+        """The source prefix should be stripped and the slug lower-cased"""
+        path = _json_path('NewYorkFed_ReferenceRates_Latest', 'newyorkfed')
+
+        assert path.parent == source_root / 'app/data/source/newyorkfed'
+        assert path.parent.is_dir()
+        assert re.fullmatch(r'newyorkfed_referencerates_latest_\d{8}_\d{6}\.json', path.name)
+
+    def test_unknown_source_keeps_name(self, source_root):
+        """Sources without a known prefix should only be lower-cased"""
+        assert _json_path('Farside_Daily', 'farside').name.startswith('farside_farside_daily_')
+
+    def test_directory_created_once(self, source_root, monkeypatch):
+        """Later saves for the same source should not repeat the mkdir"""
+        _json_path('NewYorkFed_Repo', 'newyorkfed')
+        mkdir = MagicMock()
+        monkeypatch.setattr(Path, 'mkdir', mkdir)
+
+        _json_path('NewYorkFed_Repo', 'newyorkfed')
+
+        mkdir.assert_not_called()
+
+
+# ============================================================================
+# TEST _encode_json()
+# ============================================================================
+
+@pytest.mark.unit
+class TestEncodeJson:
+    """Tests for encoding saved API payloads"""
+
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_round_trip(self, monkeypatch, has_orjson):
+        """Both encoders should write the same readable document"""
+        if has_orjson and not import_utils.HAS_ORJSON:
+            pytest.skip('orjson not installed')
+        monkeypatch.setattr(import_utils, 'HAS_ORJSON', has_orjson)
+        data = [{'as_of_date': '2026-01-15', 'par': 1.5, 'amount': Decimal('2.50'), 'day': date(2026, 1, 15)}]
+
+        payload = _encode_json(data)
+
+        assert json.loads(payload) == [
+            {'as_of_date': '2026-01-15', 'par': 1.5, 'amount': '2.50', 'day': '2026-01-15'}
+        ]
+        assert b'\n  ' in payload
+
+    def test_falls_back_for_wide_integers(self):
+        """Values orjson rejects should still be encoded via stdlib json"""
+        assert json.loads(_encode_json([{'id': 2 ** 70}])) == [{'id': 2 ** 70}]
+
+
+# ============================================================================
+# TEST transform_records()
+# ============================================================================
+
+@pytest.mark.unit
+class TestTransformRecords:
+    """Tests for the shared record transform loop"""
+
+    def test_all_records_built(self):
+        """Clean data should be built in order"""
+        log = MagicMock()
+
+        result = transform_records([{'v': 1}, {'v': 2}], lambda r: {'value': r['v'] * 10}, log, 'test')
+
+        assert result == [{'value': 10}, {'value': 20}]
+        log.error.assert_not_called()
+
+    def test_failing_records_skipped(self):
+        """Records that fail should be logged and skipped, keeping the rest"""
+        log = MagicMock()
+
+        result = transform_records(
+            [{'v': 1}, {}, {'v': 3}], lambda r: {'value': r['v']}, log, 'test'
+        )
+
+        assert result == [{'value': 1}, {'value': 3}]
+        log.error.assert_called_once()
+        assert 'Failed to transform test record' in log.error.call_args.args[0]
+
+
+# ============================================================================
+# TEST run_api_import()
+# ============================================================================
+
+@pytest.mark.unit
+class TestRunApiImport:
+    """Tests for the shared fetch/transform/import runner"""
+
+    @pytest.fixture
+    def job_log(self):
+        with patch.object(import_utils, 'JobRunLogger') as mock_cls:
+            yield mock_cls.return_value.__enter__.return_value
+
+    @pytest.fixture
+    def generic_import(self):
+        with patch.object(import_utils, 'run_generic_import', return_value=0) as mock_import:
+            yield mock_import
+
+    def test_transformed_records_imported(self, job_log, generic_import):
+        """Fetched data should be transformed and handed to the generic import"""
+        fetch = MagicMock(return_value=[{'v': 1}, {'v': 2}])
+
+        rc = run_api_import('job', 'Config', fetch, lambda data: data[:1], source='newyorkfed')
+
+        assert rc == 0
+        job_log.complete_step.assert_called_once_with(job_log.begin_step.return_value, records_in=2, records_out=1)
+        generic_import.assert_called_once_with(
+            'Config', False, job_run_logger=job_log, records=[{'v': 1}], source='newyorkfed'
+        )
+
+    def test_raw_data_skips_fetch(self, job_log, generic_import):
+        """Prefetched data should be used as is without a transform"""
+        fetch = MagicMock()
+
+        run_api_import('job', 'Config', fetch, raw_data=[{'v': 1}], dry_run=True)
+
+        fetch.assert_not_called()
+        assert generic_import.call_args.kwargs['records'] == [{'v': 1}]
+
+    @pytest.mark.parametrize('raw, transform', [
+        ([], None),
+        ([{'v': 1}], lambda data: []),
+    ])
+    def test_nothing_to_import(self, job_log, generic_import, raw, transform):
+        """Empty fetches or transforms should succeed without importing"""
+        assert run_api_import('job', 'Config', MagicMock(return_value=raw), transform) == 0
+        generic_import.assert_not_called()
+
+    def test_fetch_failure_fails_step(self, job_log, generic_import):
+        """Errors before the import should fail the collection step"""
+        fetch = MagicMock(side_effect=ConnectionError('down'))
+
+        assert run_api_import('job', 'Config', fetch) == 1
+        job_log.fail_step.assert_called_once_with(job_log.begin_step.return_value, 'down')
+        generic_import.assert_not_called()
+
+
+# ============================================================================
+# TEST run_generic_import()
+# ============================================================================
+
+@pytest.mark.unit
+class TestRunGenericImport:
+    """Tests for running a generic import by config name"""
+
+    def test_save_failure_fails_step(self, tmp_path):
+        """Records that cannot be saved should fail the import step"""
+        job_log = MagicMock()
+        with patch.object(import_utils, '_json_path', return_value=tmp_path / 'out.json'), \
+                patch.object(import_utils, '_encode_json', side_effect=TypeError('not serializable')), \
+                patch.object(import_utils, 'get_config_id') as mock_config_id:
+            rc = run_generic_import('Config', job_run_logger=job_log, records=[{'v': object()}])
+
+        assert rc == 1
+        job_log.fail_step.assert_called_once_with(job_log.begin_step.return_value, 'not serializable')
+        mock_config_id.assert_not_called()
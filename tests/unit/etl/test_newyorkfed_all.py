@@ -0,0 +1,49 @@
+"""Unit tests for run_newyorkfed_all
+
+Tests the combined NewYorkFed driver including:
+- Concurrent prefetch handed to each job
+- Prefetch failures falling back to the job's own fetch
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from etl.jobs import run_newyorkfed_all
+
+
+def _job(name, fetch_result=None, fetch_error=None, rc=0):
+    fetch = MagicMock(return_value=fetch_result, side_effect=fetch_error)
+    return SimpleNamespace(CONFIG_NAME=name, fetch=fetch, run=MagicMock(return_value=rc))
+
+
+# ============================================================================
+# TEST run_all()
+# ============================================================================
+
+@pytest.mark.unit
+class TestRunAll:
+    """Tests for run_all"""
+
+    def test_prefetched_data_passed_to_each_job(self):
+        """Each job should be run once with its own prefetched data"""
+        rates = _job('Rates', fetch_result=[{'rate': 1}])
+        soma = _job('SOMA', fetch_result=[{'cusip': 'X'}])
+
+        with patch.object(run_newyorkfed_all, 'JOBS', [(rates, 'Rates'), (soma, 'SOMA')]):
+            assert run_newyorkfed_all.run_all(dry_run=True) == 0
+
+        rates.run.assert_called_once_with(True, raw_data=[{'rate': 1}])
+        soma.run.assert_called_once_with(True, raw_data=[{'cusip': 'X'}])
+
+    def test_failed_prefetch_falls_back(self):
+        """A failed prefetch should leave the fetch to the job; failures are counted"""
+        rates = _job('Rates', fetch_error=ConnectionError('down'), rc=1)
+        soma = _job('SOMA', fetch_result=[])
+
+        with patch.object(run_newyorkfed_all, 'JOBS', [(rates, 'Rates'), (soma, 'SOMA')]):
+            assert run_newyorkfed_all.run_all() == 1
+
+        rates.run.assert_called_once_with(False, raw_data=None)
+        soma.run.assert_called_once_with(False, raw_data=[])
@@ -5,6 +5,8 @@ Tests the Federal Reserve Bank of New York Markets API client including:
 - Nested JSON extraction
 - Convenience methods
 - Error handling
+- Response decoding
+- Shared client
 """
 
 import json
@@ -12,7 +14,8 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
-from etl.clients.newyorkfed_client import NewYorkFedAPIClient
+from etl.clients import newyorkfed_client
+from etl.clients.newyorkfed_client import NewYorkFedAPIClient, _shared_client, get_shared_client
 
 
 # ============================================================================
@@ -352,3 +355,71 @@ class TestErrorHandling:
         # Should wrap string in list
         assert isinstance(result, list)
         assert result == ["invalid json string"]
+
+
+# ============================================================================
+# TEST get_shared_client
+# ============================================================================
+
+@pytest.mark.unit
+class TestSharedClient:
+    """Tests for the process-wide shared client"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        _shared_client.cache_clear()
+        yield
+        _shared_client.cache_clear()
+
+    @patch('etl.clients.newyorkfed_client.atexit.register')
+    def test_same_client_per_base_url(self, mock_register):
+        """Repeated calls should reuse one client (and session) per base URL"""
+        first = get_shared_client()
+
+        assert get_shared_client() is first
+        assert get_shared_client('https://markets.newyorkfed.org/') is first
+        assert get_shared_client('https://test.example.com') is not first
+        assert first.base_url == 'https://markets.newyorkfed.org'
+
+    @patch('etl.clients.newyorkfed_client.atexit.register')
+    def test_closed_at_exit(self, mock_register):
+        """The shared session should be closed at interpreter exit"""
+        client = get_shared_client()
+
+        mock_register.assert_called_once_with(client.close)
+
+
+# ============================================================================
+# TEST get() response decoding
+# ============================================================================
+
+@pytest.mark.unit
+class TestGetDecoding:
+    """Tests for parsing raw response bodies"""
+
+    def _get(self, client, body: bytes):
+        with patch.object(client, '_make_request', return_value=Mock(content=body)):
+            return client.get('/api/test.json')
+
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_suppressed_values_become_null(self, client, monkeypatch, has_orjson):
+        """Bare * placeholders should decode as None with either parser"""
+        if has_orjson and not newyorkfed_client.HAS_ORJSON:
+            pytest.skip('orjson not installed')
+        monkeypatch.setattr(newyorkfed_client, 'HAS_ORJSON', has_orjson)
+        body = b'{"rows": [{"rate": *, "note": "a*b"}, {"rate": 5.31, "max": * }]}'
+
+        assert self._get(client, body) == {
+            'rows': [{'rate': None, 'note': 'a*b'}, {'rate': 5.31, 'max': None}]
+        }
+
+    def test_utf8_body(self, client):
+        """Bodies should be decoded as UTF-8 without going through response.text"""
+        assert self._get(client, b'{"name": "Swiss National Bank - Z\xc3\xbcrich"}') == {
+            'name': 'Swiss National Bank - Zürich'
+        }
+
+    def test_invalid_json_raises(self, client):
+        """Malformed bodies should still raise a ValueError"""
+        with pytest.raises(ValueError):
+            self._get(client, b'<html>Service Unavailable</html>')
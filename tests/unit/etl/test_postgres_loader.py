@@ -0,0 +1,170 @@
+"""Unit tests for PostgresLoader
+
+Tests row building for bulk loads including:
+- Column ordering and datasetid handling
+- Missing keys
+- COPY loading
+- Batched upserts
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from etl.loaders.postgres_loader import PostgresLoader
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def loader():
+    """Create PostgresLoader for the feeds schema"""
+    return PostgresLoader(schema='feeds')
+
+
+@pytest.fixture
+def mock_bulk_insert():
+    """Patch bulk_insert and report the number of rows it was given"""
+    with patch('etl.loaders.postgres_loader.bulk_insert') as mock_insert:
+        mock_insert.side_effect = lambda table, columns, values, schema: len(values)
+        yield mock_insert
+
+
+# ============================================================================
+# TEST load
+# ============================================================================
+
+@pytest.mark.unit
+class TestPostgresLoaderLoad:
+    """Tests for PostgresLoader.load"""
+
+    def test_columns_inferred_from_first_record(self, loader, mock_bulk_insert):
+        """datasetid should lead, followed by the first record's keys"""
+        data = [{'name': 'SOFR', 'rate': 5.31}, {'name': 'EFFR', 'rate': 5.33}]
+
+        assert loader.load('rates', data, dataset_id=42) == 2
+
+        kwargs = mock_bulk_insert.call_args.kwargs
+        assert kwargs['columns'] == ['datasetid', 'name', 'rate']
+        assert kwargs['values'] == [(42, 'SOFR', 5.31), (42, 'EFFR', 5.33)]
+        assert kwargs['schema'] == 'feeds'
+
+    def test_explicit_columns_and_missing_keys(self, loader, mock_bulk_insert):
+        """Explicit columns select keys; missing keys load as NULL"""
+        data = [{'name': 'SOFR', 'rate': 5.31, 'extra': 'x'}, {'name': 'EFFR'}]
+
+        loader.load('rates', data, dataset_id=7, columns=['name', 'rate'])
+
+        kwargs = mock_bulk_insert.call_args.kwargs
+        assert kwargs['columns'] == ['datasetid', 'name', 'rate']
+        assert kwargs['values'] == [(7, 'SOFR', 5.31), (7, 'EFFR', None)]
+
+    def test_record_datasetid_overridden(self, loader, mock_bulk_insert):
+        """The dataset_id argument should win over a datasetid key in the data"""
+        loader.load('rates', [{'datasetid': 1, 'name': 'SOFR'}], dataset_id=9)
+
+        kwargs = mock_bulk_insert.call_args.kwargs
+        assert kwargs['columns'] == ['datasetid', 'name']
+        assert kwargs['values'] == [(9, 'SOFR')]
+
+    def test_empty_data_skips_insert(self, loader, mock_bulk_insert):
+        """No rows should mean no database call"""
+        assert loader.load('rates', [], dataset_id=1) == 0
+        mock_bulk_insert.assert_not_called()
+
+
+# ============================================================================
+# TEST load_copy
+# ============================================================================
+
+@pytest.mark.unit
+class TestPostgresLoaderLoadCopy:
+    """Tests for PostgresLoader.load_copy"""
+
+    def test_streams_rows_to_copy(self, loader):
+        """Rows should be handed to copy_insert lazily, datasetid first"""
+        data = [{'name': 'SOFR', 'rate': 5.31}, {'name': 'EFFR', 'rate': None}]
+
+        with patch('etl.loaders.postgres_loader.copy_insert') as mock_copy:
+            mock_copy.side_effect = lambda table, columns, values, schema: len(list(values))
+            assert loader.load_copy('rates', data, dataset_id=3) == 2
+
+        kwargs = mock_copy.call_args.kwargs
+        assert kwargs['columns'] == ['datasetid', 'name', 'rate']
+        assert kwargs['table'] == 'rates'
+        assert not isinstance(kwargs['values'], list)
+
+    def test_empty_data_skips_copy(self, loader):
+        """No rows should mean no database call"""
+        with patch('etl.loaders.postgres_loader.copy_insert') as mock_copy:
+            assert loader.load_copy('rates', [], dataset_id=1) == 0
+        mock_copy.assert_not_called()
+
+
+# ============================================================================
+# TEST upsert
+# ============================================================================
+
+@pytest.mark.unit
+class TestPostgresLoaderUpsert:
+    """Tests for PostgresLoader.upsert"""
+
+    def test_pages_rows_through_execute_values(self, loader):
+        """Rows should go out as multi-row statements, counted via RETURNING"""
+        data = [{'code': 'SOFR', 'rate': 5.31}, {'code': 'EFFR', 'rate': 5.33}]
+
+        with patch('etl.loaders.postgres_loader.db_transaction'), \
+                patch('etl.loaders.postgres_loader.extras.execute_values') as mock_execute_values:
+            mock_execute_values.side_effect = lambda cur, sql, values, page_size, fetch: [(1,)] * len(values)
+            assert loader.upsert('rates', data, conflict_columns=['code']) == 2
+
+        args, kwargs = mock_execute_values.call_args
+        sql, values = args[1], args[2]
+        assert 'VALUES %s' in sql
+        assert 'ON CONFLICT (code)' in sql
+        assert 'rate = EXCLUDED.rate' in sql
+        assert values == [('SOFR', 5.31), ('EFFR', 5.33)]
+        assert kwargs['page_size'] == 1000
+
+    def test_duplicate_keys_applied_in_order(self, loader):
+        """A repeated conflict key should go into a later statement, as if upserted row by row"""
+        data = [{'code': 'SOFR', 'rate': 5.30}, {'code': 'EFFR', 'rate': 5.33},
+                {'code': 'SOFR', 'rate': 5.31}]
+
+        with patch('etl.loaders.postgres_loader.db_transaction'), \
+                patch('etl.loaders.postgres_loader.extras.execute_values') as mock_execute_values:
+            mock_execute_values.side_effect = lambda cur, sql, values, page_size, fetch: [(1,)] * len(values)
+            assert loader.upsert('rates', data, conflict_columns=['code'], update_columns=['rate']) == 3
+
+        assert [c.args[2] for c in mock_execute_values.call_args_list] == [
+            [('SOFR', 5.30), ('EFFR', 5.33)],
+            [('SOFR', 5.31)],
+        ]
+
+    def test_null_keys_sent_together(self, loader):
+        """Rows with NULL conflict keys never conflict, so they should share one statement"""
+        data = [{'code': None, 'rate': 1}, {'code': None, 'rate': 2}, {'code': 'SOFR', 'rate': 3}]
+
+        with patch('etl.loaders.postgres_loader.db_transaction'), \
+                patch('etl.loaders.postgres_loader.extras.execute_values', return_value=[]) as mock_execute_values:
+            loader.upsert('rates', data, conflict_columns=['code'])
+
+        assert mock_execute_values.call_args.args[2] == [(None, 1), (None, 2), ('SOFR', 3)]
+
+    def test_conflict_column_missing_from_records(self, loader):
+        """A conflict column the records don't carry should be left to its default"""
+        data = [{'rate': 1}, {'rate': 2}]
+
+        with patch('etl.loaders.postgres_loader.db_transaction'), \
+                patch('etl.loaders.postgres_loader.extras.execute_values', return_value=[]) as mock_execute_values:
+            loader.upsert('rates', data, conflict_columns=['code'])
+
+        assert mock_execute_values.call_args.args[2] == [(1,), (2,)]
+
+    def test_empty_data_skips_upsert(self, loader):
+        """No rows should mean no database call"""
+        with patch('etl.loaders.postgres_loader.db_transaction') as mock_tx:
+            assert loader.upsert('rates', [], conflict_columns=['code']) == 0
+        mock_tx.assert_not_called()
@@ -0,0 +1,185 @@
+"""Unit tests for database utility helpers
+
+Tests the pure-Python parts of common/db_utils.py including:
+- Connection pool lifecycle
+- COPY text-format rendering
+- Streaming COPY input
+- Batched INSERT
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from common import db_utils
+from common.db_utils import _copy_field, _CopyStream, bulk_insert, close_pool, copy_insert, get_pool
+
+
+# ============================================================================
+# TEST get_pool() / close_pool()
+# ============================================================================
+
+@pytest.mark.unit
+class TestConnectionPool:
+    """Tests for the process-wide connection pool"""
+
+    @pytest.fixture(autouse=True)
+    def mock_pool_class(self, monkeypatch):
+        monkeypatch.setattr(db_utils, '_connection_pool', None)
+        with patch('common.db_utils.pool.ThreadedConnectionPool') as mock_cls, \
+             patch('common.db_utils.atexit.register') as mock_register:
+            self.mock_register = mock_register
+            yield mock_cls
+
+    def test_created_once_across_threads(self, mock_pool_class):
+        """Concurrent callers should share one thread-safe pool"""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pools = list(executor.map(lambda _: get_pool(), range(16)))
+
+        mock_pool_class.assert_called_once()
+        assert all(p is pools[0] for p in pools)
+        self.mock_register.assert_called_once_with(close_pool)
+
+    def test_close_resets_pool(self, mock_pool_class):
+        """Closing should release connections and let the next call reopen"""
+        first = get_pool()
+        close_pool()
+
+        first.closeall.assert_called_once()
+        assert db_utils._connection_pool is None
+        get_pool()
+        assert mock_pool_class.call_count == 2
+
+
+# ============================================================================
+# TEST _copy_field()
+# ============================================================================
+
+@pytest.mark.unit
+class TestCopyField:
+    """Tests for COPY text-format value rendering"""
+
+    @pytest.mark.parametrize('value, expected', [
+        (None, '\\N'),
+        ('plain', 'plain'),
+        ('', ''),
+        ('tab\there', 'tab\\there'),
+        ('line\nbreak\r', 'line\\nbreak\\r'),
+        ('back\\slash', 'back\\\\slash'),
+        ('\\N', '\\\\N'),
+        (True, 'true'),
+        (False, 'false'),
+        (42, '42'),
+        (5.31, '5.31'),
+        (Decimal('1.50'), '1.50'),
+        (date(2026, 1, 15), '2026-01-15'),
+        (datetime(2026, 1, 15, 9, 30), '2026-01-15 09:30:00'),
+        (b'\x01\xff', '\\\\x01ff'),
+    ])
+    def test_rendering(self, value, expected):
+        """Values should render as PostgreSQL COPY text input"""
+        assert _copy_field(value) == expected
+
+
+# ============================================================================
+# TEST _CopyStream
+# ============================================================================
+
+@pytest.mark.unit
+class TestCopyStream:
+    """Tests for the streaming COPY reader"""
+
+    def test_reads_all_rows_in_small_chunks(self):
+        """Chunked reads should reassemble into one line per row"""
+        rows = ((i, f'name {i}', None) for i in range(25))
+        stream = _CopyStream(rows, batch_size=4)
+
+        chunks = []
+        while True:
+            chunk = stream.read(7)
+            if not chunk:
+                break
+            assert len(chunk) <= 7
+            chunks.append(chunk)
+
+        lines = ''.join(chunks).split('\n')
+        assert lines[0] == '0\tname 0\t\\N'
+        assert lines[24] == '24\tname 24\t\\N'
+        assert lines[25] == ''
+        assert stream.row_count == 25
+
+    def test_read_all(self):
+        """read() with no size should return everything"""
+        stream = _CopyStream([(1, 'a'), (2, 'b')], batch_size=1)
+        assert stream.read() == '1\ta\n2\tb\n'
+        assert stream.read() == ''
+
+    def test_empty(self):
+        """No rows should read as EOF immediately"""
+        stream = _CopyStream([])
+        assert stream.read(8192) == ''
+        assert stream.row_count == 0
+
+
+# ============================================================================
+# TEST copy_insert()
+# ============================================================================
+
+@pytest.mark.unit
+class TestCopyInsert:
+    """Tests for copy_insert"""
+
+    def test_issues_copy_and_counts_rows(self):
+        """copy_insert should stream rows through copy_expert"""
+        cursor = MagicMock()
+        received = []
+        cursor.copy_expert.side_effect = lambda sql, f, size: received.append(f.read(size))
+
+        with patch('common.db_utils.db_transaction') as mock_tx:
+            mock_tx.return_value.__enter__.return_value = cursor
+            count = copy_insert('rates', ['datasetid', 'name'], iter([(1, 'SOFR'), (1, 'EFFR')]))
+
+        assert count == 2
+        sql = cursor.copy_expert.call_args.args[0]
+        assert sql == 'COPY feeds.rates (datasetid, name) FROM STDIN'
+        assert received == ['1\tSOFR\n1\tEFFR\n']
+        assert cursor.copy_expert.call_args.kwargs['size'] >= 64 * 1024
+
+
+# ============================================================================
+# TEST bulk_insert()
+# ============================================================================
+
+@pytest.mark.unit
+class TestBulkInsert:
+    """Tests for bulk_insert"""
+
+    def test_pages_by_configured_batch_size(self):
+        """execute_values should page by ETL batch size and all rows should be counted"""
+        values = [(i, f'row {i}') for i in range(2500)]
+
+        with patch('common.db_utils.db_transaction') as mock_tx, \
+                patch('common.db_utils.extras.execute_values') as mock_execute_values:
+            mock_tx.return_value.__enter__.return_value = MagicMock()
+            count = bulk_insert('rates', ['id', 'name'], values)
+
+        assert count == 2500
+        assert mock_execute_values.call_args.kwargs['page_size'] == 1000
+
+    def test_explicit_page_size(self):
+        """An explicit page_size should override the configured default"""
+        with patch('common.db_utils.db_transaction') as mock_tx, \
+                patch('common.db_utils.extras.execute_values') as mock_execute_values:
+            mock_tx.return_value.__enter__.return_value = MagicMock()
+            bulk_insert('rates', ['id'], [(1,)], page_size=5000)
+
+        assert mock_execute_values.call_args.kwargs['page_size'] == 5000
+
+    def test_empty_values(self):
+        """No values should skip the database entirely"""
+        with patch('common.db_utils.db_transaction') as mock_tx:
+            assert bulk_insert('rates', ['id'], []) == 0
+        mock_tx.assert_not_called()